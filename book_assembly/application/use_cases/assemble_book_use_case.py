@@ -1,5 +1,10 @@
-from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+from typing import List, Optional
+from book_assembly.domain.entities import MonthlyBook
+from book_assembly.domain.services.book_assembly_service import (
+    BOOK_STATUS_FINAL, BookAssemblyService,
+)
 from book_assembly.domain.ports.repository_ports import MonthlyBookRepositoryPort
+from content_pipeline.domain.entities import NewsEvent
 
 class AssembleBookUseCase:
     def __init__(
@@ -10,10 +15,35 @@ class AssembleBookUseCase:
         self.book_assembly_service = book_assembly_service
         self.monthly_book_repository = monthly_book_repository
 
-    def execute(self, year: int, month: int):
+    def execute(
+        self,
+        year: int,
+        month: int,
+        force: bool = False,
+        events: Optional[List[NewsEvent]] = None,
+    ) -> Optional[MonthlyBook]:
+        """Assembles and saves the month's book; returns None if the stored book is already up to date.
+
+        Only a final book can be up to date: a draft carries the fingerprint of
+        its inputs too, but still has to be assembled to be finalized.
+        events may carry a preload of the month's events to avoid re-reading them.
+        """
+        fingerprint = self.book_assembly_service.compute_fingerprint(year, month, events=events)
+
+        if not force:
+            existing_book = self.monthly_book_repository.get_book_for_month(year, month, load_entries=False)
+            if (
+                existing_book
+                and existing_book.status == BOOK_STATUS_FINAL
+                and existing_book.input_fingerprint == fingerprint
+            ):
+                return None
+
         # Assemble the book for the given month and year
-        monthly_book = self.book_assembly_service.assemble_book_for_month(year, month)
+        monthly_book = self.book_assembly_service.assemble_book_for_month(
+            year, month, fingerprint=fingerprint, events=events
+        )
 
         # Save the assembled book
         self.monthly_book_repository.save(monthly_book)
-        print(f"Assembled and saved book: {monthly_book.title}")
+        return monthly_book
@@ -0,0 +1,24 @@
+from book_assembly.domain.entities import MonthlyBook
+from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+from book_assembly.domain.ports.repository_ports import MonthlyBookRepositoryPort
+
+class UpdateDraftBookUseCase:
+    def __init__(
+        self,
+        book_assembly_service: BookAssemblyService,
+        monthly_book_repository: MonthlyBookRepositoryPort
+    ):
+        self.book_assembly_service = book_assembly_service
+        self.monthly_book_repository = monthly_book_repository
+
+    def execute(self, year: int, month: int, finalize: bool = False) -> MonthlyBook:
+        # Entries are only needed as ids; the service appends to them
+        existing_book = self.monthly_book_repository.get_book_for_month(year, month, load_entries=False)
+
+        if finalize:
+            monthly_book = self.book_assembly_service.finalize_book(existing_book, year, month)
+        else:
+            monthly_book = self.book_assembly_service.update_draft_book(existing_book, year, month)
+
+        self.monthly_book_repository.save(monthly_book)
+        return monthly_book
@@ -12,7 +12,12 @@ class MonthlyBook:
     cover_image_url: str
     id: uuid.UUID = field(default_factory=uuid.uuid4)
     daily_entries: List[NewsEvent] = field(default_factory=list)
+    # Ordered NewsEvent ids; set by streaming assembly instead of materializing daily_entries
+    daily_entry_ids: List[str] = field(default_factory=list)
     end_of_month_quiz: List[dict] = field(default_factory=list) # List of questions and answers
     parents_guide: str = ""
+    status: str = "FINAL" # DRAFT while the month is still being appended to
+    assembly_state: dict = field(default_factory=dict)
+    input_fingerprint: str = "" # Fingerprint of the events the book was assembled from
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
@@ -17,5 +17,6 @@ class MonthlyBookRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def get_book_for_month(self, year: int, month: int) -> Optional[MonthlyBook]:
+    def get_book_for_month(self, year: int, month: int, load_entries: bool = True) -> Optional[MonthlyBook]:
+        """Returns the month's book; with load_entries=False only daily_entry_ids are populated."""
         pass
@@ -1,63 +1,314 @@
-from typing import List
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional
+import hashlib
 import random
 from datetime import datetime
 from book_assembly.domain.entities import MonthlyBook
-from content_pipeline.domain.entities import NewsEvent
+from content_pipeline.domain.entities import NewsEvent, PUBLISHED_STATUSES
 from content_pipeline.domain.ports.repository_ports import NewsEventRepositoryPort
-from content_pipeline.domain.value_objects import Category
+from content_pipeline.domain.services.geography import select_geographically_diverse
+from content_pipeline.domain.value_objects import Category, EventStatistics
+
+QUIZ_EVENT_COUNT = 5
+# Quiz events are picked from a larger sample so they can span continents
+QUIZ_CANDIDATE_POOL = QUIZ_EVENT_COUNT * 4
+
+# Bump whenever quiz or guide generation changes so stored books are rebuilt
+GENERATOR_VERSION = "3"
+
+# Per-event version hashes are summed modulo this, so the month's fingerprint
+# can be updated event by event, in any order
+_VERSION_SUM_MODULUS = 1 << 256
+
+BOOK_STATUS_DRAFT = "DRAFT"
+BOOK_STATUS_FINAL = "FINAL"
 
 class BookAssemblyService:
     def __init__(self, news_event_repository: NewsEventRepositoryPort):
         self.news_event_repository = news_event_repository
 
-    def assemble_book_for_month(self, year: int, month: int) -> MonthlyBook:
-        if hasattr(self.news_event_repository, 'get_events_for_month'):
-            events_for_month = self.news_event_repository.get_events_for_month(year, month)
+    def compute_fingerprint(self, year: int, month: int, events: Optional[List[NewsEvent]] = None) -> str:
+        """
+        Fingerprint of the month's assembly inputs.
+
+        Covers the event ids and their updated_at values plus
+        GENERATOR_VERSION, so it changes whenever re-assembling could produce
+        a different book. It does not depend on the order events are read in,
+        which lets draft updates keep it current as events are applied.
+        """
+        if events is None:
+            versions = self.news_event_repository.iter_event_versions_for_month(
+                year, month, statuses=PUBLISHED_STATUSES
+            )
         else:
-            all_events = self.news_event_repository.get_events_for_processing()
-            events_for_month = [
-                event for event in all_events
-                if event.published_at.year == year and event.published_at.month == month
-            ]
+            versions = ((event.id, event.updated_at) for event in events)
+
+        version_sum = sum(
+            self._version_hash(event_id, self._isoformat(updated_at))
+            for event_id, updated_at in versions
+        )
+        return self._fingerprint(year, month, version_sum)
+
+    def assemble_book_for_month(
+        self,
+        year: int,
+        month: int,
+        fingerprint: Optional[str] = None,
+        events: Optional[List[NewsEvent]] = None,
+    ) -> MonthlyBook:
+        """
+        Assemble the month's book from scratch.
+
+        Events are streamed from the repository unless a preloaded list of the
+        month's published events (as returned by iter_events_in_range) is passed, in which
+        case no queries are made.
+        """
+        # Single pass over the month's events keeping only ids, versions and
+        # the quiz candidates, so memory stays flat.
+        event_ids = []
+        versions = {}
+        quiz_candidates: List[str] = []
+        watermark = None
+
+        if events is None:
+            month_events = self.news_event_repository.iter_events_for_month(
+                year, month, statuses=PUBLISHED_STATUSES
+            )
+            # Guide statistics are aggregated by the repository
+            statistics = self.news_event_repository.get_month_statistics(
+                year, month, statuses=PUBLISHED_STATUSES
+            )
+        else:
+            month_events = events
+            statistics = EventStatistics()
+
+        for event in month_events:
+            event_ids.append(event.id)
+            versions[event.id] = self._event_version(event)
+            self._offer_quiz_candidate(quiz_candidates, event.id)
+            watermark = self._later(watermark, event.updated_at)
+            if events is not None:
+                statistics.add(event)
+
+        version_sum = sum(
+            self._version_hash(event_id, version[0]) for event_id, version in versions.items()
+        )
+        fingerprint = fingerprint or self._fingerprint(year, month, version_sum)
+        return self._build_book(
+            year, month, event_ids, statistics, quiz_candidates, watermark, versions, version_sum,
+            seed=fingerprint, input_fingerprint=fingerprint,
+            preloaded={event.id: event for event in events} if events is not None else None,
+        )
+
+    def update_draft_book(self, book: Optional[MonthlyBook], year: int, month: int) -> MonthlyBook:
+        """
+        Apply events saved since the last update to the month's draft book.
+
+        Only events at or after the stored watermark are read, so each update
+        costs O(new events). The statistics and fingerprint are kept in the
+        assembly state as events are applied. Re-saving an event already in
+        the book only updates its version, unless it has left
+        PUBLISHED_STATUSES or the fields the statistics count have changed:
+        a contribution to the statistics can't be subtracted, so those months
+        are rebuilt with a full pass. So is a month without assembly state (no
+        book yet, or one assembled before incremental mode).
+        """
+        state = book.assembly_state if book else {}
+        if not state or 'versions' not in state:
+            return self._rebuild_draft(book, year, month)
+
+        event_ids = list(book.daily_entry_ids)
+        versions = dict(state['versions'])
+        version_sum = int(state['version_sum'], 16)
+        statistics = EventStatistics.from_dict(state.get('statistics'))
+        quiz_candidates = list(state.get('quiz_candidates', []))
+        quiz_stale = False
+        watermark = datetime.fromisoformat(state['watermark']) if state.get('watermark') else None
+
+        # All statuses, so that events rejected or unpublished after inclusion are seen
+        month_events = self.news_event_repository.iter_events_for_month(
+            year, month, updated_after=watermark
+        )
+        for event in month_events:
+            watermark = self._later(watermark, event.updated_at)
+            published = event.processing_status in PUBLISHED_STATUSES
+            version = self._event_version(event)
+            applied = versions.get(event.id)
+            if applied is not None:
+                # Events saved exactly at the watermark were already applied
+                if applied == version:
+                    continue
+                if not published or applied[1] != version[1]:
+                    return self._rebuild_draft(book, year, month)
+                version_sum += self._version_hash(event.id, version[0])
+                version_sum -= self._version_hash(event.id, applied[0])
+                versions[event.id] = version
+                quiz_stale = quiz_stale or event.id in quiz_candidates
+                continue
+            if not published:
+                continue
+            event_ids.append(event.id)
+            versions[event.id] = version
+            version_sum += self._version_hash(event.id, version[0])
+            statistics.add(event)
+            self._offer_quiz_candidate(quiz_candidates, event.id)
+
+        # Keep the existing quiz unless a quiz event was saved or the candidate set changed
+        keep_quiz = not quiz_stale and quiz_candidates == state.get('quiz_candidates')
+
+        return self._build_book(
+            year, month, event_ids, statistics, quiz_candidates, watermark, versions, version_sum,
+            seed=",".join(quiz_candidates), status=BOOK_STATUS_DRAFT, book_id=book.id,
+            quiz=book.end_of_month_quiz if keep_quiz else None,
+            input_fingerprint=self._fingerprint(year, month, version_sum),
+        )
+
+    def _rebuild_draft(self, book: Optional[MonthlyBook], year: int, month: int) -> MonthlyBook:
+        draft = replace(self.assemble_book_for_month(year, month), status=BOOK_STATUS_DRAFT)
+        if book is not None:
+            draft.id = book.id
+        return draft
+
+    def finalize_book(self, book: Optional[MonthlyBook], year: int, month: int) -> MonthlyBook:
+        """
+        Apply any remaining events to the month's draft and mark it final.
+
+        The draft's statistics, guide and fingerprint are already current;
+        only the quiz is regenerated, with the fingerprint seed, so the final
+        book matches what assemble_book_for_month would produce for the same
+        inputs.
+        """
+        draft = self.update_draft_book(book, year, month)
+        return replace(
+            draft,
+            status=BOOK_STATUS_FINAL,
+            end_of_month_quiz=self._generate_quiz(
+                self._load_quiz_events(draft.assembly_state['quiz_candidates']),
+                random.Random(draft.input_fingerprint),
+            ),
+        )
+
+    def _build_book(
+        self,
+        year: int,
+        month: int,
+        event_ids: List[str],
+        statistics: EventStatistics,
+        quiz_candidates: List[str],
+        watermark: Optional[datetime],
+        versions: Dict[str, List[str]],
+        version_sum: int,
+        seed: str,
+        status: str = BOOK_STATUS_FINAL,
+        book_id=None,
+        quiz: Optional[List[dict]] = None,
+        input_fingerprint: str = "",
+        preloaded: Optional[dict] = None,
+    ) -> MonthlyBook:
+        if quiz is None:
+            # Seeded so the same inputs always yield the same quiz
+            quiz = self._generate_quiz(self._load_quiz_events(quiz_candidates, preloaded), random.Random(seed))
 
-        # Create a MonthlyBook
         monthly_book = MonthlyBook(
             month=month,
             year=year,
             title=f"Book of the Month: {datetime(year, month, 1).strftime('%B %Y')}",
             cover_image_url=f"https://picsum.photos/seed/{year}-{month}/800/600",
-            daily_entries=events_for_month,
-            end_of_month_quiz=self._generate_quiz(events_for_month),
-            parents_guide=self._generate_parents_guide(events_for_month)
+            daily_entry_ids=event_ids,
+            end_of_month_quiz=quiz,
+            parents_guide=self._generate_parents_guide(statistics),
+            status=status,
+            input_fingerprint=input_fingerprint,
+            assembly_state={
+                'statistics': statistics.to_dict(),
+                'quiz_candidates': quiz_candidates,
+                'watermark': watermark.isoformat() if watermark else None,
+                # event id -> [updated_at, digest of the fields the statistics count]
+                'versions': versions,
+                'version_sum': f"{version_sum % _VERSION_SUM_MODULUS:x}",
+            },
         )
+        if book_id is not None:
+            monthly_book.id = book_id
         return monthly_book
 
-    def _generate_quiz(self, events: List[NewsEvent]) -> List[dict]:
-        """Generate meaningful quiz questions based on news events."""
-        if not events:
+    @staticmethod
+    def _isoformat(value: Optional[datetime]) -> str:
+        return value.isoformat() if value else ''
+
+    @staticmethod
+    def _version_hash(event_id: str, updated_at: str) -> int:
+        return int(hashlib.sha256(f"{event_id}|{updated_at}".encode()).hexdigest(), 16)
+
+    @staticmethod
+    def _fingerprint(year: int, month: int, version_sum: int) -> str:
+        key = f"v{GENERATOR_VERSION}:{year}-{month}:{version_sum % _VERSION_SUM_MODULUS:064x}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _event_version(self, event: NewsEvent) -> List[str]:
+        """The event's updated_at and a digest of the fields EventStatistics counts."""
+        counted = "|".join([
+            ",".join(sorted(category.name for category in event.categories)),
+            ",".join(sorted(str(location.country) for location in event.geographic_locations)),
+            event.age_appropriateness.name if event.age_appropriateness else "",
+        ])
+        return [self._isoformat(event.updated_at), hashlib.sha1(counted.encode()).hexdigest()[:16]]
+
+    def _load_quiz_events(self, quiz_candidates: List[str], preloaded: Optional[dict] = None) -> List[NewsEvent]:
+        """The QUIZ_EVENT_COUNT candidates to quiz on, spread across continents."""
+        if preloaded is not None:
+            quiz_events = [preloaded.get(event_id) for event_id in quiz_candidates]
+        else:
+            quiz_events = self.news_event_repository.get_by_ids(quiz_candidates)
+        return select_geographically_diverse([event for event in quiz_events if event is not None], QUIZ_EVENT_COUNT)
+
+    @staticmethod
+    def _quiz_candidate_key(event_id: str) -> int:
+        return int(hashlib.sha1(event_id.encode()).hexdigest()[:16], 16)
+
+    def _offer_quiz_candidate(self, candidates: List[str], event_id: str) -> None:
+        """
+        Keep the QUIZ_CANDIDATE_POOL event ids with the smallest hash.
+
+        A bottom-k sample is a uniform sample that does not depend on the order
+        events arrive in, so daily appends pick the same quiz events as a full
+        rebuild of the month.
+        """
+        if event_id in candidates:
+            return
+        candidates.append(event_id)
+        candidates.sort(key=self._quiz_candidate_key)
+        del candidates[QUIZ_CANDIDATE_POOL:]
+
+    @staticmethod
+    def _later(current: Optional[datetime], candidate: Optional[datetime]) -> Optional[datetime]:
+        if candidate is None:
+            return current
+        return candidate if current is None or candidate > current else current
+
+    def _generate_quiz(self, quiz_events: List[NewsEvent], rng: random.Random) -> List[dict]:
+        """Generate meaningful quiz questions based on the sampled news events."""
+        if not quiz_events:
             return []
         
         quiz_questions = []
         
-        # Select diverse events for quiz
-        quiz_events = random.sample(events, min(5, len(events)))
-        
         for event in quiz_events:
             question_types = [
-                self._create_topic_question(event),
-                self._create_fact_question(event),
-                self._create_category_question(event),
-                self._create_location_question(event)
+                self._create_topic_question(event, rng),
+                self._create_fact_question(event, rng),
+                self._create_category_question(event, rng),
+                self._create_location_question(event, rng)
             ]
             
             # Choose random question type
-            question = random.choice([q for q in question_types if q])
+            question = rng.choice([q for q in question_types if q])
             if question:
                 quiz_questions.append(question)
         
         return quiz_questions[:10]  # Max 10 questions
     
-    def _create_topic_question(self, event: NewsEvent) -> dict:
+    def _create_topic_question(self, event: NewsEvent, rng: random.Random) -> dict:
         """Create a question about the main topic/event."""
         options = [event.title]
         
@@ -78,7 +329,7 @@ class BookAssemblyService:
         else:
             options.extend(["Breaking News", "Latest Update", "New Discovery"])
         
-        random.shuffle(options)
+        rng.shuffle(options)
         
         return {
             "question": f"What was the main topic of the news event on {event.published_at.strftime('%B %d')}?",
@@ -87,12 +338,12 @@ class BookAssemblyService:
             "type": "multiple_choice"
         }
     
-    def _create_fact_question(self, event: NewsEvent) -> dict:
+    def _create_fact_question(self, event: NewsEvent, rng: random.Random) -> dict:
         """Create a question based on extracted facts."""
         if not event.extracted_facts:
             return None
         
-        fact = random.choice(event.extracted_facts)
+        fact = rng.choice(event.extracted_facts)
         question_text = f"According to the news about {event.title[:30]}..."
         
         return {
@@ -102,7 +353,7 @@ class BookAssemblyService:
             "type": "fact_based"
         }
     
-    def _create_category_question(self, event: NewsEvent) -> dict:
+    def _create_category_question(self, event: NewsEvent, rng: random.Random) -> dict:
         """Create a question about the event category."""
         if not event.categories:
             return None
@@ -110,7 +361,7 @@ class BookAssemblyService:
         category = event.categories[0]
         all_categories = [cat.value for cat in Category]
         distractors = [cat for cat in all_categories if cat != category.value]
-        random.shuffle(distractors)
+        rng.shuffle(distractors)
         
         return {
             "question": f"Which category does the news event '{event.title[:40]}...' belong to?",
@@ -119,7 +370,7 @@ class BookAssemblyService:
             "type": "category"
         }
     
-    def _create_location_question(self, event: NewsEvent) -> dict:
+    def _create_location_question(self, event: NewsEvent, rng: random.Random) -> dict:
         """Create a question about geographic location."""
         if not event.geographic_locations:
             return None
@@ -128,7 +379,7 @@ class BookAssemblyService:
         locations = [location.country, location.city or location.country]
         other_locations = ["United States", "United Kingdom", "Canada", "Australia", "Germany", "France"]
         distractors = [loc for loc in other_locations if loc not in locations]
-        random.shuffle(distractors)
+        rng.shuffle(distractors)
         
         return {
             "question": f"Where did the news event '{event.title[:30]}...' take place?",
@@ -137,32 +388,29 @@ class BookAssemblyService:
             "type": "geography"
         }
 
-    def _generate_parents_guide(self, events: List[NewsEvent]) -> str:
+    @staticmethod
+    def _ranked_categories(statistics: EventStatistics) -> List[tuple]:
+        """(category, count) pairs, most frequent first and ties by name, in any order of adding."""
+        return sorted(statistics.category_counts.items(), key=lambda item: (-item[1], item[0].name))
+
+    def _generate_parents_guide(self, statistics: EventStatistics) -> str:
         """Generate a comprehensive parent's guide."""
-        if not events:
+        if not statistics.event_count:
             return "No content available for this month's book."
         
         # Analyze content themes
-        categories_count = {}
-        locations = set()
-        age_ranges = set()
-        
-        for event in events:
-            for category in event.categories:
-                categories_count[category.value] = categories_count.get(category.value, 0) + 1
-            
-            for location in event.geographic_locations:
-                locations.add(location.country)
-            
-            if event.age_appropriateness:
-                age_ranges.add(event.age_appropriateness.value)
+        categories_count = {
+            category.value: count for category, count in self._ranked_categories(statistics)
+        }
+        locations = statistics.countries
+        age_ranges = {age_range.value for age_range in statistics.age_ranges}
         
         # Generate guide sections
         guide_sections = []
         
         # Main themes
         if categories_count:
-            main_categories = sorted(categories_count.items(), key=lambda x: x[1], reverse=True)[:3]
+            main_categories = list(categories_count.items())[:3]
             themes_text = ", ".join([cat for cat, count in main_categories])
             guide_sections.append(f"**Main Topics**: {themes_text}")
         
@@ -177,7 +425,7 @@ class BookAssemblyService:
             guide_sections.append(f"**Age Level**: Content is appropriate for ages {age_text}")
         
         # Discussion questions
-        discussion_questions = self._generate_discussion_questions(events)
+        discussion_questions = self._generate_discussion_questions(statistics)
         if discussion_questions:
             guide_sections.append("**Discussion Questions:**")
             for i, question in enumerate(discussion_questions, 1):
@@ -195,11 +443,11 @@ class BookAssemblyService:
         
         return "\n\n".join(guide_sections)
     
-    def _generate_discussion_questions(self, events: List[NewsEvent]) -> List[str]:
+    def _generate_discussion_questions(self, statistics: EventStatistics) -> List[str]:
         """Generate discussion questions for parents and children."""
         questions = []
         
-        if not events:
+        if not statistics.event_count:
             return questions
         
         # General questions
@@ -211,9 +459,7 @@ class BookAssemblyService:
         ])
         
         # Category-specific questions
-        categories = set()
-        for event in events:
-            categories.update(event.categories)
+        categories = [category for category, _ in self._ranked_categories(statistics)]
         
         category_questions = {
             Category.SCIENCE_DISCOVERY: "What scientific discovery could help solve a problem you've noticed?",
@@ -231,7 +477,7 @@ class BookAssemblyService:
         
         return questions[:6]  # Limit to 6 questions
     
-    def _generate_learning_activities(self, categories) -> List[str]:
+    def _generate_learning_activities(self, categories: Iterable[str]) -> List[str]:
         """Generate learning activities based on content categories."""
         activities = []
         
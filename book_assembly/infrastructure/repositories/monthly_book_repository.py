@@ -9,17 +9,23 @@ class DjangoMonthlyBookRepository(MonthlyBookRepositoryPort):
     def __init__(self):
         self.news_event_repo = DjangoNewsEventRepository()
 
-    def _to_domain_entity(self, model: MonthlyBookModel) -> MonthlyBook:
-        daily_entries = [self.news_event_repo.get_by_id(event_id) for event_id in model.daily_entries]
+    def _to_domain_entity(self, model: MonthlyBookModel, load_entries: bool = True) -> MonthlyBook:
+        daily_entries = []
+        if load_entries:
+            daily_entries = self.news_event_repo.get_by_ids(model.daily_entries)
         return MonthlyBook(
             id=model.id,
             month=model.month,
             year=model.year,
             title=model.title,
             cover_image_url=model.cover_image_url,
-            daily_entries=[entry for entry in daily_entries if entry is not None],
+            daily_entries=daily_entries,
+            daily_entry_ids=[str(event_id) for event_id in model.daily_entries],
             end_of_month_quiz=model.end_of_month_quiz,
             parents_guide=model.parents_guide,
+            status=model.status,
+            assembly_state=model.assembly_state or {},
+            input_fingerprint=model.input_fingerprint,
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -37,9 +43,15 @@ class DjangoMonthlyBookRepository(MonthlyBookRepositoryPort):
         model.year = entity.year
         model.title = entity.title
         model.cover_image_url = entity.cover_image_url
-        model.daily_entries = [str(entry.id) for entry in entity.daily_entries]
+        if entity.daily_entry_ids:
+            model.daily_entries = list(entity.daily_entry_ids)
+        else:
+            model.daily_entries = [str(entry.id) for entry in entity.daily_entries]
         model.end_of_month_quiz = entity.end_of_month_quiz
         model.parents_guide = entity.parents_guide
+        model.status = entity.status
+        model.assembly_state = entity.assembly_state
+        model.input_fingerprint = entity.input_fingerprint
         return model
 
     def get_by_id(self, book_id: uuid.UUID) -> Optional[MonthlyBook]:
@@ -57,9 +69,9 @@ class DjangoMonthlyBookRepository(MonthlyBookRepositoryPort):
         models = MonthlyBookModel.objects.filter(year=year)
         return [self._to_domain_entity(model) for model in models]
 
-    def get_book_for_month(self, year: int, month: int) -> Optional[MonthlyBook]:
+    def get_book_for_month(self, year: int, month: int, load_entries: bool = True) -> Optional[MonthlyBook]:
         try:
             model = MonthlyBookModel.objects.get(year=year, month=month)
-            return self._to_domain_entity(model)
+            return self._to_domain_entity(model, load_entries=load_entries)
         except MonthlyBookModel.DoesNotExist:
             return None
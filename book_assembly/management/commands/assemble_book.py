@@ -22,6 +22,11 @@ class Command(BaseCommand):
             help='Month of the book to assemble.',
             default=datetime.now().month,
         )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rebuild the book even if its events are unchanged.',
+        )
 
     def handle(self, *args, **options):
         self.stdout.write("Starting book assembly process...")
@@ -42,6 +47,10 @@ class Command(BaseCommand):
             monthly_book_repository=monthly_book_repository
         )
 
-        assemble_use_case.execute(year=year, month=month)
+        monthly_book = assemble_use_case.execute(year=year, month=month, force=options['force'])
+
+        if monthly_book is None:
+            self.stdout.write(f'Book for {month}/{year} is up to date, skipping (use --force to rebuild).')
+            return
 
         self.stdout.write(self.style.SUCCESS(f'Book for {month}/{year} assembled successfully!'))
@@ -0,0 +1,143 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from book_assembly.infrastructure.repositories.monthly_book_repository import DjangoMonthlyBookRepository
+from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+from book_assembly.application.use_cases.assemble_book_use_case import AssembleBookUseCase
+from content_pipeline.domain.entities import PUBLISHED_STATUSES
+from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+
+def parse_month(value):
+    try:
+        parsed = datetime.strptime(value, '%Y-%m')
+    except ValueError:
+        raise CommandError(f"Invalid month '{value}', expected YYYY-MM.")
+    return parsed.year, parsed.month
+
+
+def iter_months(start, end):
+    year, month = start
+    while (year, month) <= end:
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _init_worker():
+    # Each worker opens its own database connections
+    import django
+    django.setup()
+    connections.close_all()
+
+
+def _assemble_month(year, month, force):
+    """Assemble one month and report the outcome.
+
+    The month's events are read here, in the worker, with one streaming query,
+    so the parent never holds or pickles the whole range.
+    """
+    started = time.monotonic()
+    result = {'year': year, 'month': month, 'events': 0}
+    try:
+        news_event_repository = DjangoNewsEventRepository()
+        events = list(news_event_repository.iter_events_for_month(year, month, statuses=PUBLISHED_STATUSES))
+        result['events'] = len(events)
+        use_case = AssembleBookUseCase(
+            book_assembly_service=BookAssemblyService(news_event_repository=news_event_repository),
+            monthly_book_repository=DjangoMonthlyBookRepository(),
+        )
+        monthly_book = use_case.execute(year=year, month=month, force=force, events=events)
+        result['status'] = 'skipped' if monthly_book is None else 'assembled'
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+    result['seconds'] = time.monotonic() - started
+    return result
+
+
+class Command(BaseCommand):
+    help = 'Assembles monthly books for a range of months in parallel.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--from',
+            dest='start',
+            required=True,
+            help='First month to assemble (YYYY-MM).',
+        )
+        parser.add_argument(
+            '--to',
+            dest='end',
+            required=True,
+            help='Last month to assemble, inclusive (YYYY-MM).',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes (1 assembles inline).',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rebuild books even if their events are unchanged.',
+        )
+
+    def handle(self, *args, **options):
+        start = parse_month(options['start'])
+        end = parse_month(options['end'])
+        if end < start:
+            raise CommandError('--to must not be earlier than --from.')
+        workers = max(1, options['workers'])
+        months = list(iter_months(start, end))
+
+        started = time.monotonic()
+        results = []
+        if workers == 1:
+            for year, month in months:
+                results.append(self._report(_assemble_month(year, month, options['force'])))
+        else:
+            # Forked workers must not share the parent's database sockets
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = {
+                    executor.submit(_assemble_month, year, month, options['force']): (year, month)
+                    for year, month in months
+                }
+                for future in as_completed(futures):
+                    results.append(self._report(self._result(future, *futures[future])))
+
+        counts = {status: sum(1 for r in results if r['status'] == status) for status in ('assembled', 'skipped', 'failed')}
+        summary = (
+            f"{counts['assembled']} assembled, {counts['skipped']} skipped, {counts['failed']} failed "
+            f"in {time.monotonic() - started:.2f}s with {workers} worker(s)"
+        )
+        if counts['failed']:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary))
+
+    @staticmethod
+    def _result(future, year, month):
+        """The month's result, or a failure if its worker crashed (e.g. BrokenProcessPool)."""
+        try:
+            return future.result()
+        except Exception as e:
+            return {
+                'year': year, 'month': month, 'events': 0, 'seconds': 0.0,
+                'status': 'failed', 'error': f"{type(e).__name__}: {e}",
+            }
+
+    def _report(self, result):
+        line = (
+            f"{result['year']}-{result['month']:02d}  {result['status']:<9}  "
+            f"{result['events']} events  {result['seconds']:.2f}s"
+        )
+        if result['status'] == 'failed':
+            self.stderr.write(self.style.ERROR(f"{line}  {result['error']}"))
+        else:
+            self.stdout.write(line)
+        return result
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("book_assembly", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="monthlybookmodel",
+            name="assembly_state",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="monthlybookmodel",
+            name="status",
+            field=models.CharField(
+                choices=[("DRAFT", "Draft"), ("FINAL", "Final")], default="FINAL", max_length=10
+            ),
+        ),
+    ]
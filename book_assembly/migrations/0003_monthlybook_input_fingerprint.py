@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("book_assembly", "0002_monthlybook_incremental_assembly"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="monthlybookmodel",
+            name="input_fingerprint",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
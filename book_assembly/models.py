@@ -2,6 +2,13 @@ from django.db import models
 import uuid
 
 class MonthlyBookModel(models.Model):
+    STATUS_DRAFT = 'DRAFT'
+    STATUS_FINAL = 'FINAL'
+    STATUS_CHOICES = [
+        (STATUS_DRAFT, 'Draft'),
+        (STATUS_FINAL, 'Final'),
+    ]
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     month = models.IntegerField()
     year = models.IntegerField()
@@ -11,6 +18,11 @@ class MonthlyBookModel(models.Model):
     daily_entries = models.JSONField(default=list)
     end_of_month_quiz = models.JSONField(default=list)
     parents_guide = models.TextField(blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_FINAL)
+    # Running statistics, quiz candidates and watermark for incremental assembly
+    assembly_state = models.JSONField(default=dict, blank=True)
+    # Fingerprint of the assembly inputs; unchanged months are not rebuilt
+    input_fingerprint = models.CharField(max_length=64, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
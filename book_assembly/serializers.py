@@ -4,11 +4,37 @@ from content_pipeline.models import NewsEventModel
 from content_pipeline.serializers import ContentPipelineDailyEntrySerializer
 
 
+DAILY_ENTRY_FIELDS = ContentPipelineDailyEntrySerializer.Meta.fields
+
+
+def load_daily_entries(event_ids):
+    """Maps str(id) to NewsEventModel for the given daily entry ids, in one query."""
+    news_events = NewsEventModel.objects.filter(id__in=list(event_ids)).only(*DAILY_ENTRY_FIELDS)
+    return {str(event.id): event for event in news_events}
+
+
+class MonthlyBookListSerializer(serializers.ListSerializer):
+    """Loads the daily entries of all listed books in one query instead of one per book."""
+
+    def to_representation(self, data):
+        books = list(data.all() if hasattr(data, 'all') else data)
+        self.child.news_events = load_daily_entries(
+            {str(event_id) for book in books for event_id in book.daily_entries}
+        )
+        try:
+            return super().to_representation(books)
+        finally:
+            self.child.news_events = None
+
+
 class MonthlyBookSerializer(serializers.ModelSerializer):
     daily_entries = serializers.SerializerMethodField()
+    # Set by MonthlyBookListSerializer while a page of books is serialized
+    news_events = None
 
     class Meta:
         model = MonthlyBookModel
+        list_serializer_class = MonthlyBookListSerializer
         fields = (
             'id',
             'month',
@@ -18,21 +44,22 @@ class MonthlyBookSerializer(serializers.ModelSerializer):
             'daily_entries',
             'end_of_month_quiz',
             'parents_guide',
+            'status',
             'created_at',
             'updated_at',
         )
         read_only_fields = (
             'id',
+            'status',
             'created_at',
             'updated_at',
         )
 
     def get_daily_entries(self, obj):
         daily_entries_ids = obj.daily_entries
-        # Fetch all NewsEventModel objects in a single query
-        news_events = NewsEventModel.objects.filter(id__in=daily_entries_ids)
-        # Create a dictionary for quick lookups
-        news_events_dict = {str(event.id): event for event in news_events}
+        news_events_dict = self.news_events
+        if news_events_dict is None:
+            news_events_dict = load_daily_entries(daily_entries_ids)
         # Preserve the order of IDs from the original list
         ordered_news_events = [news_events_dict[str(id)] for id in daily_entries_ids if str(id) in news_events_dict]
         return ContentPipelineDailyEntrySerializer(ordered_news_events, many=True).data
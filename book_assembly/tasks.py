@@ -0,0 +1,41 @@
+# Background Tasks for django-q2
+#
+# Book assembly tasks, run after daily ingestion and at month end.
+# Use `async_task('book_assembly.tasks.function_name', ...)` to queue them.
+
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+def _update_book_use_case():
+    from book_assembly.application.use_cases.update_draft_book_use_case import UpdateDraftBookUseCase
+    from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+    from book_assembly.infrastructure.repositories.monthly_book_repository import DjangoMonthlyBookRepository
+    from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+    return UpdateDraftBookUseCase(
+        book_assembly_service=BookAssemblyService(news_event_repository=DjangoNewsEventRepository()),
+        monthly_book_repository=DjangoMonthlyBookRepository(),
+    )
+
+
+def update_draft_book(year=None, month=None):
+    """Append newly processed events to the draft book for a month (defaults to the current month)."""
+    if year is None or month is None:
+        today = datetime.now()
+        year, month = today.year, today.month
+
+    book = _update_book_use_case().execute(year=year, month=month)
+
+    logger.info("Draft book for %d/%d updated: %d entries", month, year, len(book.daily_entry_ids))
+    return f"Draft book for {month}/{year} updated with {len(book.daily_entry_ids)} entries"
+
+
+def finalize_book(year, month):
+    """Apply any remaining events to a month's draft book and mark it final."""
+    book = _update_book_use_case().execute(year=year, month=month, finalize=True)
+
+    logger.info("Book for %d/%d finalized: %d entries", month, year, len(book.daily_entry_ids))
+    return f"Book for {month}/{year} finalized with {len(book.daily_entry_ids)} entries"
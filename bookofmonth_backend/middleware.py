@@ -92,3 +92,25 @@ class RequestLoggingMiddleware:
             )
 
         return response
+
+
+class NPlusOneMiddleware:
+    """
+    Middleware reporting N+1 queries per request when N_PLUS_ONE_DETECTION
+    is 'log' (e.g. on staging) or 'raise' (tests). Off by default.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = getattr(settings, 'N_PLUS_ONE_DETECTION', '')
+        if mode not in ('log', 'raise'):
+            return self.get_response(request)
+
+        from .query_inspection import NPlusOneDetector
+
+        with NPlusOneDetector(threshold=getattr(settings, 'N_PLUS_ONE_THRESHOLD', 2)) as detector:
+            response = self.get_response(request)
+        detector.report(f"{request.method} {request.path}", mode=mode)
+        return response
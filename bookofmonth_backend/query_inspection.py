@@ -0,0 +1,161 @@
+"""
+N+1 query detection for tests and staging.
+
+NPlusOneDetector watches the queries run on a connection, typically for the
+length of one request, and reports SELECTs that repeat with the same
+fingerprint more often than a threshold. Each detection names the lazily
+loaded relation behind it (e.g. Bookmark.news_event), the serializer field
+that triggered it and the application stack of its first repeat.
+"""
+import logging
+import os
+import re
+import sys
+import traceback
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+
+
+class NPlusOneError(Exception):
+    """Raised when a request runs the same SELECT too many times."""
+
+
+def fingerprint(sql):
+    """Normalize SQL so that queries differing only in parameters compare equal."""
+    return ' '.join(_IN_LIST.sub('IN (...)', sql).split())
+
+
+@dataclass
+class Detection:
+    fingerprint: str
+    count: int
+    lazy_load: str = None
+    serializer_field: str = None
+    stack: list = field(default_factory=list)
+
+    def describe(self):
+        source = '; '.join(filter(None, [
+            f"lazy load of {self.lazy_load}" if self.lazy_load else None,
+            f"serializer field {self.serializer_field}" if self.serializer_field else None,
+        ]))
+        lines = [f"{self.count} x {source or 'repeated query'}", f"    {self.fingerprint[:300]}"]
+        lines.extend(f"    {line}" for line in self.stack)
+        return '\n'.join(lines)
+
+
+def _lazy_load(frames):
+    """Name the relation being loaded by a related descriptor or manager, if any."""
+    for frame in frames:
+        if not frame.f_code.co_filename.endswith(os.path.join('fields', 'related_descriptors.py')):
+            continue
+        owner = frame.f_locals.get('self')
+        relation = getattr(owner, 'field', None)
+        if relation is None and hasattr(owner, 'related'):
+            # Reverse one-to-one descriptor
+            relation = owner.related.field.remote_field
+        if relation is None:
+            continue
+        if type(owner).__name__.endswith('Descriptor'):
+            return f"{relation.model.__name__}.{relation.name}"
+        # A related manager: name the accessor on the instance it was reached from
+        remote = relation.remote_field
+        return f"{remote.model.__name__}.{remote.get_accessor_name() or relation.name}"
+    return None
+
+
+def _serializer_field(frames):
+    """Name the innermost serializer field being represented, if any."""
+    from rest_framework.fields import Field
+
+    for frame in frames:
+        owner = frame.f_locals.get('self')
+        if isinstance(owner, Field) and owner.field_name and owner.parent is not None:
+            return f"{type(owner.parent).__name__}.{owner.field_name}"
+    return None
+
+
+def _application_stack(frames, limit=8):
+    """Format the innermost frames of project code, leaving out this module."""
+    root = str(settings.BASE_DIR) + os.sep
+    summary = [
+        frame for frame in frames
+        if frame.f_code.co_filename.startswith(root)
+        and frame.f_code.co_filename != __file__
+        and 'site-packages' not in frame.f_code.co_filename
+    ][:limit]
+    return [
+        f"{entry.filename}:{entry.lineno} in {entry.name}: {entry.line}"
+        for entry in traceback.StackSummary.extract((frame, frame.f_lineno) for frame in summary)
+    ]
+
+
+class NPlusOneDetector:
+    """
+    Context manager reporting SELECTs repeated more than `threshold` times.
+
+    Usage:
+        with NPlusOneDetector() as detector:
+            ...
+        detector.detections  # one Detection per repeated fingerprint
+    """
+
+    def __init__(self, threshold=2, using=connection):
+        self.threshold = threshold
+        self.connection = using
+        self.counts = {}
+        self.found = {}
+        self._wrapper = None
+
+    @property
+    def detections(self):
+        for fp, detection in self.found.items():
+            detection.count = self.counts[fp]
+        return list(self.found.values())
+
+    def __enter__(self):
+        self._wrapper = self.connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._wrapper.__exit__(*exc_info)
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip()[:6].upper() == 'SELECT':
+            fp = fingerprint(sql)
+            count = self.counts[fp] = self.counts.get(fp, 0) + 1
+            if count == self.threshold + 1:
+                self.found[fp] = self._inspect(fp)
+        return execute(sql, params, many, context)
+
+    def _inspect(self, fp):
+        frames = []
+        frame = sys._getframe(2)
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        return Detection(
+            fingerprint=fp,
+            count=self.counts[fp],
+            lazy_load=_lazy_load(frames),
+            serializer_field=_serializer_field(frames),
+            stack=_application_stack(frames),
+        )
+
+    def report(self, label='', mode='raise'):
+        """Log every detection, or raise NPlusOneError when mode is 'raise'."""
+        detections = self.detections
+        if not detections:
+            return
+        message = f"N+1 queries{f' in {label}' if label else ''}:\n" + '\n'.join(
+            detection.describe() for detection in detections
+        )
+        if mode == 'raise':
+            raise NPlusOneError(message)
+        logger.warning(message)
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import json
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -60,6 +61,7 @@ INSTALLED_APPS = [
     'django_q',
     'django_otp',
     'django_otp.plugins.otp_totp',
+    'django_prometheus',
     'content_pipeline',
     'book_assembly',
     'users',
@@ -77,6 +79,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'bookofmonth_backend.middleware.ContentSecurityPolicyMiddleware',
+    'bookofmonth_backend.middleware.NPlusOneMiddleware',
 ]
 
 ROOT_URLCONF = 'bookofmonth_backend.urls'
@@ -205,8 +208,8 @@ REST_FRAMEWORK = {
         'rest_framework.throttling.UserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
-        'anon': '100/hour',
-        'user': '1000/hour',
+        'anon': os.environ.get('THROTTLE_ANON_RATE', '100/hour'),
+        'user': os.environ.get('THROTTLE_USER_RATE', '1000/hour'),
     },
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -287,6 +290,59 @@ Q_CLUSTER = {
     },
 }
 
+# Maintenance - batched deletes keep lock times short (see users/maintenance.py)
+MAINTENANCE_BATCH_SIZE = int(os.environ.get('MAINTENANCE_BATCH_SIZE', 1000))
+MAINTENANCE_BATCH_SLEEP_SECONDS = float(os.environ.get('MAINTENANCE_BATCH_SLEEP_SECONDS', 0.1))
+TASK_RESULT_RETENTION_DAYS = int(os.environ.get('TASK_RESULT_RETENTION_DAYS', 30))
+EMAIL_OUTBOX_RETENTION_DAYS = int(os.environ.get('EMAIL_OUTBOX_RETENTION_DAYS', 30))
+
+# N+1 query detection per request - '' (off), 'log' (staging) or 'raise' (tests);
+# see bookofmonth_backend/query_inspection.py
+N_PLUS_ONE_DETECTION = os.environ.get('N_PLUS_ONE_DETECTION', '')
+N_PLUS_ONE_THRESHOLD = int(os.environ.get('N_PLUS_ONE_THRESHOLD', 2))
+
+# Content processing leases - see content_pipeline/tasks.py. The lease is
+# renewed after every stage, so it must outlast the slowest single stage.
+CONTENT_CLAIM_BATCH_SIZE = int(os.environ.get('CONTENT_CLAIM_BATCH_SIZE', 10))
+CONTENT_LEASE_SECONDS = int(os.environ.get('CONTENT_LEASE_SECONDS', 600))
+CONTENT_RETRY_DELAY_SECONDS = int(os.environ.get('CONTENT_RETRY_DELAY_SECONDS', 900))
+CONTENT_REPROCESS_MAX_BATCHES = int(os.environ.get('CONTENT_REPROCESS_MAX_BATCHES', 1))
+
+# Daily ingestion fan-out - staged articles are processed in chunks across qcluster workers
+CONTENT_INGEST_FANOUT = os.environ.get('CONTENT_INGEST_FANOUT', 'True').lower() in ('true', '1', 'yes')
+CONTENT_INGEST_CHUNK_SIZE = int(os.environ.get('CONTENT_INGEST_CHUNK_SIZE', 5))
+# Comma-separated NewsAPI topic queries, fetched concurrently by the daily ingestion
+CONTENT_NEWS_QUERIES = [
+    q.strip() for q in os.environ.get('CONTENT_NEWS_QUERIES', 'world news for children').split(',') if q.strip()
+]
+
+# Local pre-screen - decisions below these confidences are deferred to Gemini
+CONTENT_PRESCREEN_SAFETY_THRESHOLD = float(os.environ.get('CONTENT_PRESCREEN_SAFETY_THRESHOLD', 0.99))
+CONTENT_PRESCREEN_CATEGORY_THRESHOLD = float(os.environ.get('CONTENT_PRESCREEN_CATEGORY_THRESHOLD', 0.95))
+
+# Prompt input budgets in estimated tokens, as task:tokens pairs (e.g. "adapt_content_for_age:1500,filter_content_safety:2500");
+# unlisted tasks keep the defaults in content_pipeline/domain/services/prompt_compaction.py
+CONTENT_PROMPT_TOKEN_BUDGETS = {
+    task.strip(): int(tokens)
+    for task, tokens in (
+        pair.split(':') for pair in os.environ.get('CONTENT_PROMPT_TOKEN_BUDGETS', '').split(',') if pair.strip()
+    )
+}
+
+# Circuit breakers around Gemini, NewsAPI, Pexels and YouTube - after this many consecutive
+# failures a dependency fails fast for the reset period; affected stages are retried later
+CONTENT_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get('CONTENT_CIRCUIT_FAILURE_THRESHOLD', 5))
+CONTENT_CIRCUIT_RESET_SECONDS = float(os.environ.get('CONTENT_CIRCUIT_RESET_SECONDS', 60))
+
+# Per-task Gemini model routing as JSON, e.g. '{"categorize_content": {"model": "gemini-2.0-flash"}}';
+# overrides the defaults in content_pipeline/infrastructure/adapters/gemini_routing.py
+GEMINI_MODEL_ROUTES = json.loads(os.environ.get('GEMINI_MODEL_ROUTES', '{}'))
+# Gemini prices in USD per million [prompt, candidate] tokens as JSON, e.g. '{"gemini-2.0-flash": [0.1, 0.4]}';
+# overrides the defaults in content_pipeline/domain/services/llm_usage.py for cost estimates
+GEMINI_PRICING = {
+    model: tuple(prices) for model, prices in json.loads(os.environ.get('GEMINI_PRICING', '{}')).items()
+}
+
 # Email Configuration
 EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
 EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
@@ -295,6 +351,16 @@ EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'False').lower() in ('true', '1'
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
 DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@bookofmonth.com')
+EMAIL_TIMEOUT = int(os.environ.get('EMAIL_TIMEOUT', 10))
+
+# Email Outbox - emails are queued in the DB and delivered by users.tasks.drain_email_outbox
+EMAIL_OUTBOX_BATCH_SIZE = int(os.environ.get('EMAIL_OUTBOX_BATCH_SIZE', 50))
+EMAIL_OUTBOX_MAX_BATCHES_PER_RUN = int(os.environ.get('EMAIL_OUTBOX_MAX_BATCHES_PER_RUN', 20))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('EMAIL_OUTBOX_MAX_ATTEMPTS', 5))
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = int(os.environ.get('EMAIL_OUTBOX_RETRY_BASE_SECONDS', 60))
+EMAIL_OUTBOX_RETRY_MAX_SECONDS = int(os.environ.get('EMAIL_OUTBOX_RETRY_MAX_SECONDS', 3600))
+EMAIL_OUTBOX_CLAIM_TIMEOUT_SECONDS = int(os.environ.get('EMAIL_OUTBOX_CLAIM_TIMEOUT_SECONDS', 300))
+EMAIL_OUTBOX_DRAIN_ON_COMMIT = os.environ.get('EMAIL_OUTBOX_DRAIN_ON_COMMIT', 'True').lower() in ('true', '1', 'yes')
 
 # Account Lockout Configuration
 MAX_FAILED_LOGIN_ATTEMPTS = int(os.environ.get('MAX_FAILED_LOGIN_ATTEMPTS', 5))
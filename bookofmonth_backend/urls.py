@@ -29,6 +29,8 @@ urlpatterns = [
     path('api/health/', health_check, name='health-check'),
     path('api/health/ready/', readiness_check, name='readiness-check'),
     path('api/health/live/', liveness_check, name='liveness-check'),
+    # Prometheus scrape endpoint (/metrics), including the content pipeline's LLM counters
+    path('', include('django_prometheus.urls')),
 ]
 
 # API Documentation (only in development)
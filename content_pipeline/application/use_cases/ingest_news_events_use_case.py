@@ -1,6 +1,8 @@
+import logging
 import uuid
+from collections import Counter
 from dataclasses import replace
-from typing import List
+from typing import Iterator, List, Optional, Sequence, Union
 from datetime import datetime, timedelta, timezone
 
 from content_pipeline.domain.ports.external_service_ports import NewsAggregatorPort, RawNewsArticle
@@ -8,9 +10,13 @@ from content_pipeline.domain.ports.repository_ports import NewsEventRepositoryPo
 from content_pipeline.domain.ports.gemini_api_port import GeminiApiPort
 from content_pipeline.domain.ports.image_generation_port import ImageGenerationPort
 from content_pipeline.domain.services.content_processing_service import ContentProcessingService
-from content_pipeline.domain.entities import NewsEvent
+from content_pipeline.domain.services.near_duplicate import simhash
+from content_pipeline.application.use_cases.reprocess_events_use_case import ReprocessEventsUseCase
+from content_pipeline.domain.entities import NewsEvent, IN_PROGRESS_STATUSES, STATUS_PROCESSED, STATUS_REJECTED
 from content_pipeline.domain.value_objects import AgeRange
 
+logger = logging.getLogger(__name__)
+
 class IngestNewsEventsUseCase:
     def __init__(
         self,
@@ -18,65 +24,115 @@ class IngestNewsEventsUseCase:
         news_event_repository: NewsEventRepositoryPort,
         content_processing_service: ContentProcessingService,
         gemini_api: GeminiApiPort,
-        image_generation: ImageGenerationPort
+        image_generation: ImageGenerationPort,
+        event_processor: Optional[ReprocessEventsUseCase] = None
     ):
         self.news_aggregator = news_aggregator
         self.news_event_repository = news_event_repository
         self.content_processing_service = content_processing_service
         self.gemini_api = gemini_api
         self.image_generation = image_generation
+        self.event_processor = event_processor or ReprocessEventsUseCase(
+            news_event_repository=news_event_repository,
+            content_processing_service=content_processing_service,
+        )
+        # (event id, [StageTiming]) for every article processed
+        self.stage_timings = self.event_processor.stage_timings
+        # Staging outcomes, e.g. {'fetched': 120, 'skipped_too_old': 4, 'staged': 80}
+        self.stats = Counter()
 
-    def execute(self, query: str, days_ago: int = 1, target_age_level: AgeRange = AgeRange.AGE_7_9):
-        self.content_processing_service.gemini_api = self.gemini_api
-        self.content_processing_service.image_generation = self.image_generation
+    def stage_articles(self, queries: Union[str, Sequence[str]], days_ago: int = 1) -> List[str]:
+        """
+        Fetch and deduplicate recent articles for one or more queries and store
+        new ones as RAW events.
+
+        Near-duplicates of stored events (the same story under another URL)
+        are dropped. No LLM calls are made here, so staging stays cheap and
+        the returned events can be processed anywhere with process_staged.
 
+        Returns:
+            Ids of the events still waiting to be processed, in fetch order
+        """
+        if isinstance(queries, str):
+            queries = [queries]
         since_date = datetime.now(timezone.utc) - timedelta(days=days_ago)
-        raw_articles: List[RawNewsArticle] = self.news_aggregator.fetch_recent_news(query, since_date)
+        raw_articles: Iterator[RawNewsArticle] = self.news_aggregator.iter_recent_news(queries, since_date)
 
+        staged = []
         for article in raw_articles:
-            if not self.content_processing_service.filter_content_safety(article.content):
-                print(f"Skipping unsafe content: {article.title}")
+            event_id = str(uuid.uuid5(uuid.NAMESPACE_URL, article.url))
+            if event_id in staged:
                 continue
+            self.stats['fetched'] += 1
 
-            news_event = NewsEvent(
-                id=str(uuid.uuid5(uuid.NAMESPACE_URL, article.url)),
+            existing_event = self.news_event_repository.get_by_id(event_id)
+            if existing_event and existing_event.processing_status in (STATUS_PROCESSED, STATUS_REJECTED):
+                logger.info("Already processed, skipping: %s", article.title)
+                self.stats['skipped_existing'] += 1
+                continue
+
+            # An interrupted earlier run left a checkpoint; continue from it
+            news_event = existing_event or NewsEvent(
+                id=event_id,
                 title=article.title,
                 raw_content=article.content,
                 source_url=article.url,
                 published_at=article.published_at,
+                source_content=article.content,
             )
 
-            # Categorize using Gemini AI (not keyword matching)
-            processed_event = self.content_processing_service.categorize_event(news_event)
+            # Cheap checks first, before any LLM stage runs
+            if not self.content_processing_service.ensure_timeliness(news_event, max_age_days=days_ago + 1):
+                logger.info("Event %s is too old, skipping.", news_event.title)
+                self.stats['skipped_too_old'] += 1
+                continue
 
-            # Adapt content for age — this REWRITES raw_content with engaging story
-            processed_event = self.content_processing_service.adapt_content_for_age(processed_event, target_age_level)
+            if existing_event is None:
+                # The same story syndicated under another URL is processed once
+                news_event = replace(news_event, simhash=simhash(article.title, article.content))
+                duplicate_id = self.news_event_repository.find_near_duplicate(news_event.simhash)
+                if duplicate_id:
+                    logger.info("Near-duplicate of event %s, skipping: %s", duplicate_id, article.title)
+                    self.stats['skipped_near_duplicate'] += 1
+                    continue
+                self.news_event_repository.save(news_event)
+            staged.append(event_id)
+            self.stats['staged'] += 1
 
-            # Extract educational facts
-            processed_event = self.content_processing_service.extract_facts(processed_event)
-            processed_event = self.content_processing_service.verify_facts(processed_event)
+        return staged
 
-            # Generate fun facts (separate from extracted educational facts)
-            processed_event = self.content_processing_service.extract_fun_facts(processed_event)
+    def process_staged(self, event_id: str, target_age_level: AgeRange = AgeRange.AGE_7_9) -> bool:
+        """
+        Safety-check and process one staged event under a lease.
 
-            # Generate discussion/quiz questions and SAVE them
-            questions = self.content_processing_service.generate_comprehension_questions(processed_event.raw_content)
-            processed_event = replace(processed_event, discussion_questions=questions)
+        Returns:
+            False if the event failed or another worker holds it
+        """
+        self.content_processing_service.gemini_api = self.gemini_api
+        self.content_processing_service.image_generation = self.image_generation
 
-            # Find real image from Pexels
-            image_url = self.content_processing_service.find_image(processed_event)
-            if image_url:
-                processed_event = replace(processed_event, image_path=image_url)
+        # Lease the event so a concurrent reprocessing worker leaves it alone
+        if not self.news_event_repository.claim_event(
+            event_id, self.event_processor.worker_id, self.event_processor.lease_seconds
+        ):
+            logger.info("Another worker is processing event %s, skipping.", event_id)
+            return False
 
-            # Find YouTube video
-            video_url = self.content_processing_service.find_video(processed_event)
-            if video_url:
-                processed_event = replace(processed_event, video_url=video_url)
+        news_event = self.news_event_repository.get_by_id(event_id)
+        if news_event is None or news_event.processing_status not in IN_PROGRESS_STATUSES:
+            # Finished by another worker since it was staged
+            self.news_event_repository.release_event(event_id, self.event_processor.worker_id)
+            return news_event is not None
+        return self.event_processor.process_event(news_event, target_age_level)
 
-            if not self.content_processing_service.ensure_timeliness(processed_event, max_age_days=days_ago + 1):
-                print(f"Event {processed_event.title} is too old after processing, skipping.")
-                continue
+    def execute(self, query: Union[str, Sequence[str]], days_ago: int = 1,
+                target_age_level: AgeRange = AgeRange.AGE_7_9):
+        for event_id in self.stage_articles(query, days_ago):
+            self.process_staged(event_id, target_age_level)
+
+    def resume(self, target_age_level: AgeRange = AgeRange.AGE_7_9) -> dict:
+        """Finish events left part-way through processing, from their last completed stage."""
+        self.content_processing_service.gemini_api = self.gemini_api
+        self.content_processing_service.image_generation = self.image_generation
 
-            final_event = replace(processed_event, processing_status="PROCESSED")
-            self.news_event_repository.save(final_event)
-            print(f"Processed and saved news event: {final_event.title}")
+        return self.event_processor.run(target_age_level)
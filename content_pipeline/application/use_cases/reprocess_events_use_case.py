@@ -0,0 +1,160 @@
+import logging
+import os
+import socket
+import uuid
+from collections import Counter
+from dataclasses import replace
+from typing import Optional
+
+from content_pipeline.domain.entities import (
+    NewsEvent, STATUS_PENDING_REPROCESS, STATUS_PROCESSED, STATUS_RAW, STATUS_REJECTED,
+)
+from content_pipeline.domain.ports.repository_ports import NewsEventRepositoryPort
+from content_pipeline.domain.services.circuit_breaker import CircuitOpenError
+from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+from content_pipeline.domain.services.llm_usage import attribute_to_event
+from content_pipeline.domain.services.prescreen import SAFETY_DECISION
+from content_pipeline.domain.value_objects import AgeRange
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLostError(Exception):
+    """Raised when another worker has claimed an event this worker was processing."""
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class ReprocessEventsUseCase:
+    """
+    Processes in-progress events under a lease.
+
+    Any number of processes or nodes can run the worker loop at once: events
+    are claimed in batches with SKIP LOCKED and leased to one worker, so no
+    event is sent to Gemini twice while its lease is live. The lease is
+    renewed at every stage checkpoint, so lease_seconds only has to outlast
+    the slowest single stage; a worker that finds its lease taken over stops
+    processing the event without saving.
+    """
+
+    def __init__(
+        self,
+        news_event_repository: NewsEventRepositoryPort,
+        content_processing_service: ContentProcessingService,
+        worker_id: Optional[str] = None,
+        batch_size: int = 10,
+        lease_seconds: int = 600,
+        retry_delay_seconds: int = 0,
+    ):
+        self.news_event_repository = news_event_repository
+        self.content_processing_service = content_processing_service
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+        # (event id, [StageTiming]) for every event processed
+        self.stage_timings = []
+        # Outcomes across every event processed: processed, failed, rejected_unsafe
+        self.stats = Counter()
+
+    def run(self, target_age_level: AgeRange = AgeRange.AGE_7_9, max_batches: Optional[int] = None) -> dict:
+        """
+        Claim and process batches until the backlog is empty or max_batches is reached.
+
+        Each event is attempted at most once per run.
+        """
+        results = {'processed': 0, 'failed': 0}
+        attempted = set()
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            events = self.news_event_repository.claim_events_for_processing(
+                self.worker_id, self.batch_size, self.lease_seconds, exclude_ids=attempted
+            )
+            if not events:
+                break
+            batches += 1
+            for news_event in events:
+                attempted.add(news_event.id)
+                logger.info("Processing %s from %s", news_event.title, news_event.processing_status)
+                if self.process_event(news_event, target_age_level):
+                    results['processed'] += 1
+                else:
+                    results['failed'] += 1
+        return results
+
+    def process_event(self, news_event: NewsEvent, target_age_level: AgeRange = AgeRange.AGE_7_9) -> bool:
+        """
+        Process one event this worker has leased, then release the lease.
+
+        A failed event stays unclaimable for retry_delay_seconds, so workers
+        sharing a backlog do not keep retrying it during an outage.
+        """
+        succeeded = False
+        try:
+            with attribute_to_event(news_event.id):
+                succeeded = self._process(news_event, target_age_level)
+        finally:
+            self.news_event_repository.release_event(
+                news_event.id, self.worker_id, None if succeeded else self.retry_delay_seconds
+            )
+            self.stats['processed' if succeeded else 'failed'] += 1
+        return succeeded
+
+    def _process(self, news_event: NewsEvent, target_age_level: AgeRange) -> bool:
+        if news_event.processing_status == STATUS_PENDING_REPROCESS:
+            # Every stage re-runs; the safety decision still stands
+            safety = news_event.completed_stages.get(SAFETY_DECISION)
+            news_event = replace(
+                news_event, completed_stages={SAFETY_DECISION: safety} if safety else {}
+            )
+
+        # Staged articles have not been safety-checked yet; checkpointed ones have
+        if news_event.processing_status == STATUS_RAW and not news_event.completed_stages:
+            try:
+                safe, decided_by = self.content_processing_service.check_content_safety(
+                    news_event.source_content or news_event.raw_content
+                )
+            except CircuitOpenError as e:
+                # Left RAW; the lease is released with the retry delay
+                logger.warning("Safety check deferred for %s: %s", news_event.title, e)
+                return False
+            # Kept with the checkpoints, so training can tell Gemini's verdicts from the rest
+            news_event = replace(news_event, completed_stages={
+                SAFETY_DECISION: {'safe': safe, 'decided_by': decided_by},
+            })
+            if not safe:
+                self.news_event_repository.save(replace(news_event, processing_status=STATUS_REJECTED))
+                logger.info("Rejected unsafe content: %s", news_event.title)
+                self.stats['rejected_unsafe'] += 1
+                return True
+
+        # Categorize, adapt, extract and enrich; independent stages run in
+        # parallel and each completed stage is persisted as a checkpoint
+        try:
+            stage_run = self.content_processing_service.process_event(
+                news_event, target_age_level, checkpoint=self._checkpoint
+            )
+        except LeaseLostError as e:
+            logger.warning("Stopped processing %s: %s", news_event.title, e)
+            return False
+        self.stage_timings.append((news_event.id, stage_run.timings))
+        logger.info("Stage timings for %s: %s", news_event.title, ", ".join(
+            f"{t.stage}={t.seconds:.2f}s ({t.outcome})" for t in stage_run.timings
+        ))
+        if not stage_run.succeeded:
+            logger.warning("Stages %s failed for %s; checkpointed at %s for resume",
+                           ", ".join(stage_run.failed_stages), news_event.title, stage_run.event.processing_status)
+            return False
+
+        final_event = replace(stage_run.event, processing_status=STATUS_PROCESSED)
+        self.news_event_repository.save(final_event)
+        logger.info("Processed and saved news event: %s", final_event.title)
+        return True
+
+    def _checkpoint(self, news_event: NewsEvent) -> None:
+        """Renew this worker's lease, then persist a stage checkpoint."""
+        if not self.news_event_repository.claim_event(news_event.id, self.worker_id, self.lease_seconds):
+            raise LeaseLostError(f"lease on {news_event.id} expired and was claimed by another worker")
+        self.news_event_repository.save(news_event)
@@ -1,8 +1,22 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from content_pipeline.domain.value_objects import Category, AgeRange, Fact, GeographicLocation
 
+# Processing statuses, in pipeline order. Each stage checkpoint moves an event
+# forward; only PROCESSED events are published. REJECTED events failed the
+# safety check and are kept, unpublished, so they are not fetched again.
+STATUS_RAW = "RAW"
+STATUS_CATEGORIZED = "CATEGORIZED"
+STATUS_ADAPTED = "ADAPTED"
+STATUS_ENRICHED = "ENRICHED"
+STATUS_PROCESSED = "PROCESSED"
+STATUS_PENDING_REPROCESS = "PENDING_REPROCESS"
+STATUS_REJECTED = "REJECTED"
+
+IN_PROGRESS_STATUSES = (STATUS_RAW, STATUS_CATEGORIZED, STATUS_ADAPTED, STATUS_ENRICHED, STATUS_PENDING_REPROCESS)
+PUBLISHED_STATUSES = (STATUS_PROCESSED,)
+
 @dataclass(frozen=True)
 class NewsEvent:
     id: str
@@ -15,10 +29,16 @@ class NewsEvent:
     geographic_locations: List[GeographicLocation] = field(default_factory=list)
     age_appropriateness: Optional[AgeRange] = None
     is_verified: bool = False
-    processing_status: str = "RAW" # e.g., RAW, CATEGORIZED, VERIFIED, ADAPTED
+    processing_status: str = STATUS_RAW
     image_path: Optional[str] = None # New field for image path
     video_url: Optional[str] = None
     fun_facts: List[str] = field(default_factory=list)
     discussion_questions: List[str] = field(default_factory=list)
+    # JSON-serialized results of completed processing stages, keyed by stage name
+    completed_stages: Dict[str, Any] = field(default_factory=dict)
+    # 64-bit SimHash of title and content, for near-duplicate detection
+    simhash: Optional[int] = None
+    # The article text as fetched, kept after adaptation replaces raw_content
+    source_content: str = ''
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, Iterator, List
 from datetime import datetime
 from content_pipeline.domain.entities import NewsEvent
 
@@ -16,3 +16,18 @@ class NewsAggregatorPort(ABC):
     @abstractmethod
     def fetch_recent_news(self, query: str, since: datetime, language: str = "en") -> List[RawNewsArticle]:
         pass
+
+    def iter_recent_news(
+        self, queries: Iterable[str], since: datetime, language: str = "en"
+    ) -> Iterator[RawNewsArticle]:
+        """Streams articles published since `since` for several queries, each URL once.
+
+        The default fetches the queries one after another; implementations
+        should page and fetch concurrently where they can.
+        """
+        seen_urls = set()
+        for query in dict.fromkeys(queries):
+            for article in self.fetch_recent_news(query, since, language):
+                if article.url not in seen_urls:
+                    seen_urls.add(article.url)
+                    yield article
@@ -23,8 +23,11 @@ class GeminiApiPort(ABC):
         pass
 
     @abstractmethod
-    def filter_content_safety(self, content: str) -> bool:
-        """Filters content for inappropriate topics, returning True if safe, False otherwise."""
+    def filter_content_safety(self, content: str) -> Optional[bool]:
+        """Filters content for inappropriate topics, returning True if safe, False otherwise.
+
+        Returns None when no verdict could be obtained.
+        """
         pass
 
     @abstractmethod
@@ -38,6 +41,9 @@ class GeminiApiPort(ABC):
         pass
 
     @abstractmethod
-    def categorize_content(self, title: str, content: str) -> str:
-        """Categorizes content into one of the predefined categories using AI."""
+    def categorize_content(self, title: str, content: str) -> Optional[str]:
+        """Categorizes content into one of the predefined categories using AI.
+
+        Returns None when no valid category name could be obtained.
+        """
         pass
@@ -1,12 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Optional, Tuple
 from content_pipeline.domain.entities import NewsEvent
+from content_pipeline.domain.services.prescreen import HashedNaiveBayes
+from content_pipeline.domain.value_objects import EventStatistics
+
+
+def month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """Returns the half-open UTC range [start, end) covering a calendar month."""
+    start = datetime(year, month, 1, tzinfo=timezone.utc)
+    if month == 12:
+        end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    else:
+        end = datetime(year, month + 1, 1, tzinfo=timezone.utc)
+    return start, end
+
 
 class NewsEventRepositoryPort(ABC):
     @abstractmethod
     def get_by_id(self, event_id: str) -> Optional[NewsEvent]:
         pass
 
+    def get_by_ids(self, event_ids: Iterable[str]) -> List[NewsEvent]:
+        """The events with the given ids, in the order given; unknown ids are skipped."""
+        events = (self.get_by_id(event_id) for event_id in event_ids)
+        return [event for event in events if event is not None]
+
     @abstractmethod
     def save(self, news_event: NewsEvent) -> None:
         pass
@@ -18,3 +37,165 @@ class NewsEventRepositoryPort(ABC):
     @abstractmethod
     def update_processing_status(self, event_id: str, status: str) -> None:
         pass
+
+    @abstractmethod
+    def find_near_duplicate(self, simhash: int, exclude_id: Optional[str] = None) -> Optional[str]:
+        """Id of a stored event whose SimHash is within near_duplicate.MAX_DISTANCE bits, if any."""
+        pass
+
+    @abstractmethod
+    def claim_events_for_processing(
+        self,
+        worker_id: str,
+        batch_size: int,
+        lease_seconds: int,
+        exclude_ids: Iterable[str] = (),
+    ) -> List[NewsEvent]:
+        """Leases up to batch_size unleased in-progress events to worker_id, oldest first.
+
+        Concurrent callers never receive the same event while its lease is live.
+        """
+        pass
+
+    @abstractmethod
+    def claim_event(self, event_id: str, worker_id: str, lease_seconds: int) -> bool:
+        """Leases a single event to worker_id; returns False if another worker holds it."""
+        pass
+
+    @abstractmethod
+    def release_event(self, event_id: str, worker_id: str, retry_after_seconds: Optional[int] = None) -> None:
+        """Ends worker_id's lease, optionally keeping the event unclaimable for retry_after_seconds."""
+        pass
+
+    @abstractmethod
+    def iter_events_in_range(
+        self,
+        start: datetime,
+        end: datetime,
+        statuses: Optional[Iterable[str]] = None,
+        chunk_size: int = 500,
+        updated_after: Optional[datetime] = None,
+    ) -> Iterator[NewsEvent]:
+        """Streams events published in [start, end), oldest first, in chunks of chunk_size.
+
+        When updated_after is given only events saved at or after it are
+        yielded. Implementations filter in the database and may omit article
+        bodies (raw_content, fun facts, discussion questions) from the events.
+        """
+        pass
+
+    def iter_events_for_month(
+        self,
+        year: int,
+        month: int,
+        statuses: Optional[Iterable[str]] = None,
+        chunk_size: int = 500,
+        updated_after: Optional[datetime] = None,
+    ) -> Iterator[NewsEvent]:
+        """Streams the events published in a calendar month."""
+        start, end = month_bounds(year, month)
+        return self.iter_events_in_range(
+            start, end, statuses=statuses, chunk_size=chunk_size, updated_after=updated_after
+        )
+
+    @abstractmethod
+    def iter_event_versions_in_range(
+        self,
+        start: datetime,
+        end: datetime,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, datetime]]:
+        """Streams (id, updated_at) for events published in [start, end), in iteration order."""
+        pass
+
+    def iter_event_versions_for_month(
+        self,
+        year: int,
+        month: int,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, datetime]]:
+        start, end = month_bounds(year, month)
+        return self.iter_event_versions_in_range(start, end, statuses=statuses)
+
+    def get_events_for_month(self, year: int, month: int) -> List[NewsEvent]:
+        return list(self.iter_events_for_month(year, month))
+
+    def get_statistics_in_range(
+        self,
+        start: datetime,
+        end: datetime,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> EventStatistics:
+        """Category counts, countries and age ranges for events published in [start, end).
+
+        The default walks iter_events_in_range; implementations should
+        aggregate in the database where they can.
+        """
+        statistics = EventStatistics()
+        for event in self.iter_events_in_range(start, end, statuses=statuses):
+            statistics.add(event)
+        return statistics
+
+    def get_month_statistics(
+        self,
+        year: int,
+        month: int,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> EventStatistics:
+        start, end = month_bounds(year, month)
+        return self.get_statistics_in_range(start, end, statuses=statuses)
+
+
+class PrescreenModelRepositoryPort(ABC):
+    @abstractmethod
+    def get_latest(self, name: str) -> Optional[HashedNaiveBayes]:
+        pass
+
+    @abstractmethod
+    def save(self, name: str, model: HashedNaiveBayes, sample_count: int, metrics: dict) -> None:
+        pass
+
+    @abstractmethod
+    def iter_training_samples(self) -> Iterator[Tuple[str, str, str, Optional[str], Optional[str]]]:
+        """Streams (event id, title, content, safety label, category name) for every labelled event.
+
+        Only labels Gemini decided are returned: published events are
+        labelled safe and rejected ones unsafe where Gemini took the safety
+        decision, and the safety label or category name is None where the
+        pre-screen or a fallback took it instead. Content is the article text
+        as fetched, and events without it are left out.
+        """
+        pass
+
+
+class LLMUsageRepositoryPort(ABC):
+    @abstractmethod
+    def save_run(self, run_id: str, kind: str, usage: dict) -> None:
+        """Persists a run's merged UsageLedger snapshot."""
+        pass
+
+    @abstractmethod
+    def list_runs(self, limit: int = 20, since: Optional[datetime] = None) -> List[dict]:
+        """The most recent runs, newest first, each with its totals and breakdown."""
+        pass
+
+    @abstractmethod
+    def get_run(self, run_id: str) -> Optional[dict]:
+        pass
+
+
+class PipelineRunRepositoryPort(ABC):
+    @abstractmethod
+    def start_run(self, run_id: str, kind: str, started_at: Optional[datetime] = None) -> None:
+        """Records a run as started, now unless started_at is given."""
+        pass
+
+    @abstractmethod
+    def record_staging(self, run_id: str, stats: dict) -> None:
+        """Stores staging counters (fetched, skipped_*, staged) and marks processing as begun."""
+        pass
+
+    @abstractmethod
+    def finish_run(self, run_id: str, stats: dict, stage_latency: dict) -> None:
+        """Stores processing counters (processed, failed, rejected_unsafe, failed_chunks) and stage latency."""
+        pass
@@ -0,0 +1,131 @@
+"""
+Circuit breakers for the pipeline's external dependencies.
+
+After failure_threshold consecutive failures a breaker opens and every call
+fails fast with CircuitOpenError for reset_timeout seconds, instead of each
+article waiting out its own request timeout. It then lets a trial call
+through (half-open): success closes it, failure opens it again.
+
+Stages that hit an open circuit fail, so the event is checkpointed without
+them and they are retried by a later reprocessing run.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 60.0
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == STATE_OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = STATE_HALF_OPEN
+        return self._state
+
+    def allow(self) -> None:
+        """Raise CircuitOpenError unless a call may go through now."""
+        with self._lock:
+            state = self._current_state()
+            if state == STATE_CLOSED:
+                return
+            if state == STATE_HALF_OPEN and not self._trial_in_flight:
+                # Exactly one trial call; concurrent callers keep failing fast
+                self._trial_in_flight = True
+                return
+            retry_in = max(self.reset_timeout - (self._clock() - self._opened_at), 0.0)
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = STATE_OPEN
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+    @contextmanager
+    def guard(self, is_failure: Callable[[Exception], bool] = lambda error: True) -> Iterator[None]:
+        """
+        Run the enclosed call through the breaker.
+
+        Exceptions the call raises are re-raised; they count as failures only
+        if is_failure says so (e.g. a timeout does, a 404 does not).
+        """
+        self.allow()
+        try:
+            yield
+        except Exception as error:
+            if is_failure(error):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def circuit_breaker(
+    name: str,
+    failure_threshold: Optional[int] = None,
+    reset_timeout: Optional[float] = None,
+) -> CircuitBreaker:
+    """
+    The process-wide breaker for a dependency, created on first use.
+
+    Adapters are rebuilt for every task, so the breaker has to outlive them
+    for an outage seen by one chunk to protect the next. Thresholds given
+    here replace the breaker's current ones.
+    """
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        breaker = _breakers[name]
+    if failure_threshold is not None:
+        breaker.failure_threshold = failure_threshold
+    if reset_timeout is not None:
+        breaker.reset_timeout = reset_timeout
+    return breaker
@@ -1,32 +1,75 @@
 from dataclasses import replace
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
-from content_pipeline.domain.entities import NewsEvent, Fact
+from content_pipeline.domain.entities import (
+    NewsEvent, Fact, STATUS_RAW, STATUS_CATEGORIZED, STATUS_ADAPTED, STATUS_ENRICHED,
+)
 from content_pipeline.domain.value_objects import Category, GeographicLocation, AgeRange
 from content_pipeline.domain.ports.gemini_api_port import GeminiApiPort
 from content_pipeline.domain.ports.image_generation_port import ImageGenerationPort
+from content_pipeline.domain.services.geography import (
+    GeographicExtractor, default_extractor, select_geographically_diverse,
+)
+from content_pipeline.domain.services.prescreen import (
+    DECIDED_BY_FALLBACK, DECIDED_BY_GEMINI, DECIDED_BY_PRESCREEN, Prescreen,
+)
+from content_pipeline.domain.services.stage_graph import Stage, StageGraph, StageRun
 from content_pipeline.infrastructure.adapters.pexels_adapter import PexelsAdapter
 from content_pipeline.infrastructure.adapters.youtube_adapter import YouTubeAdapter
 
 
+def _dump_facts(facts: List[Fact]) -> List[dict]:
+    return [f.__dict__ for f in facts]
+
+
+def _load_facts(data: List[dict]) -> List[Fact]:
+    return [Fact(**f) for f in data]
+
+
+def _load_category_decision(data) -> Tuple[List[Category], Optional[str]]:
+    # Checkpoints from before the decider was recorded hold only the names
+    if isinstance(data, list):
+        data = {'categories': data, 'decided_by': None}
+    return [Category[n] for n in data['categories'] if n in Category.__members__], data['decided_by']
+
+
 class ContentProcessingService:
     def __init__(self, gemini_api: GeminiApiPort, image_generation: ImageGenerationPort,
-                 pexels: PexelsAdapter = None, youtube: YouTubeAdapter = None):
+                 pexels: PexelsAdapter = None, youtube: YouTubeAdapter = None,
+                 prescreen: Optional[Prescreen] = None, geo_extractor: Optional[GeographicExtractor] = None):
         self.gemini_api = gemini_api
         self.image_generation = image_generation
         self.pexels = pexels
         self.youtube = youtube
+        # Takes confident safety and category decisions without calling Gemini
+        self.prescreen = prescreen
+        self.geo_extractor = geo_extractor or default_extractor()
 
     def categorize_event(self, event: NewsEvent) -> NewsEvent:
-        category_name = self.gemini_api.categorize_content(event.title, event.raw_content)
-        try:
-            categories = [Category[category_name]]
-        except KeyError:
-            categories = [Category.SCIENCE_DISCOVERY]
+        categories, _ = self.decide_category(event)
         return replace(event, categories=categories)
 
-    def ensure_geographic_diversity(self, events: List[NewsEvent]) -> List[NewsEvent]:
-        return events
+    def decide_category(self, event: NewsEvent) -> Tuple[List[Category], str]:
+        """The event's categories and who decided them: the pre-screen, Gemini or the fallback."""
+        # The article as fetched, as the pre-screen was trained on; on resume
+        # raw_content may already hold the adapted story
+        content = event.source_content or event.raw_content
+        if self.prescreen:
+            category = self.prescreen.category(event.title, content)
+            if category:
+                return [category], DECIDED_BY_PRESCREEN
+        category_name = self.gemini_api.categorize_content(event.title, content)
+        if category_name in Category.__members__:
+            return [Category[category_name]], DECIDED_BY_GEMINI
+        return [Category.SCIENCE_DISCOVERY], DECIDED_BY_FALLBACK
+
+    def extract_locations(self, event: NewsEvent) -> NewsEvent:
+        """Populate geographic_locations from the gazetteer; no LLM call."""
+        locations = self.geo_extractor.extract(f"{event.title}. {event.raw_content}")
+        return replace(event, geographic_locations=locations)
+
+    def ensure_geographic_diversity(self, events: List[NewsEvent], limit: Optional[int] = None) -> List[NewsEvent]:
+        return select_geographically_diverse(events, limit)
 
     def ensure_timeliness(self, event: NewsEvent, max_age_days: int = 7) -> bool:
         now = datetime.now(timezone.utc)
@@ -71,21 +114,37 @@ class ContentProcessingService:
         return self.gemini_api.generate_questions(content, num_questions)
 
     def filter_content_safety(self, content: str) -> bool:
-        return self.gemini_api.filter_content_safety(content)
+        safe, _ = self.check_content_safety(content)
+        return safe
+
+    def check_content_safety(self, content: str) -> Tuple[bool, str]:
+        """Whether content is safe and who decided: the pre-screen, Gemini or the fallback."""
+        if self.prescreen and self.prescreen.is_unsafe(content):
+            return False, DECIDED_BY_PRESCREEN
+        safe = self.gemini_api.filter_content_safety(content)
+        if safe is None:
+            # Default to safe when Gemini gives no answer, so an outage does not reject everything
+            return True, DECIDED_BY_FALLBACK
+        return safe, DECIDED_BY_GEMINI
 
-    def find_image(self, event: NewsEvent) -> Optional[str]:
+    def suggest_search_terms(self, event: NewsEvent) -> Dict[str, str]:
+        return self.gemini_api.suggest_search_terms(event.title, event.raw_content)
+
+    def find_image(self, event: NewsEvent, search_terms: Optional[Dict[str, str]] = None) -> Optional[str]:
         """Find a real photo using Pexels based on Gemini-suggested search terms."""
         if not self.pexels:
             return None
-        search_terms = self.gemini_api.suggest_search_terms(event.title, event.raw_content)
+        if search_terms is None:
+            search_terms = self.suggest_search_terms(event)
         image_query = search_terms.get("image_query", event.title)
         return self.pexels.search_photo(image_query)
 
-    def find_video(self, event: NewsEvent) -> Optional[str]:
+    def find_video(self, event: NewsEvent, search_terms: Optional[Dict[str, str]] = None) -> Optional[str]:
         """Find an educational YouTube video based on Gemini-suggested search terms."""
         if not self.youtube:
             return None
-        search_terms = self.gemini_api.suggest_search_terms(event.title, event.raw_content)
+        if search_terms is None:
+            search_terms = self.suggest_search_terms(event)
         youtube_query = search_terms.get("youtube_query", event.title)
         return self.youtube.search_video(youtube_query)
 
@@ -93,3 +152,144 @@ class ContentProcessingService:
         prompt = f"A child-friendly, educational illustration of: {event.title}"
         image_data = self.image_generation.generate_image(prompt=prompt)
         return image_data.get("image_path")
+
+    def build_stage_graph(self, target_age_level: AgeRange = AgeRange.AGE_7_9, max_workers: int = 4) -> StageGraph:
+        """
+        The per-article processing graph.
+
+        Categorization, location extraction, age adaptation and fact extraction
+        only need the source article and start together. Fun facts, questions and search terms wait
+        for the adapted story; image and video lookups share one set of search
+        terms.
+        """
+        stages = [
+            Stage(
+                name="categorize",
+                run=lambda event, _: self.decide_category(event),
+                apply=lambda event, decision: replace(event, categories=decision[0]),
+                dump=lambda decision: {
+                    'categories': [c.name for c in decision[0]], 'decided_by': decision[1],
+                },
+                load=_load_category_decision,
+            ),
+            Stage(
+                name="locations",
+                run=lambda event, _: self.extract_locations(event).geographic_locations,
+                apply=lambda event, locations: replace(event, geographic_locations=locations),
+                dump=lambda locations: [loc.__dict__ for loc in locations],
+                load=lambda data: [GeographicLocation(**loc) for loc in data],
+            ),
+            Stage(
+                name="adapt",
+                run=lambda event, _: self.adapt_content_for_age(event, target_age_level).raw_content,
+                apply=lambda event, content: replace(
+                    event, raw_content=content, age_appropriateness=target_age_level
+                ),
+            ),
+            Stage(
+                name="extract_facts",
+                run=lambda event, _: self.extract_facts(event).extracted_facts,
+                apply=lambda event, facts: replace(event, extracted_facts=facts),
+                dump=_dump_facts,
+                load=_load_facts,
+            ),
+            Stage(
+                name="verify_facts",
+                depends_on=("extract_facts",),
+                run=lambda event, _: self.verify_facts(event).extracted_facts,
+                apply=lambda event, facts: replace(
+                    event, extracted_facts=facts,
+                    is_verified=bool(facts) and all(f.verification_status == "VERIFIED" for f in facts),
+                ),
+                dump=_dump_facts,
+                load=_load_facts,
+            ),
+            Stage(
+                name="fun_facts",
+                depends_on=("adapt",),
+                run=lambda event, _: self.extract_fun_facts(event).fun_facts,
+                apply=lambda event, fun_facts: replace(event, fun_facts=fun_facts),
+            ),
+            Stage(
+                name="questions",
+                depends_on=("adapt",),
+                run=lambda event, _: self.generate_comprehension_questions(event.raw_content),
+                apply=lambda event, questions: replace(event, discussion_questions=questions),
+            ),
+        ]
+
+        if self.pexels or self.youtube:
+            stages.append(Stage(
+                name="search_terms",
+                depends_on=("adapt",),
+                run=lambda event, _: self.suggest_search_terms(event),
+            ))
+        if self.pexels:
+            stages.append(Stage(
+                name="image",
+                depends_on=("search_terms",),
+                run=lambda event, inputs: self.find_image(event, inputs["search_terms"]),
+                apply=lambda event, url: replace(event, image_path=url) if url else event,
+            ))
+        if self.youtube:
+            stages.append(Stage(
+                name="video",
+                depends_on=("search_terms",),
+                run=lambda event, inputs: self.find_video(event, inputs["search_terms"]),
+                apply=lambda event, url: replace(event, video_url=url) if url else event,
+            ))
+
+        return StageGraph(stages, max_workers=max_workers)
+
+    def process_event(
+        self,
+        event: NewsEvent,
+        target_age_level: AgeRange = AgeRange.AGE_7_9,
+        checkpoint: Optional[Callable[[NewsEvent], None]] = None,
+    ) -> StageRun:
+        """
+        Run the processing graph for one article.
+
+        Stages recorded in event.completed_stages are not re-run, so an event
+        resumes at its last completed stage and previously failed stages are
+        retried on their own.
+
+        Args:
+            event: The event to process
+            target_age_level: Reading level to adapt the story for
+            checkpoint: Called with the partially processed event each time a
+                stage completes, e.g. to persist it
+
+        Returns:
+            StageRun whose event carries completed_stages and its checkpoint status
+        """
+        graph = self.build_stage_graph(target_age_level)
+
+        def to_checkpoint(results: Dict[str, Any]) -> NewsEvent:
+            return replace(
+                graph.apply_results(event, results),
+                # Keeps decisions taken outside the graph, such as the safety check
+                completed_stages={**event.completed_stages, **graph.dump_results(results)},
+                processing_status=self.checkpoint_status(graph, results),
+            )
+
+        def save_checkpoint(name: str, results: Dict[str, Any]) -> None:
+            checkpoint(to_checkpoint(results))
+
+        stage_run = graph.run(
+            event, completed=graph.load_results(event.completed_stages),
+            on_stage_complete=save_checkpoint if checkpoint else None,
+        )
+        stage_run.event = to_checkpoint(stage_run.results)
+        return stage_run
+
+    @staticmethod
+    def checkpoint_status(graph: StageGraph, results: Dict[str, Any]) -> str:
+        """Status for an event whose given stages have completed."""
+        if all(name in results for name in graph.order):
+            return STATUS_ENRICHED
+        if "categorize" in results and "adapt" in results:
+            return STATUS_ADAPTED
+        if "categorize" in results:
+            return STATUS_CATEGORIZED
+        return STATUS_RAW
@@ -0,0 +1,160 @@
+"""
+Local geographic extraction and geography-aware selection.
+
+Place names from a bundled gazetteer (content_pipeline/data/gazetteer.json)
+are compiled into an Aho-Corasick automaton, so every country, alias and
+city is found in one pass over an article regardless of gazetteer size.
+"""
+import json
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from content_pipeline.domain.entities import NewsEvent
+from content_pipeline.domain.value_objects import GeographicLocation
+
+DEFAULT_GAZETTEER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data', 'gazetteer.json'
+)
+MAX_LOCATIONS = 5
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher; patterns map to arbitrary values."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, object]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, object]]] = [[]]
+
+        for pattern, value in patterns:
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].append((len(pattern), value))
+
+        # Breadth-first, so each state's failure link is resolved before its children
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, object]]:
+        """Yields (start, end, value) for every pattern occurrence, including overlapping ones."""
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, value in self._output[state]:
+                yield index - length + 1, index + 1, value
+
+
+@dataclass(frozen=True)
+class _Place:
+    country: str
+    continent: str
+    city: Optional[str] = None
+
+
+class GeographicExtractor:
+    def __init__(self, gazetteer: dict):
+        continents = {}
+        patterns = []
+        for entry in gazetteer.get('countries', []):
+            continents[entry['name']] = entry['continent']
+            place = _Place(country=entry['name'], continent=entry['continent'])
+            for name in [entry['name']] + entry.get('aliases', []):
+                patterns.append((name.lower(), place))
+        for entry in gazetteer.get('cities', []):
+            place = _Place(country=entry['country'], continent=continents[entry['country']], city=entry['name'])
+            patterns.append((entry['name'].lower(), place))
+        self._automaton = AhoCorasick(patterns)
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_GAZETTEER_PATH) -> "GeographicExtractor":
+        with open(path, encoding='utf-8') as gazetteer_file:
+            return cls(json.load(gazetteer_file))
+
+    def _matches(self, text: str) -> List[Tuple[int, int, _Place]]:
+        """Leftmost-longest whole-word matches that start with a capital letter."""
+        # Lower-case character by character so match offsets line up with text
+        folded = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+        matches = [
+            (start, end, place) for start, end, place in self._automaton.iter_matches(folded)
+            if text[start].isupper()
+            and (start == 0 or not text[start - 1].isalnum())
+            and (end == len(text) or not text[end].isalnum())
+        ]
+        matches.sort(key=lambda match: (match[0], -(match[1] - match[0])))
+
+        selected, covered_until = [], 0
+        for start, end, place in matches:
+            if start >= covered_until:
+                selected.append((start, end, place))
+                covered_until = end
+        return selected
+
+    def extract(self, text: str, limit: int = MAX_LOCATIONS) -> List[GeographicLocation]:
+        """
+        Places mentioned in the text, in order of first mention.
+
+        A city stands in for its country: "Nairobi, Kenya" yields one
+        location, not two.
+        """
+        places = OrderedDict()
+        for _, _, place in self._matches(text):
+            places.setdefault(place, None)
+
+        countries_with_cities = {place.country for place in places if place.city}
+        locations = [
+            GeographicLocation(country=place.country, continent=place.continent, city=place.city)
+            for place in places
+            if place.city or place.country not in countries_with_cities
+        ]
+        return locations[:limit]
+
+
+@lru_cache(maxsize=1)
+def default_extractor() -> GeographicExtractor:
+    return GeographicExtractor.from_file()
+
+
+def select_geographically_diverse(events: List[NewsEvent], limit: Optional[int] = None) -> List[NewsEvent]:
+    """
+    Reorder events so consecutive picks come from different continents.
+
+    Events are grouped by the continent of their first location and taken
+    round-robin across groups, keeping the original order within each group
+    and the order in which continents first appear; events without a
+    location come last. The first `limit` events are returned.
+    """
+    groups: Dict[Optional[str], List[NewsEvent]] = OrderedDict()
+    unplaced = []
+    for event in events:
+        if event.geographic_locations:
+            groups.setdefault(event.geographic_locations[0].continent, []).append(event)
+        else:
+            unplaced.append(event)
+
+    selected = []
+    queues = [deque(group) for group in groups.values()]
+    while queues:
+        for queue in queues:
+            selected.append(queue.popleft())
+        queues = [queue for queue in queues if queue]
+    selected.extend(unplaced)
+    return selected if limit is None else selected[:limit]
@@ -0,0 +1,97 @@
+"""
+Token usage and estimated cost of Gemini calls.
+
+Adapters record the usageMetadata of every response in a UsageLedger,
+tagged with the port method, the model and the event being processed. The
+event comes from a context variable set around each event's processing
+(see attribute_to_event), so port signatures stay unchanged; StageGraph
+copies the context into its worker threads.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+
+# USD per million (prompt, candidate) tokens
+DEFAULT_PRICING: Dict[str, Tuple[float, float]] = {
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+    "gemini-1.5-flash-latest": (0.075, 0.30),
+}
+
+COUNTERS = ("calls", "prompt_tokens", "candidate_tokens", "total_tokens", "estimated_cost")
+
+current_event_id: ContextVar[Optional[str]] = ContextVar("llm_usage_event_id", default=None)
+
+
+@contextmanager
+def attribute_to_event(event_id: str) -> Iterator[None]:
+    """Attribute every LLM call made inside the block to the given event."""
+    token = current_event_id.set(event_id)
+    try:
+        yield
+    finally:
+        current_event_id.reset(token)
+
+
+def _empty() -> Dict[str, float]:
+    return {counter: 0 for counter in COUNTERS}
+
+
+def _add(totals: Dict[str, float], other: Dict[str, float]) -> None:
+    for counter in COUNTERS:
+        totals[counter] += other.get(counter, 0)
+
+
+class UsageLedger:
+    """Thread-safe usage totals, overall and by task, model and event."""
+
+    def __init__(self, pricing: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.pricing = {**DEFAULT_PRICING, **(pricing or {})}
+        self._totals = _empty()
+        self._by = {"task": {}, "model": {}, "event": {}}
+        self._lock = threading.Lock()
+
+    def estimate_cost(self, model: str, prompt_tokens: int, candidate_tokens: int) -> float:
+        """Estimated USD cost; models without a price count as free."""
+        prompt_price, candidate_price = self.pricing.get(model, (0.0, 0.0))
+        return (prompt_tokens * prompt_price + candidate_tokens * candidate_price) / 1_000_000
+
+    def record(self, task: str, model: str, prompt_tokens: int, candidate_tokens: int,
+               total_tokens: Optional[int] = None, event_id: Optional[str] = None) -> dict:
+        """Record one call; event_id defaults to the event in context. Returns the call's totals."""
+        call = {
+            "calls": 1,
+            "prompt_tokens": prompt_tokens,
+            "candidate_tokens": candidate_tokens,
+            "total_tokens": prompt_tokens + candidate_tokens if total_tokens is None else total_tokens,
+            "estimated_cost": self.estimate_cost(model, prompt_tokens, candidate_tokens),
+        }
+        event_id = event_id or current_event_id.get()
+        with self._lock:
+            _add(self._totals, call)
+            for dimension, key in (("task", task), ("model", model), ("event", event_id)):
+                if key is not None:
+                    _add(self._by[dimension].setdefault(key, _empty()), call)
+        return call
+
+    def snapshot(self) -> dict:
+        """Plain-dict totals that can be pickled, stored as JSON and merged."""
+        with self._lock:
+            return {
+                "totals": dict(self._totals),
+                **{f"by_{dimension}": {key: dict(totals) for key, totals in groups.items()}
+                   for dimension, groups in self._by.items()},
+            }
+
+
+def merge_usage(*snapshots: dict) -> dict:
+    merged = {"totals": _empty(), "by_task": {}, "by_model": {}, "by_event": {}}
+    for snapshot in snapshots:
+        if not snapshot:
+            continue
+        _add(merged["totals"], snapshot["totals"])
+        for dimension in ("by_task", "by_model", "by_event"):
+            for key, totals in snapshot.get(dimension, {}).items():
+                _add(merged[dimension].setdefault(key, _empty()), totals)
+    return merged
@@ -0,0 +1,64 @@
+"""
+SimHash fingerprints for spotting the same story syndicated under different URLs.
+
+A 64-bit SimHash is built from word shingles of an article's title and body,
+so rewordings of a few sentences move it by only a few bits. The fingerprint
+is split into four 16-bit bands: by the pigeonhole principle two fingerprints
+within MAX_DISTANCE (3) bits share at least one band exactly, so candidates
+can be found with equality lookups on indexed band columns.
+"""
+import hashlib
+import re
+from typing import List, Tuple
+
+FINGERPRINT_BITS = 64
+BAND_COUNT = 4
+BAND_BITS = FINGERPRINT_BITS // BAND_COUNT
+MAX_DISTANCE = BAND_COUNT - 1
+SHINGLE_SIZE = 3
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# NewsAPI truncates content with a "[+1234 chars]" marker that differs per outlet
+_TRUNCATION_RE = re.compile(r"\[\+\d+ chars\]\s*$")
+# Outlets append their name to syndicated titles: "Headline - Outlet"
+_TITLE_SUFFIX_RE = re.compile(r"\s+[-|\u2013\u2014]\s+[^-|\u2013\u2014]+$")
+
+
+def _normalize(title: str, content: str) -> str:
+    return f"{_TITLE_SUFFIX_RE.sub('', title or '')} {_TRUNCATION_RE.sub('', content or '')}"
+
+
+def _shingles(text: str) -> List[str]:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+
+def simhash(title: str, content: str) -> int:
+    """Unsigned 64-bit SimHash of an article's title and content."""
+    weights = [0] * FINGERPRINT_BITS
+    for shingle in _shingles(_normalize(title, content)):
+        value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def bands(fingerprint: int) -> Tuple[int, ...]:
+    """The fingerprint's BAND_COUNT 16-bit bands, lowest bits first."""
+    mask = (1 << BAND_BITS) - 1
+    return tuple(fingerprint >> (i * BAND_BITS) & mask for i in range(BAND_COUNT))
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def is_near_duplicate(a: int, b: int, max_distance: int = MAX_DISTANCE) -> bool:
+    return hamming_distance(a, b) <= max_distance
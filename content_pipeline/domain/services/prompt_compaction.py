@@ -0,0 +1,109 @@
+"""
+Normalisation and compaction of article text before it goes into a prompt.
+
+NewsAPI content carries truncation markers, HTML remnants and outlet
+boilerplate that cost tokens without telling the model anything. The
+compactor strips those, drops repeated sentences and cuts what is left to
+a per-task token budget, counted with a local approximation of Gemini's
+tokenizer (about four characters per token).
+"""
+import html
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+# Prompt input budgets in estimated tokens, keyed by GeminiApiPort method
+DEFAULT_BUDGETS = {
+    'adapt_content_for_age': 1200,
+    'extract_fun_facts': 600,
+    'generate_questions': 600,
+    # Generous: an unsafe passage late in the article must still be seen
+    'filter_content_safety': 2000,
+    'categorize_content': 120,
+    'suggest_search_terms': 80,
+}
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_TRUNCATION_RE = re.compile(r"(?:…\s*)?\[\+\d+ chars\]")
+_TAG_RE = re.compile(r"<[^>]+>")
+_URL_RE = re.compile(r"https?://\S+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[\"'“(]?[A-Z0-9])")
+_BOILERPLATE_RE = re.compile(
+    r"^(?:advertisement|read more|click here|sign up|subscribe|share this|"
+    r"follow us|all rights reserved|copyright|©|image (?:source|caption|copyright)|"
+    r"photo:|getty images|reuters\s*$|ap photo|this article (?:was|is) (?:originally|first) published)",
+    re.IGNORECASE,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count: one per punctuation mark, one per four characters of a word."""
+    return sum(-(-len(token) // 4) for token in _TOKEN_RE.findall(text or ''))
+
+
+def normalize(text: str) -> str:
+    """Strip markup, truncation markers and URLs, and collapse whitespace."""
+    text = html.unescape(_TAG_RE.sub(' ', text or ''))
+    text = _TRUNCATION_RE.sub('', text)
+    text = _URL_RE.sub('', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence for sentence in _SENTENCE_RE.split(text) if sentence]
+
+
+class PromptCompactor:
+    """
+    Compacts article text for the Gemini prompts.
+
+    Sentences are kept in order until the task's budget runs out; a first
+    sentence longer than the whole budget is cut at a word boundary.
+    Tasks without a budget are normalised but not truncated.
+    """
+
+    def __init__(self, budgets: Optional[Dict[str, int]] = None):
+        self.budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+        # Running totals, e.g. {'tokens_in': 900, 'tokens_out': 610, 'tokens_saved': 290}
+        self.stats = Counter()
+        self._lock = threading.Lock()
+
+    def compact(self, text: str, task: str) -> str:
+        budget = self.budgets.get(task)
+        kept, seen, used = [], set(), 0
+        for sentence in split_sentences(normalize(text)):
+            key = _WHITESPACE_RE.sub(' ', re.sub(r"[^\w\s]", '', sentence.lower())).strip()
+            if not key or key in seen or _BOILERPLATE_RE.match(sentence):
+                continue
+            seen.add(key)
+            tokens = estimate_tokens(sentence)
+            if budget is not None and used + tokens > budget:
+                if not kept:
+                    kept.append(self._truncate(sentence, budget))
+                break
+            kept.append(sentence)
+            used += tokens
+
+        compacted = ' '.join(kept)
+        self._record(task, estimate_tokens(text), estimate_tokens(compacted))
+        return compacted
+
+    @staticmethod
+    def _truncate(sentence: str, budget: int) -> str:
+        words, used = [], 0
+        for word in sentence.split(' '):
+            used += estimate_tokens(word)
+            if used > budget:
+                break
+            words.append(word)
+        return ' '.join(words)
+
+    def _record(self, task: str, tokens_in: int, tokens_out: int) -> None:
+        saved = max(tokens_in - tokens_out, 0)
+        with self._lock:
+            self.stats['tokens_in'] += tokens_in
+            self.stats['tokens_out'] += tokens_out
+            self.stats['tokens_saved'] += saved
+            self.stats[f'{task}_tokens_saved'] += saved
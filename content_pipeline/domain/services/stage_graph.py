@@ -0,0 +1,223 @@
+"""
+Declarative stage graph for per-article content processing.
+
+Each Stage declares the stages it depends on. Stages whose dependencies have
+completed run concurrently on a thread pool, and every stage's result is
+computed once per event and shared with the stages that depend on it.
+"""
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from content_pipeline.domain.entities import NewsEvent
+
+OUTCOME_OK = "ok"
+OUTCOME_FAILED = "failed"
+OUTCOME_SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    A unit of work in the graph.
+
+    run receives the event (with the results of every upstream stage already
+    applied) and the results of its direct dependencies by stage name. apply,
+    if given, merges the result into the event; stages without apply produce
+    intermediate values that only their dependents consume. dump and load
+    convert results to and from JSON for checkpointing.
+    """
+    name: str
+    run: Callable[[NewsEvent, Dict[str, Any]], Any]
+    apply: Optional[Callable[[NewsEvent, Any], NewsEvent]] = None
+    depends_on: Tuple[str, ...] = ()
+    dump: Callable[[Any], Any] = lambda result: result
+    load: Callable[[Any], Any] = lambda data: data
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    stage: str
+    seconds: float
+    outcome: str
+    error: Optional[str] = None
+
+
+@dataclass
+class StageRun:
+    event: NewsEvent
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings: List[StageTiming] = field(default_factory=list)
+
+    @property
+    def failed_stages(self) -> List[str]:
+        return [t.stage for t in self.timings if t.outcome == OUTCOME_FAILED]
+
+    @property
+    def succeeded(self) -> bool:
+        return all(t.outcome == OUTCOME_OK for t in self.timings)
+
+
+class StageGraph:
+    def __init__(self, stages: List[Stage], max_workers: int = 4):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        for stage in stages:
+            missing = [name for name in stage.depends_on if name not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {', '.join(missing)}")
+        self.order = self._topological_order(stages)
+        self.ancestors = {name: self._ancestors(name) for name in self.order}
+        self.max_workers = max_workers
+
+    def _topological_order(self, stages: List[Stage]) -> List[str]:
+        order, done = [], set()
+        pending = list(stages)
+        while pending:
+            ready = [s for s in pending if all(d in done for d in s.depends_on)]
+            if not ready:
+                raise ValueError("Stage graph contains a cycle: " + ", ".join(s.name for s in pending))
+            for stage in ready:
+                order.append(stage.name)
+                done.add(stage.name)
+            pending = [s for s in pending if s.name not in done]
+        return order
+
+    def _ancestors(self, name: str) -> set:
+        found, stack = set(), list(self.stages[name].depends_on)
+        while stack:
+            dependency = stack.pop()
+            if dependency not in found:
+                found.add(dependency)
+                stack.extend(self.stages[dependency].depends_on)
+        return found
+
+    def _event_for(self, name: str, event: NewsEvent, results: Dict[str, Any]) -> NewsEvent:
+        """The base event with every upstream stage's result applied, in graph order."""
+        return self.apply_results(event, {n: r for n, r in results.items() if n in self.ancestors[name]})
+
+    def apply_results(self, event: NewsEvent, results: Dict[str, Any]) -> NewsEvent:
+        """Apply the given stage results to an event in graph order."""
+        for name in self.order:
+            if name in results and self.stages[name].apply:
+                event = self.stages[name].apply(event, results[name])
+        return event
+
+    def dump_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: self.stages[name].dump(result) for name, result in results.items() if name in self.stages}
+
+    def load_results(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Decode checkpointed results, ignoring stages this graph does not have."""
+        return {name: self.stages[name].load(value) for name, value in (data or {}).items() if name in self.stages}
+
+    def run(
+        self,
+        event: NewsEvent,
+        completed: Optional[Dict[str, Any]] = None,
+        on_stage_complete: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> StageRun:
+        """
+        Run every stage for an event.
+
+        Only stage bodies run on worker threads; scheduling, apply and
+        on_stage_complete callbacks stay on the calling thread. A stage whose
+        dependency failed or was skipped is skipped.
+
+        Args:
+            event: The event to process
+            completed: Results of stages that already ran; these are not re-run
+            on_stage_complete: Called with the stage name and all results so far
+                each time a stage succeeds
+
+        Returns:
+            StageRun with the final event, per-stage results and timings
+        """
+        results: Dict[str, Any] = dict(completed or {})
+        outcomes: Dict[str, str] = {name: OUTCOME_OK for name in results}
+        timings: List[StageTiming] = []
+        remaining = [name for name in self.order if name not in results]
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while remaining or running:
+                for name in list(remaining):
+                    stage = self.stages[name]
+                    dependency_outcomes = [outcomes.get(d) for d in stage.depends_on]
+                    if any(o in (OUTCOME_FAILED, OUTCOME_SKIPPED) for o in dependency_outcomes):
+                        outcomes[name] = OUTCOME_SKIPPED
+                        timings.append(StageTiming(stage=name, seconds=0.0, outcome=OUTCOME_SKIPPED))
+                        remaining.remove(name)
+                    elif all(o == OUTCOME_OK for o in dependency_outcomes):
+                        inputs = {d: results[d] for d in stage.depends_on}
+                        stage_event = self._event_for(name, event, results)
+                        # Carry context variables (e.g. the event LLM usage is attributed to) into the thread
+                        future = executor.submit(
+                            contextvars.copy_context().run, self._timed, stage.run, stage_event, inputs
+                        )
+                        running[future] = name
+                        remaining.remove(name)
+
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    seconds, result, error = future.result()
+                    if error is None:
+                        results[name] = result
+                        outcomes[name] = OUTCOME_OK
+                        timings.append(StageTiming(stage=name, seconds=seconds, outcome=OUTCOME_OK))
+                        if on_stage_complete:
+                            on_stage_complete(name, results)
+                    else:
+                        outcomes[name] = OUTCOME_FAILED
+                        timings.append(StageTiming(stage=name, seconds=seconds, outcome=OUTCOME_FAILED, error=error))
+
+        return StageRun(event=self.apply_results(event, results), results=results, timings=timings)
+
+    @staticmethod
+    def _timed(fn, event, inputs):
+        started = time.monotonic()
+        try:
+            result = fn(event, inputs)
+        except Exception as e:
+            return time.monotonic() - started, None, f"{type(e).__name__}: {e}"
+        return time.monotonic() - started, result, None
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(int(-(-q * len(ordered) // 100)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_stage_timings(timings: Iterable[StageTiming]) -> Dict[str, dict]:
+    """
+    Per-stage latency and outcome counts over many events.
+
+    Skipped stages did not run, so they are counted but left out of the
+    latency figures.
+    """
+    seconds: Dict[str, List[float]] = {}
+    outcomes: Dict[str, Dict[str, int]] = {}
+    for timing in timings:
+        counts = outcomes.setdefault(timing.stage, {OUTCOME_OK: 0, OUTCOME_FAILED: 0, OUTCOME_SKIPPED: 0})
+        counts[timing.outcome] += 1
+        if timing.outcome != OUTCOME_SKIPPED:
+            seconds.setdefault(timing.stage, []).append(timing.seconds)
+
+    summary = {}
+    for stage, counts in outcomes.items():
+        samples = seconds.get(stage)
+        summary[stage] = {
+            **counts,
+            "p50_seconds": round(percentile(samples, 50), 3) if samples else None,
+            "p95_seconds": round(percentile(samples, 95), 3) if samples else None,
+            "max_seconds": round(max(samples), 3) if samples else None,
+        }
+    return summary
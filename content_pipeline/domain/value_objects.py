@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Dict, Set
 
 class Category(Enum):
     ANIMALS_NATURE = "Animals & Nature"
@@ -26,3 +27,42 @@ class GeographicLocation:
     country: str
     continent: str
     city: str = None
+
+@dataclass
+class EventStatistics:
+    """Running category, country and age-range counts over a set of news events."""
+    event_count: int = 0
+    category_counts: Dict[Category, int] = field(default_factory=dict)
+    countries: Set[str] = field(default_factory=set)
+    age_ranges: Set[AgeRange] = field(default_factory=set)
+
+    def add(self, event) -> None:
+        self.event_count += 1
+        for category in event.categories:
+            self.category_counts[category] = self.category_counts.get(category, 0) + 1
+        for location in event.geographic_locations:
+            self.countries.add(location.country)
+        if event.age_appropriateness:
+            self.age_ranges.add(event.age_appropriateness)
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form, keyed by enum names as stored on NewsEventModel."""
+        return {
+            'event_count': self.event_count,
+            'category_counts': {category.name: count for category, count in self.category_counts.items()},
+            'countries': sorted(self.countries),
+            'age_ranges': sorted(age_range.name for age_range in self.age_ranges),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EventStatistics":
+        data = data or {}
+        return cls(
+            event_count=data.get('event_count', 0),
+            category_counts={
+                Category[name]: count for name, count in data.get('category_counts', {}).items()
+                if name in Category.__members__
+            },
+            countries=set(data.get('countries', [])),
+            age_ranges={AgeRange[name] for name in data.get('age_ranges', []) if name in AgeRange.__members__},
+        )
@@ -1,38 +1,99 @@
 import json
 import os
+import time
 import requests
 from typing import List, Dict, Any, Optional
 from content_pipeline.domain.ports.gemini_api_port import GeminiApiPort
+from content_pipeline.domain.services.circuit_breaker import CircuitBreaker, circuit_breaker
+from content_pipeline.domain.services.llm_usage import UsageLedger
+from content_pipeline.domain.services.prompt_compaction import PromptCompactor
+from content_pipeline.infrastructure.adapters.gemini_routing import ModelRoute, RouteStats, build_routes
+from content_pipeline.infrastructure.adapters.http_errors import is_outage
+from content_pipeline.infrastructure.metrics import record_llm_call
 from content_pipeline.domain.value_objects import AgeRange
 
+REQUEST_TIMEOUT_SECONDS = 30
+
+
+def record_usage(ledger: UsageLedger, task: str, model: str, metadata: Optional[dict]) -> Optional[dict]:
+    """Record a response's usageMetadata in the ledger; returns the call's totals, if reported."""
+    if not metadata:
+        return None
+    return ledger.record(
+        task, model,
+        prompt_tokens=metadata.get("promptTokenCount", 0),
+        candidate_tokens=metadata.get("candidatesTokenCount", 0),
+        total_tokens=metadata.get("totalTokenCount"),
+    )
+
 class GeminiApiAdapter(GeminiApiPort):
-    def __init__(self, api_key: str = None):
+    """
+    Gemini text generation for the content pipeline.
+
+    Requests go through the shared 'gemini' circuit breaker: while it is open
+    every method raises CircuitOpenError rather than returning a fallback, so
+    the calling stage fails and is retried later.
+    """
+
+    def __init__(self, api_key: str = None, compactor: Optional[PromptCompactor] = None,
+                 routes: Optional[Dict[str, ModelRoute]] = None, breaker: Optional[CircuitBreaker] = None,
+                 timeout: float = REQUEST_TIMEOUT_SECONDS, usage: Optional[UsageLedger] = None):
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key not provided or set in environment.")
-        self.api_url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-
-    def _call_gemini_api(self, prompt: str) -> Optional[str]:
+        # Article text is compacted to a per-task token budget before it enters a prompt
+        self.compactor = compactor or PromptCompactor()
+        # Each port method is sent to its own model and generation config
+        self.routes = routes or build_routes()
+        self.route_stats = RouteStats()
+        self.breaker = breaker or circuit_breaker("gemini")
+        self.timeout = timeout
+        # Token usage per call, by port method, model and event
+        self.usage = usage or UsageLedger()
+
+    def _call_gemini_api(self, prompt: str, task: str) -> Optional[str]:
+        route = self.routes[task]
         headers = {"Content-Type": "application/json"}
         data = {"contents": [{"parts": [{"text": prompt}]}]}
+        generation_config = route.generation_config()
+        if generation_config:
+            data["generationConfig"] = generation_config
         params = {"key": self.api_key}
+        text, usage = None, None
+        started = time.monotonic()
         try:
-            response = requests.post(self.api_url, headers=headers, json=data, params=params)
-            response.raise_for_status()
-            return response.json()["candidates"][0]["content"]["parts"][0]["text"]
+            with self.breaker.guard(is_outage):
+                payload = self._post(task, route, headers, data, params)
+            # Billed even if the answer turns out to be unusable
+            usage = record_usage(self.usage, task, route.model, payload.get("usageMetadata"))
+            text = payload["candidates"][0]["content"]["parts"][0]["text"]
         except requests.exceptions.RequestException as e:
             print(f"Error calling Gemini API: {e}")
-            return None
         except (KeyError, IndexError) as e:
             print(f"Error parsing Gemini API response: {e}")
-            return None
+        self.route_stats.record(
+            task, route.model, latency_ms=(time.monotonic() - started) * 1000,
+            output_chars=len(text or ""), failed=text is None,
+        )
+        self._record_metrics(task, route.model, text is not None, usage)
+        return text
+
+    def _record_metrics(self, task: str, model: str, succeeded: bool, usage: Optional[dict]) -> None:
+        record_llm_call(task, model, succeeded=succeeded, usage=usage)
+
+    def _post(self, task: str, route: ModelRoute, headers: dict, data: dict, params: dict) -> dict:
+        """One generateContent round trip; returns the decoded response body."""
+        response = requests.post(route.url, headers=headers, json=data, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
 
     def verify_fact(self, text: str) -> bool:
         prompt = f"Is the following statement a verifiable fact? Answer with only 'true' or 'false'. Statement: {text}"
-        response = self._call_gemini_api(prompt)
+        response = self._call_gemini_api(prompt, "verify_fact")
         return response.lower().strip() == 'true' if response else False
 
     def adapt_content_for_age(self, content: str, age_level: str) -> str:
+        article = self.compactor.compact(content, 'adapt_content_for_age')
         prompt = f"""You are a gifted children's storyteller who makes news exciting and memorable.
 
 Rewrite this news article as an engaging, story-driven piece for kids aged {age_level}. Follow these rules:
@@ -45,10 +106,10 @@ Rewrite this news article as an engaging, story-driven piece for kids aged {age_
 6. Use a warm, enthusiastic tone — like an excited teacher sharing something amazing
 
 Article to rewrite:
-{content}
+{article}
 
 Write ONLY the rewritten story, no headers or labels."""
-        response = self._call_gemini_api(prompt)
+        response = self._call_gemini_api(prompt, "adapt_content_for_age")
         return response if response else content
 
     def generate_educational_context(self, fact: str) -> str:
@@ -59,10 +120,11 @@ For example, if the topic is "shrimp", you might say: "Did you know a shrimp's h
 Topic: {fact}
 
 Write 2-3 sentences max. Be enthusiastic and use kid-friendly language."""
-        response = self._call_gemini_api(prompt)
+        response = self._call_gemini_api(prompt, "generate_educational_context")
         return response if response else ""
 
     def generate_questions(self, content: str, num_questions: int = 3) -> List[str]:
+        excerpt = self.compactor.compact(content, 'generate_questions')
         prompt = f"""Based on this content, generate {num_questions} questions for kids. Mix these types:
 
 1. A fun multiple-choice quiz question (format: "Quiz: [question]? A) ... B) ... C) ... D) ...")
@@ -70,22 +132,24 @@ Write 2-3 sentences max. Be enthusiastic and use kid-friendly language."""
 3. A "What Would You Do?" question that connects the topic to the child's own life
 
 Content:
-{content}
+{excerpt}
 
 Return each question on its own line. No numbering or labels."""
-        response = self._call_gemini_api(prompt)
+        response = self._call_gemini_api(prompt, "generate_questions")
         if not response:
             return []
         return [q.strip() for q in response.strip().splitlines() if q.strip()]
 
-    def filter_content_safety(self, content: str) -> bool:
-        prompt = f"Is the following content safe for children? Answer with only 'true' or 'false'. Content: {content}"
-        response = self._call_gemini_api(prompt)
+    def filter_content_safety(self, content: str) -> Optional[bool]:
+        excerpt = self.compactor.compact(content, 'filter_content_safety')
+        prompt = f"Is the following content safe for children? Answer with only 'true' or 'false'. Content: {excerpt}"
+        response = self._call_gemini_api(prompt, "filter_content_safety")
         if not response:
-            return True  # Default to safe on API failure to avoid skipping everything
+            return None
         return response.lower().strip() == 'true'
 
     def extract_fun_facts(self, content: str) -> List[str]:
+        article = self.compactor.compact(content, 'extract_fun_facts')
         prompt = f"""You are a "fun facts machine" for kids! Based on the topic in this article, generate 3-5 surprising, entertaining facts that would make kids say "Wow!" or "No way!"
 
 Rules:
@@ -101,26 +165,27 @@ Examples of great fun facts:
 - "Honey never goes bad. Scientists found 3,000-year-old honey in Egyptian tombs and it was still perfectly good to eat!"
 
 Article:
-{content}
+{article}
 
 Return each fact on its own line. No numbering or bullet points."""
-        response = self._call_gemini_api(prompt)
+        response = self._call_gemini_api(prompt, "extract_fun_facts")
         if not response:
             return []
         return [f.strip() for f in response.strip().splitlines() if f.strip()]
 
     def suggest_search_terms(self, title: str, content: str) -> Dict[str, str]:
+        excerpt = self.compactor.compact(content, 'suggest_search_terms')
         prompt = f"""Based on this article, suggest search terms for finding related media.
 
 Article title: {title}
-Article content (first 200 chars): {content[:200]}
+Article excerpt: {excerpt}
 
 Return a JSON object with exactly these two keys:
 - "youtube_query": a YouTube search query for a short educational kids video about this topic (5-10 words)
 - "image_query": a Pexels image search query for a beautiful photo related to this topic (2-4 words)
 
 Return ONLY valid JSON, no other text."""
-        response = self._call_gemini_api(prompt)
+        response = self._call_gemini_api(prompt, "suggest_search_terms")
         if not response:
             return {"youtube_query": title, "image_query": title.split()[0]}
         try:
@@ -132,7 +197,8 @@ Return ONLY valid JSON, no other text."""
         except (json.JSONDecodeError, ValueError):
             return {"youtube_query": title, "image_query": title.split()[0]}
 
-    def categorize_content(self, title: str, content: str) -> str:
+    def categorize_content(self, title: str, content: str) -> Optional[str]:
+        excerpt = self.compactor.compact(content, 'categorize_content')
         prompt = f"""Categorize this children's news article into exactly ONE of these categories:
 - ANIMALS_NATURE
 - SCIENCE_DISCOVERY
@@ -143,14 +209,14 @@ Return ONLY valid JSON, no other text."""
 - WORLD_RECORDS_FUN_FACTS
 
 Article title: {title}
-Article excerpt: {content[:300]}
+Article excerpt: {excerpt}
 
 Return ONLY the category name, nothing else."""
-        response = self._call_gemini_api(prompt)
+        response = self._call_gemini_api(prompt, "categorize_content")
         if not response:
-            return "SCIENCE_DISCOVERY"
+            return None
         category = response.strip().upper().replace(" ", "_")
         valid = {"ANIMALS_NATURE", "SCIENCE_DISCOVERY", "SPACE_EARTH",
                  "TECHNOLOGY_INNOVATION", "SPORTS_HUMAN_ACHIEVEMENT",
                  "ARTS_CULTURE", "WORLD_RECORDS_FUN_FACTS"}
-        return category if category in valid else "SCIENCE_DISCOVERY"
+        return category if category in valid else None
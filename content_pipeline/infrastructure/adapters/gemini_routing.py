@@ -0,0 +1,121 @@
+"""
+Per-task model routing for the Gemini adapters.
+
+Each GeminiApiPort method (and image generation) is routed to a model and
+generation config, so one-word classification answers go to a small, fast
+model with a tight output cap while story rewriting keeps the larger one.
+Every call is recorded against its route for latency, failure rate and
+output length.
+"""
+import threading
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta/models"
+
+FAST_MODEL = "gemini-2.0-flash-lite"
+DEFAULT_MODEL = "gemini-2.0-flash"
+IMAGE_MODEL = "gemini-1.5-flash-latest"
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    model: str
+    max_output_tokens: Optional[int] = None
+    temperature: Optional[float] = None
+
+    @property
+    def url(self) -> str:
+        return f"{GEMINI_API_BASE}/{self.model}:generateContent"
+
+    def generation_config(self) -> dict:
+        config = {}
+        if self.max_output_tokens is not None:
+            config["maxOutputTokens"] = self.max_output_tokens
+        if self.temperature is not None:
+            config["temperature"] = self.temperature
+        return config
+
+
+DEFAULT_ROUTES: Dict[str, ModelRoute] = {
+    # Classification-style answers: a word or a short JSON object
+    "verify_fact": ModelRoute(FAST_MODEL, max_output_tokens=5, temperature=0.0),
+    "filter_content_safety": ModelRoute(FAST_MODEL, max_output_tokens=5, temperature=0.0),
+    "categorize_content": ModelRoute(FAST_MODEL, max_output_tokens=16, temperature=0.0),
+    "suggest_search_terms": ModelRoute(FAST_MODEL, max_output_tokens=96, temperature=0.2),
+    # Writing for children
+    "adapt_content_for_age": ModelRoute(DEFAULT_MODEL, max_output_tokens=1024, temperature=0.8),
+    "generate_educational_context": ModelRoute(DEFAULT_MODEL, max_output_tokens=160, temperature=0.8),
+    "extract_fun_facts": ModelRoute(DEFAULT_MODEL, max_output_tokens=400, temperature=0.9),
+    "generate_questions": ModelRoute(DEFAULT_MODEL, max_output_tokens=300, temperature=0.7),
+    "generate_image": ModelRoute(IMAGE_MODEL),
+}
+
+
+def build_routes(overrides: Optional[Dict[str, dict]] = None) -> Dict[str, ModelRoute]:
+    """
+    DEFAULT_ROUTES with overrides applied, e.g.
+    {"categorize_content": {"model": "gemini-2.0-flash", "max_output_tokens": 32}}.
+
+    Fields not given in an override keep their default for that route.
+    """
+    routes = dict(DEFAULT_ROUTES)
+    for task, fields in (overrides or {}).items():
+        base = routes.get(task, ModelRoute(DEFAULT_MODEL))
+        routes[task] = replace(base, **fields)
+    return routes
+
+
+class RouteStats:
+    """Thread-safe running totals per route; snapshots can be summed across workers."""
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, task: str, model: str, latency_ms: float, output_chars: int, failed: bool) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(
+                task, {"model": model, "calls": 0, "failures": 0, "latency_ms": 0.0,
+                       "max_latency_ms": 0.0, "output_chars": 0}
+            )
+            totals["calls"] += 1
+            totals["failures"] += int(failed)
+            totals["latency_ms"] += latency_ms
+            totals["max_latency_ms"] = max(totals["max_latency_ms"], latency_ms)
+            totals["output_chars"] += output_chars
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {task: dict(totals) for task, totals in self._totals.items()}
+
+
+def merge_snapshots(*snapshots: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    merged: Dict[str, Dict[str, float]] = {}
+    for snapshot in snapshots:
+        for task, totals in snapshot.items():
+            if task not in merged:
+                merged[task] = dict(totals)
+                continue
+            current = merged[task]
+            for key in ("calls", "failures", "latency_ms", "output_chars"):
+                current[key] += totals[key]
+            current["max_latency_ms"] = max(current["max_latency_ms"], totals["max_latency_ms"])
+    return merged
+
+
+def summarize(snapshot: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Per-route averages: mean latency, failure rate and mean output length."""
+    summary = {}
+    for task, totals in sorted(snapshot.items()):
+        calls = totals["calls"] or 1
+        succeeded = (totals["calls"] - totals["failures"]) or 1
+        summary[task] = {
+            "model": totals["model"],
+            "calls": totals["calls"],
+            "failure_rate": totals["failures"] / calls,
+            "mean_latency_ms": totals["latency_ms"] / calls,
+            "max_latency_ms": totals["max_latency_ms"],
+            "mean_output_chars": totals["output_chars"] / succeeded,
+        }
+    return summary
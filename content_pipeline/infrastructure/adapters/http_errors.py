@@ -0,0 +1,13 @@
+import requests
+
+
+def is_outage(error: Exception) -> bool:
+    """
+    Whether a failed request says the service itself is unhealthy.
+
+    Timeouts, connection errors, 5xx and 429 responses count against a
+    circuit breaker; other 4xx responses are problems with the request.
+    """
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return isinstance(error, requests.exceptions.RequestException)
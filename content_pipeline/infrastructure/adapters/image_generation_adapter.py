@@ -1,16 +1,32 @@
 import os
+import time
 import requests
 import base64
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from content_pipeline.domain.ports.image_generation_port import ImageGenerationPort
+from content_pipeline.domain.services.circuit_breaker import CircuitBreaker, circuit_breaker
+from content_pipeline.domain.services.llm_usage import UsageLedger
+from content_pipeline.infrastructure.adapters.gemini_api_adapter import record_usage
+from content_pipeline.infrastructure.adapters.gemini_routing import DEFAULT_ROUTES, ModelRoute, RouteStats
+from content_pipeline.infrastructure.adapters.http_errors import is_outage
+from content_pipeline.infrastructure.metrics import record_llm_call
+
+# Image generation is slower than text
+REQUEST_TIMEOUT_SECONDS = 60
 
 class ImageGenerationAdapter(ImageGenerationPort):
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, route: Optional[ModelRoute] = None,
+                 breaker: Optional[CircuitBreaker] = None, timeout: float = REQUEST_TIMEOUT_SECONDS,
+                 usage: Optional[UsageLedger] = None):
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key not provided or set in environment.")
-        self.api_url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash-latest:generateContent"
+        self.route = route or DEFAULT_ROUTES["generate_image"]
+        self.route_stats = RouteStats()
+        self.breaker = breaker or circuit_breaker("image_generation")
+        self.timeout = timeout
+        self.usage = usage or UsageLedger()
         self.image_dir = "generated_images"
         os.makedirs(self.image_dir, exist_ok=True)
 
@@ -33,15 +49,44 @@ class ImageGenerationAdapter(ImageGenerationPort):
             ]
         }
         
+        generation_config = self.route.generation_config()
+        if generation_config:
+            data["generationConfig"] = generation_config
+
         params = {
             "key": self.api_key
         }
 
+        started = time.monotonic()
+        result = self._request_image(full_prompt, style, headers, data, params)
+        self.route_stats.record(
+            "generate_image", self.route.model, latency_ms=(time.monotonic() - started) * 1000,
+            output_chars=0, failed=result["image_path"] is None,
+        )
+        self._record_metrics(result["image_path"] is not None, result["metadata"].get("usage"))
+        return result
+
+    def _record_metrics(self, succeeded: bool, usage: Optional[dict]) -> None:
+        record_llm_call("generate_image", self.route.model, succeeded=succeeded, usage=usage)
+
+    def _post(self, headers: dict, data: dict, params: dict) -> dict:
+        """One generateContent round trip; returns the decoded response body."""
+        response = requests.post(self.route.url, headers=headers, json=data, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _save_image(self, image_bytes: bytes) -> str:
+        image_path = os.path.join(self.image_dir, f"{uuid.uuid4()}.png")
+        with open(image_path, "wb") as f:
+            f.write(image_bytes)
+        return image_path
+
+    def _request_image(self, full_prompt: str, style: str, headers: dict, data: dict, params: dict) -> Dict[str, Any]:
         try:
-            response = requests.post(self.api_url, headers=headers, json=data, params=params)
-            response.raise_for_status()
-            
-            response_json = response.json()
+            with self.breaker.guard(is_outage):
+                response_json = self._post(headers, data, params)
+
+            usage = record_usage(self.usage, "generate_image", self.route.model, response_json.get("usageMetadata"))
             
             # Extract base64 image data
             if "candidates" in response_json and len(response_json["candidates"]) > 0:
@@ -50,20 +95,14 @@ class ImageGenerationAdapter(ImageGenerationPort):
                 
                 if image_data_part:
                     image_data = image_data_part["inlineData"]["data"]
-                    image_bytes = base64.b64decode(image_data)
-                    
-                    # Save image to file
-                    image_filename = f"{uuid.uuid4()}.png"
-                    image_path = os.path.join(self.image_dir, image_filename)
-                    
-                    with open(image_path, "wb") as f:
-                        f.write(image_bytes)
-                    
+                    image_path = self._save_image(base64.b64decode(image_data))
+
                     return {
                         "image_path": image_path, # Return the local file path
                         "metadata": {
                             "prompt": full_prompt,
                             "style": style,
+                            "usage": usage,
                         }
                     }
 
@@ -74,7 +113,8 @@ class ImageGenerationAdapter(ImageGenerationPort):
                     "prompt": full_prompt,
                     "style": style,
                     "error": "No image data found in API response",
-                    "api_response": response_json
+                    "api_response": response_json,
+                    "usage": usage,
                 }
             }
 
@@ -96,6 +136,6 @@ class ImageGenerationAdapter(ImageGenerationPort):
                     "prompt": full_prompt,
                     "style": style,
                     "error": f"Failed to decode or save image: {e}",
-                    "api_response": response.json() if 'response' in locals() else 'No response'
+                    "api_response": response_json if 'response_json' in locals() else 'No response'
                 }
             }
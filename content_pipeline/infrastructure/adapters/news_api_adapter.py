@@ -1,41 +1,116 @@
 import os
 import requests
-from typing import List
-from datetime import datetime
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional
+from datetime import datetime, timezone
 
 from content_pipeline.domain.ports.external_service_ports import NewsAggregatorPort, RawNewsArticle
+from content_pipeline.domain.services.circuit_breaker import CircuitBreaker, CircuitOpenError, circuit_breaker
+from content_pipeline.infrastructure.adapters.http_errors import is_outage
+
+# NewsAPI returns at most 100 articles per page
+PAGE_SIZE = 100
+MAX_PAGES = 5
+MAX_WORKERS = 4
+
 
 class NewsAPIAdapter(NewsAggregatorPort):
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, page_size: int = PAGE_SIZE, max_pages: int = MAX_PAGES,
+                 max_workers: int = MAX_WORKERS, breaker: Optional[CircuitBreaker] = None):
         self.api_key = api_key or os.environ.get("NEWS_API_KEY")
         if not self.api_key:
             raise ValueError("News API key not provided or set in environment.")
         self.api_url = "https://newsapi.org/v2/everything"
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.breaker = breaker or circuit_breaker("newsapi")
 
     def fetch_recent_news(self, query: str, since: datetime, language: str = "en") -> List[RawNewsArticle]:
+        return list(self.iter_recent_news([query], since, language))
+
+    def iter_recent_news(
+        self, queries: Iterable[str], since: datetime, language: str = "en"
+    ) -> Iterator[RawNewsArticle]:
+        """
+        Stream articles for several queries, newest first within each page.
+
+        Queries are fetched concurrently, up to max_workers requests at a time,
+        but each query pages in order: page n+1 is only requested once page n
+        has come back full and entirely newer than since, so no request is
+        spent past the since boundary. A query also stops at its last page or
+        at max_pages. Articles are yielded as their page arrives, each URL at
+        most once.
+        """
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        pending = deque((query, 1) for query in dict.fromkeys(queries))
+        seen_urls = set()
+        running = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending or running:
+                # Keep the pool busy, round-robin across queries still paging
+                while pending and len(running) < self.max_workers:
+                    query, page = pending.popleft()
+                    running[executor.submit(self._fetch_page, query, since, language, page)] = (query, page)
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    query, page = running.pop(future)
+                    articles, has_next_page = self._read_page(future, page, since)
+                    if has_next_page:
+                        pending.append((query, page + 1))
+                    yield from self._unseen(articles, seen_urls)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _read_page(self, future, page: int, since: datetime):
+        """Return a fetched page's articles newer than since, and whether to fetch the next page."""
+        try:
+            payload = future.result()
+        except (requests.exceptions.RequestException, CircuitOpenError) as e:
+            print(f"Error calling News API: {e}")
+            return [], False
+
+        articles = [self._to_raw_article(article) for article in payload.get("articles", [])]
+        # Results are sorted newest first; once one is older than since, later pages are older still
+        recent = [article for article in articles if article.published_at >= since]
+        total_pages = -(-payload.get("totalResults", 0) // self.page_size)
+        has_next_page = len(recent) == self.page_size and page < min(self.max_pages, total_pages)
+        return recent, has_next_page
+
+    @staticmethod
+    def _unseen(articles: List[RawNewsArticle], seen_urls: set) -> Iterator[RawNewsArticle]:
+        for article in articles:
+            if not article.content or article.url in seen_urls:
+                continue
+            seen_urls.add(article.url)
+            yield article
+
+    def _fetch_page(self, query: str, since: datetime, language: str, page: int) -> dict:
         params = {
             "q": query,
             "from": since.isoformat(),
             "language": language,
             "apiKey": self.api_key,
             "sortBy": "publishedAt",
+            "pageSize": self.page_size,
+            "page": page,
         }
-
-        try:
-            response = requests.get(self.api_url, params=params)
+        with self.breaker.guard(is_outage):
+            response = requests.get(self.api_url, params=params, timeout=10)
             response.raise_for_status()
-            articles = response.json().get("articles", [])
-
-            return [
-                RawNewsArticle(
-                    title=article["title"],
-                    content=article["content"],
-                    url=article["url"],
-                    published_at=datetime.fromisoformat(article["publishedAt"].replace("Z", "+00:00")),
-                    source_name=article["source"]["name"]
-                )
-                for article in articles if article["content"]
-            ]
-        except requests.exceptions.RequestException as e:
-            print(f"Error calling News API: {e}")
-            return []
\ No newline at end of file
+        return response.json()
+
+    @staticmethod
+    def _to_raw_article(article: dict) -> RawNewsArticle:
+        return RawNewsArticle(
+            title=article["title"],
+            content=article["content"],
+            url=article["url"],
+            published_at=datetime.fromisoformat(article["publishedAt"].replace("Z", "+00:00")),
+            source_name=article["source"]["name"]
+        )
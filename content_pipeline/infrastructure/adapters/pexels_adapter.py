@@ -2,10 +2,14 @@ import os
 import requests
 from typing import Optional
 
+from content_pipeline.domain.services.circuit_breaker import CircuitBreaker, circuit_breaker
+from content_pipeline.infrastructure.adapters.http_errors import is_outage
+
 
 class PexelsAdapter:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, breaker: Optional[CircuitBreaker] = None):
         self.api_key = api_key or os.environ.get("PEXELS_API_KEY")
+        self.breaker = breaker or circuit_breaker("pexels")
         self.api_url = "https://api.pexels.com/v1/search"
 
     def search_photo(self, query: str) -> Optional[str]:
@@ -23,8 +27,9 @@ class PexelsAdapter:
         }
 
         try:
-            response = requests.get(self.api_url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
+            with self.breaker.guard(is_outage):
+                response = requests.get(self.api_url, headers=headers, params=params, timeout=10)
+                response.raise_for_status()
             data = response.json()
 
             if data.get("photos"):
@@ -0,0 +1,263 @@
+"""
+Local stand-ins for the pipeline's external services, for benchmarking.
+
+Each stand-in answers from a recorded fixture after a simulated delay drawn
+from a log-normal distribution (given as median and p95), and fails a
+configurable share of calls. The Gemini and image stand-ins subclass the
+real adapters and replace only the HTTP round trip, so prompt compaction,
+model routing, usage accounting, response parsing and circuit breakers run
+as in production. Their calls are left out of the Prometheus metrics.
+
+Latencies and failures come from one seeded random generator per service,
+so a run with the same seed and article count sees the same draws (in a
+different order when events are processed concurrently).
+"""
+import base64
+import json
+import math
+import os
+import random
+import threading
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import requests
+
+from content_pipeline.domain.ports.external_service_ports import NewsAggregatorPort, RawNewsArticle
+from content_pipeline.domain.services.circuit_breaker import CircuitBreaker
+from content_pipeline.domain.services.prompt_compaction import estimate_tokens
+from content_pipeline.infrastructure.adapters.gemini_api_adapter import GeminiApiAdapter
+from content_pipeline.infrastructure.adapters.gemini_routing import ModelRoute
+from content_pipeline.infrastructure.adapters.image_generation_adapter import ImageGenerationAdapter
+from content_pipeline.infrastructure.adapters.pexels_adapter import PexelsAdapter
+from content_pipeline.infrastructure.adapters.youtube_adapter import YouTubeAdapter
+
+DEFAULT_FIXTURE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'benchmark_fixture.json')
+
+# z-score of the 95th percentile of a standard normal distribution
+_Z_95 = 1.645
+# Gemini bills a generated image as a fixed number of output tokens
+IMAGE_OUTPUT_TOKENS = 1290
+
+
+@dataclass(frozen=True)
+class ServiceProfile:
+    median_ms: float = 0.0
+    p95_ms: float = 0.0
+    error_rate: float = 0.0
+    # Multiplies the length of free-text fixture responses
+    response_scale: float = 1.0
+
+    def sample_latency_ms(self, rng: random.Random) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        sigma = math.log(max(self.p95_ms, self.median_ms) / self.median_ms) / _Z_95
+        return rng.lognormvariate(math.log(self.median_ms), sigma)
+
+
+# Roughly what production sees; override per service or per Gemini task
+# ("gemini.verify_fact") with build_profiles
+DEFAULT_PROFILES: Dict[str, ServiceProfile] = {
+    'news': ServiceProfile(median_ms=400, p95_ms=1200),
+    'gemini': ServiceProfile(median_ms=900, p95_ms=3000, error_rate=0.01),
+    'image_generation': ServiceProfile(median_ms=6000, p95_ms=15000, error_rate=0.02),
+    'pexels': ServiceProfile(median_ms=250, p95_ms=700),
+    'youtube': ServiceProfile(median_ms=300, p95_ms=900),
+}
+
+
+def build_profiles(overrides: Optional[Dict[str, dict]] = None) -> Dict[str, ServiceProfile]:
+    """
+    Default profiles with overrides applied.
+
+    Overrides only need the fields that change, e.g.
+    {"gemini": {"error_rate": 0.1}, "gemini.verify_fact": {"median_ms": 200}};
+    a per-task profile starts from its service's profile.
+    """
+    profiles = dict(DEFAULT_PROFILES)
+    # Services first, so per-task overrides build on the overridden service
+    for name, fields in sorted((overrides or {}).items(), key=lambda item: '.' in item[0]):
+        base = profiles.get(name) or profiles.get(name.split('.', 1)[0], ServiceProfile())
+        profiles[name] = replace(base, **fields)
+    return profiles
+
+
+def load_fixture(path: Optional[str] = None) -> dict:
+    with open(path or DEFAULT_FIXTURE_PATH) as f:
+        return json.load(f)
+
+
+def resize(text: str, scale: float) -> str:
+    """Repeat or cut a text's words to scale its length."""
+    words = text.split()
+    if scale == 1.0 or not words:
+        return text
+    count = max(int(round(len(words) * scale)), 1)
+    return ' '.join(words[i % len(words)] for i in range(count))
+
+
+class _Simulator:
+    """Seeded latency and failure draws for one service."""
+
+    def __init__(self, service: str, profiles: Dict[str, ServiceProfile], seed: int, time_scale: float):
+        self.service = service
+        self.profiles = profiles
+        self.time_scale = time_scale
+        self._rng = random.Random(f"{seed}:{service}")
+        self._lock = threading.Lock()
+
+    def profile(self, task: Optional[str] = None) -> ServiceProfile:
+        return self.profiles.get(f"{self.service}.{task}") or self.profiles.get(self.service, ServiceProfile())
+
+    def call(self, task: Optional[str] = None) -> bool:
+        """Wait out one simulated call; returns False if the call fails."""
+        profile = self.profile(task)
+        with self._lock:
+            latency_ms = profile.sample_latency_ms(self._rng)
+            failed = self._rng.random() < profile.error_rate
+        if latency_ms and self.time_scale:
+            time.sleep(latency_ms * self.time_scale / 1000)
+        return not failed
+
+
+class StandInNewsAggregator(NewsAggregatorPort):
+    """
+    Serves `count` articles built from the fixture's articles.
+
+    Articles past the fixture's own are copies with their words shuffled, so
+    near-duplicate detection does not drop them. URLs carry a per-run token,
+    so every run stages new events.
+    """
+
+    def __init__(self, fixture: dict, count: int, profiles: Optional[Dict[str, ServiceProfile]] = None,
+                 seed: int = 0, time_scale: float = 1.0, run_token: Optional[str] = None):
+        self.simulator = _Simulator('news', profiles or DEFAULT_PROFILES, seed, time_scale)
+        self.run_token = run_token or uuid.uuid4().hex[:12]
+        self.articles = self._build_articles(fixture['articles'], count, seed)
+
+    def _build_articles(self, templates: List[dict], count: int, seed: int) -> List[RawNewsArticle]:
+        rng = random.Random(f"{seed}:articles")
+        now = datetime.now(timezone.utc)
+        articles = []
+        for i in range(count):
+            template = templates[i % len(templates)]
+            content = template['content']
+            if i >= len(templates):
+                words = content.split()
+                rng.shuffle(words)
+                content = ' '.join(words)
+            articles.append(RawNewsArticle(
+                title=template['title'],
+                content=content,
+                url=f"https://benchmark.invalid/{self.run_token}/{i}",
+                published_at=now - timedelta(minutes=i),
+                source_name=template.get('source_name', 'Benchmark'),
+            ))
+        return articles
+
+    def fetch_recent_news(self, query: str, since: datetime, language: str = "en") -> List[RawNewsArticle]:
+        if not self.simulator.call():
+            # Like NewsAPIAdapter, a failed fetch yields no articles
+            return []
+        return [article for article in self.articles if article.published_at >= since]
+
+
+class StandInGeminiApi(GeminiApiAdapter):
+    """GeminiApiAdapter answering from the fixture's responses for each port method."""
+
+    def __init__(self, fixture: dict, profiles: Optional[Dict[str, ServiceProfile]] = None,
+                 seed: int = 0, time_scale: float = 1.0, breaker: Optional[CircuitBreaker] = None, **kwargs):
+        # A private breaker, so injected failures do not open the process-wide one
+        super().__init__(api_key='stand-in', breaker=breaker or CircuitBreaker('stand-in-gemini'), **kwargs)
+        self.responses = fixture['responses']
+        self.simulator = _Simulator('gemini', profiles or DEFAULT_PROFILES, seed, time_scale)
+
+    def _post(self, task: str, route: ModelRoute, headers: dict, data: dict, params: dict) -> dict:
+        if not self.simulator.call(task):
+            raise requests.exceptions.ConnectionError(f"Stand-in failure for {task}")
+        prompt = data['contents'][0]['parts'][0]['text']
+        text = self._response(task, prompt)
+        prompt_tokens, candidate_tokens = estimate_tokens(prompt), estimate_tokens(text)
+        return {
+            'candidates': [{'content': {'parts': [{'text': text}]}}],
+            'usageMetadata': {
+                'promptTokenCount': prompt_tokens,
+                'candidatesTokenCount': candidate_tokens,
+                'totalTokenCount': prompt_tokens + candidate_tokens,
+            },
+        }
+
+    def _record_metrics(self, task: str, model: str, succeeded: bool, usage: Optional[dict]) -> None:
+        pass
+
+    def _response(self, task: str, prompt: str) -> str:
+        """The same prompt always gets the same recorded response."""
+        options = self.responses[task]
+        response = options[zlib.crc32(prompt.encode()) % len(options)]
+        if isinstance(response, dict):
+            return json.dumps(response)
+        scale = self.simulator.profile(task).response_scale
+        if isinstance(response, list):
+            return '\n'.join(resize(line, scale) for line in response)
+        if task in ('adapt_content_for_age', 'generate_educational_context'):
+            return resize(response, scale)
+        return response
+
+
+class StandInImageGeneration(ImageGenerationAdapter):
+    """ImageGenerationAdapter that returns a placeholder path instead of generating and saving an image."""
+
+    # Decoded by the real response handling, then discarded
+    PLACEHOLDER_IMAGE = base64.b64encode(b'benchmark').decode()
+
+    def __init__(self, profiles: Optional[Dict[str, ServiceProfile]] = None, seed: int = 0,
+                 time_scale: float = 1.0, breaker: Optional[CircuitBreaker] = None, **kwargs):
+        super().__init__(api_key='stand-in', breaker=breaker or CircuitBreaker('stand-in-image'), **kwargs)
+        self.simulator = _Simulator('image_generation', profiles or DEFAULT_PROFILES, seed, time_scale)
+
+    def _post(self, headers: dict, data: dict, params: dict) -> dict:
+        if not self.simulator.call():
+            raise requests.exceptions.ConnectionError("Stand-in image generation failure")
+        prompt_tokens = estimate_tokens(data['contents'][0]['parts'][0]['text'])
+        return {
+            'candidates': [{'content': {'parts': [{'inlineData': {'data': self.PLACEHOLDER_IMAGE}}]}}],
+            'usageMetadata': {
+                'promptTokenCount': prompt_tokens,
+                'candidatesTokenCount': IMAGE_OUTPUT_TOKENS,
+                'totalTokenCount': prompt_tokens + IMAGE_OUTPUT_TOKENS,
+            },
+        }
+
+    def _save_image(self, image_bytes: bytes) -> str:
+        return f"benchmark/{uuid.uuid4()}.png"
+
+    def _record_metrics(self, succeeded: bool, usage: Optional[dict]) -> None:
+        pass
+
+
+class StandInPexels(PexelsAdapter):
+    def __init__(self, profiles: Optional[Dict[str, ServiceProfile]] = None, seed: int = 0,
+                 time_scale: float = 1.0):
+        super().__init__(api_key='stand-in', breaker=CircuitBreaker('stand-in-pexels'))
+        self.simulator = _Simulator('pexels', profiles or DEFAULT_PROFILES, seed, time_scale)
+
+    def search_photo(self, query: str) -> Optional[str]:
+        if not self.simulator.call():
+            return None
+        return f"https://images.benchmark.invalid/{zlib.crc32(query.encode())}.jpeg"
+
+
+class StandInYouTube(YouTubeAdapter):
+    def __init__(self, profiles: Optional[Dict[str, ServiceProfile]] = None, seed: int = 0,
+                 time_scale: float = 1.0):
+        super().__init__(api_key='stand-in', breaker=CircuitBreaker('stand-in-youtube'))
+        self.simulator = _Simulator('youtube', profiles or DEFAULT_PROFILES, seed, time_scale)
+
+    def search_video(self, query: str) -> Optional[str]:
+        if not self.simulator.call():
+            return None
+        return f"https://www.youtube.com/watch?v=bench{zlib.crc32(query.encode()):08x}"
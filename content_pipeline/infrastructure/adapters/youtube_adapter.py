@@ -2,10 +2,14 @@ import os
 import requests
 from typing import Optional
 
+from content_pipeline.domain.services.circuit_breaker import CircuitBreaker, circuit_breaker
+from content_pipeline.infrastructure.adapters.http_errors import is_outage
+
 
 class YouTubeAdapter:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, breaker: Optional[CircuitBreaker] = None):
         self.api_key = api_key or os.environ.get("YOUTUBE_API_KEY")
+        self.breaker = breaker or circuit_breaker("youtube")
         self.api_url = "https://www.googleapis.com/youtube/v3/search"
 
     def search_video(self, query: str) -> Optional[str]:
@@ -25,8 +29,9 @@ class YouTubeAdapter:
         }
 
         try:
-            response = requests.get(self.api_url, params=params, timeout=10)
-            response.raise_for_status()
+            with self.breaker.guard(is_outage):
+                response = requests.get(self.api_url, params=params, timeout=10)
+                response.raise_for_status()
             data = response.json()
 
             items = data.get("items", [])
@@ -0,0 +1,32 @@
+"""
+Prometheus counters for the content pipeline, served at /metrics by django-prometheus.
+
+Counters live in the process that makes the calls. When qcluster workers run
+as separate processes from the web server, set PROMETHEUS_MULTIPROC_DIR so
+/metrics aggregates them.
+"""
+from typing import Optional
+
+from prometheus_client import Counter
+
+LLM_CALLS = Counter(
+    'bookofmonth_llm_calls_total', 'Gemini calls by port method, model and outcome.',
+    ['task', 'model', 'outcome'],
+)
+LLM_TOKENS = Counter(
+    'bookofmonth_llm_tokens_total', 'Gemini tokens by port method, model and kind (prompt or candidates).',
+    ['task', 'model', 'kind'],
+)
+LLM_COST = Counter(
+    'bookofmonth_llm_estimated_cost_usd_total', 'Estimated Gemini cost in USD by port method and model.',
+    ['task', 'model'],
+)
+
+
+def record_llm_call(task: str, model: str, succeeded: bool, usage: Optional[dict] = None) -> None:
+    """Count one call and, when the response reported usage, its tokens and cost."""
+    LLM_CALLS.labels(task=task, model=model, outcome='ok' if succeeded else 'failed').inc()
+    if usage:
+        LLM_TOKENS.labels(task=task, model=model, kind='prompt').inc(usage['prompt_tokens'])
+        LLM_TOKENS.labels(task=task, model=model, kind='candidates').inc(usage['candidate_tokens'])
+        LLM_COST.labels(task=task, model=model).inc(usage['estimated_cost'])
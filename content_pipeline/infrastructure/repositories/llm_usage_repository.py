@@ -0,0 +1,49 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from content_pipeline.domain.ports.repository_ports import LLMUsageRepositoryPort
+from content_pipeline.models import LLMUsageRun
+
+
+class DjangoLLMUsageRepository(LLMUsageRepositoryPort):
+    def save_run(self, run_id: str, kind: str, usage: dict) -> None:
+        totals = usage['totals']
+        LLMUsageRun.objects.update_or_create(
+            run_id=run_id,
+            defaults={
+                'kind': kind,
+                'calls': totals['calls'],
+                'prompt_tokens': totals['prompt_tokens'],
+                'candidate_tokens': totals['candidate_tokens'],
+                'total_tokens': totals['total_tokens'],
+                'estimated_cost': Decimal(str(round(totals['estimated_cost'], 6))),
+                'breakdown': {key: value for key, value in usage.items() if key != 'totals'},
+            },
+        )
+
+    def list_runs(self, limit: int = 20, since: Optional[datetime] = None) -> List[dict]:
+        queryset = LLMUsageRun.objects.all()
+        if since is not None:
+            queryset = queryset.filter(created_at__gte=since)
+        return [self._to_dict(run) for run in queryset[:limit]]
+
+    def get_run(self, run_id: str) -> Optional[dict]:
+        run = LLMUsageRun.objects.filter(run_id=run_id).first()
+        return self._to_dict(run) if run else None
+
+    @staticmethod
+    def _to_dict(run: LLMUsageRun) -> dict:
+        return {
+            'run_id': run.run_id,
+            'kind': run.kind,
+            'created_at': run.created_at,
+            'totals': {
+                'calls': run.calls,
+                'prompt_tokens': run.prompt_tokens,
+                'candidate_tokens': run.candidate_tokens,
+                'total_tokens': run.total_tokens,
+                'estimated_cost': float(run.estimated_cost),
+            },
+            **run.breakdown,
+        }
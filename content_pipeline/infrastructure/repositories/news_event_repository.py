@@ -1,16 +1,76 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+from datetime import timedelta
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
 from content_pipeline.domain.ports.repository_ports import NewsEventRepositoryPort
-from content_pipeline.domain.entities import NewsEvent
-from content_pipeline.domain.value_objects import Category, Fact, GeographicLocation, AgeRange
+from content_pipeline.domain.entities import NewsEvent, IN_PROGRESS_STATUSES
+from content_pipeline.domain.services.near_duplicate import FINGERPRINT_BITS, bands, is_near_duplicate
+from content_pipeline.domain.value_objects import Category, Fact, GeographicLocation, AgeRange, EventStatistics
 from content_pipeline.models import NewsEventModel
 import json
 
+# Columns needed to assemble books; article bodies are left in the database.
+SUMMARY_FIELDS = (
+    'id', 'title', 'source_url', 'published_at', 'extracted_facts', 'categories',
+    'geographic_locations', 'age_appropriateness', 'is_verified', 'processing_status',
+    'image_url', 'video_url', 'created_at', 'updated_at',
+)
+
+# One scan of the range feeds every guide statistic: the event count, category
+# counts and the distinct countries and age ranges.
+MONTH_STATISTICS_SQL = """
+WITH range_events AS (
+    SELECT categories, geographic_locations, age_appropriateness
+    FROM news_events
+    WHERE published_at >= %s AND published_at < %s{status_filter}
+)
+SELECT 'event', NULL, COUNT(*) FROM range_events
+UNION ALL
+SELECT 'category', category.value, COUNT(*)
+FROM range_events, jsonb_array_elements_text(
+    CASE WHEN jsonb_typeof(range_events.categories) = 'array'
+         THEN range_events.categories ELSE '[]'::jsonb END
+) AS category(value)
+GROUP BY category.value
+UNION ALL
+SELECT 'country', location.value ->> 'country', COUNT(*)
+FROM range_events, jsonb_array_elements(
+    CASE WHEN jsonb_typeof(range_events.geographic_locations) = 'array'
+         THEN range_events.geographic_locations ELSE '[]'::jsonb END
+) AS location(value)
+WHERE location.value ->> 'country' IS NOT NULL
+GROUP BY location.value ->> 'country'
+UNION ALL
+SELECT 'age', age_appropriateness, COUNT(*)
+FROM range_events
+WHERE age_appropriateness IS NOT NULL
+GROUP BY age_appropriateness
+"""
+
+def _to_signed(fingerprint: int) -> int:
+    """Postgres bigint is signed; store the unsigned 64-bit fingerprint in its range."""
+    return fingerprint - (1 << FINGERPRINT_BITS) if fingerprint >= 1 << (FINGERPRINT_BITS - 1) else fingerprint
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << FINGERPRINT_BITS) if value < 0 else value
+
+
 class DjangoNewsEventRepository(NewsEventRepositoryPort):
     def _to_domain_entity(self, model: NewsEventModel) -> NewsEvent:
+        # Deferred columns (see SUMMARY_FIELDS) map to empty values instead of
+        # triggering a query per row.
+        deferred = model.get_deferred_fields()
+
+        def loaded(name, default=None):
+            return default if name in deferred else getattr(model, name)
+
         return NewsEvent(
             id=str(model.id),
             title=model.title,
-            raw_content=model.raw_content,
+            raw_content=loaded('raw_content', ''),
             source_url=model.source_url,
             published_at=model.published_at,
             extracted_facts=[Fact(**f) for f in model.extracted_facts] if model.extracted_facts else [],
@@ -21,8 +81,11 @@ class DjangoNewsEventRepository(NewsEventRepositoryPort):
             processing_status=model.processing_status,
             image_path=model.image_url,
             video_url=model.video_url,
-            fun_facts=model.fun_facts if model.fun_facts else [],
-            discussion_questions=model.discussion_questions if model.discussion_questions else [],
+            fun_facts=loaded('fun_facts') or [],
+            discussion_questions=loaded('discussion_questions') or [],
+            completed_stages=loaded('completed_stages') or {},
+            simhash=_to_unsigned(model.simhash) if loaded('simhash') is not None else None,
+            source_content=loaded('source_content', ''),
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -47,8 +110,19 @@ class DjangoNewsEventRepository(NewsEventRepositoryPort):
         model.video_url = entity.video_url
         model.fun_facts = entity.fun_facts if entity.fun_facts else []
         model.discussion_questions = entity.discussion_questions if entity.discussion_questions else []
+        model.completed_stages = entity.completed_stages or {}
+        self.set_simhash_fields(model, entity.simhash)
+        # Never cleared, so an entity loaded without the column keeps it
+        model.source_content = entity.source_content or model.source_content
         return model
 
+    @staticmethod
+    def set_simhash_fields(model: NewsEventModel, simhash: Optional[int]) -> None:
+        band_values = bands(simhash) if simhash is not None else (None,) * 4
+        model.simhash = _to_signed(simhash) if simhash is not None else None
+        (model.simhash_band_0, model.simhash_band_1,
+         model.simhash_band_2, model.simhash_band_3) = band_values
+
     def get_by_id(self, event_id: str) -> Optional[NewsEvent]:
         try:
             model = NewsEventModel.objects.get(id=event_id)
@@ -56,20 +130,180 @@ class DjangoNewsEventRepository(NewsEventRepositoryPort):
         except NewsEventModel.DoesNotExist:
             return None
 
+    def get_by_ids(self, event_ids: Iterable[str]) -> List[NewsEvent]:
+        event_ids = [str(event_id) for event_id in event_ids]
+        models = {str(model.id): model for model in NewsEventModel.objects.filter(id__in=event_ids)}
+        return [self._to_domain_entity(models[event_id]) for event_id in event_ids if event_id in models]
+
     def save(self, news_event: NewsEvent) -> None:
         model = self._to_orm_model(news_event)
         model.save()
 
     def get_events_for_processing(self) -> List[NewsEvent]:
-        models = NewsEventModel.objects.filter(processing_status__in=["RAW", "PENDING_REPROCESS"]).order_by('published_at')
+        models = NewsEventModel.objects.filter(processing_status__in=IN_PROGRESS_STATUSES).order_by('published_at')
         return [self._to_domain_entity(model) for model in models]
 
-    def get_events_for_month(self, year: int, month: int) -> List[NewsEvent]:
-        models = NewsEventModel.objects.filter(
-            published_at__year=year,
-            published_at__month=month,
-        ).order_by('published_at')
-        return [self._to_domain_entity(model) for model in models]
+    def iter_events_in_range(
+        self,
+        start: datetime,
+        end: datetime,
+        statuses: Optional[Iterable[str]] = None,
+        chunk_size: int = 500,
+        updated_after: Optional[datetime] = None,
+    ) -> Iterator[NewsEvent]:
+        queryset = NewsEventModel.objects.filter(published_at__gte=start, published_at__lt=end)
+        if statuses:
+            queryset = queryset.filter(processing_status__in=list(statuses))
+        if updated_after is not None:
+            queryset = queryset.filter(updated_at__gte=updated_after)
+        queryset = queryset.only(*SUMMARY_FIELDS).order_by('published_at', 'id')
+
+        # Keyset pagination: each chunk is its own bounded query, so memory stays
+        # flat even though server-side cursors are disabled behind PgBouncer.
+        last_key = None
+        while True:
+            page = queryset
+            if last_key is not None:
+                published_at, event_id = last_key
+                page = page.filter(
+                    Q(published_at__gt=published_at) | Q(published_at=published_at, id__gt=event_id)
+                )
+
+            fetched = 0
+            for model in page[:chunk_size].iterator(chunk_size=chunk_size):
+                fetched += 1
+                last_key = (model.published_at, model.id)
+                yield self._to_domain_entity(model)
+
+            if fetched < chunk_size:
+                break
+
+    def find_near_duplicate(self, simhash: int, exclude_id: Optional[str] = None) -> Optional[str]:
+        # Each band is an indexed equality lookup; only the few rows sharing a
+        # band with the fingerprint are compared bit by bit
+        band_0, band_1, band_2, band_3 = bands(simhash)
+        candidates = NewsEventModel.objects.filter(
+            Q(simhash_band_0=band_0) | Q(simhash_band_1=band_1)
+            | Q(simhash_band_2=band_2) | Q(simhash_band_3=band_3)
+        )
+        if exclude_id is not None:
+            candidates = candidates.exclude(id=exclude_id)
+        for event_id, stored in candidates.order_by('published_at').values_list('id', 'simhash'):
+            if is_near_duplicate(simhash, _to_unsigned(stored)):
+                return str(event_id)
+        return None
 
     def update_processing_status(self, event_id: str, status: str) -> None:
         NewsEventModel.objects.filter(id=event_id).update(processing_status=status)
+
+    def _claimable(self, now):
+        return Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lt=now)
+
+    def claim_events_for_processing(
+        self,
+        worker_id: str,
+        batch_size: int,
+        lease_seconds: int,
+        exclude_ids: Iterable[str] = (),
+    ) -> List[NewsEvent]:
+        now = timezone.now()
+
+        # SKIP LOCKED lets concurrent workers claim disjoint batches without
+        # waiting on each other; the lease keeps the rows theirs after commit.
+        with transaction.atomic():
+            ids = list(
+                NewsEventModel.objects.select_for_update(skip_locked=True)
+                .filter(processing_status__in=IN_PROGRESS_STATUSES)
+                .filter(self._claimable(now))
+                .exclude(id__in=list(exclude_ids))
+                .order_by('published_at')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                return []
+            NewsEventModel.objects.filter(id__in=ids).update(
+                lease_owner=worker_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+            )
+
+        return [self._to_domain_entity(model) for model in NewsEventModel.objects.filter(id__in=ids).order_by('published_at')]
+
+    def claim_event(self, event_id: str, worker_id: str, lease_seconds: int) -> bool:
+        now = timezone.now()
+        claimed = NewsEventModel.objects.filter(id=event_id).filter(
+            self._claimable(now) | Q(lease_owner=worker_id)
+        ).update(lease_owner=worker_id, lease_expires_at=now + timedelta(seconds=lease_seconds))
+        return claimed == 1
+
+    def release_event(self, event_id: str, worker_id: str, retry_after_seconds: Optional[int] = None) -> None:
+        lease_expires_at = timezone.now() + timedelta(seconds=retry_after_seconds) if retry_after_seconds else None
+        NewsEventModel.objects.filter(id=event_id, lease_owner=worker_id).update(
+            lease_owner='', lease_expires_at=lease_expires_at
+        )
+
+    def iter_event_versions_in_range(
+        self,
+        start: datetime,
+        end: datetime,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, datetime]]:
+        queryset = NewsEventModel.objects.filter(published_at__gte=start, published_at__lt=end)
+        if statuses:
+            queryset = queryset.filter(processing_status__in=list(statuses))
+        rows = queryset.order_by('published_at', 'id').values_list('id', 'updated_at')
+        for event_id, updated_at in rows.iterator(chunk_size=2000):
+            yield str(event_id), updated_at
+
+    def get_statistics_in_range(
+        self,
+        start: datetime,
+        end: datetime,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> EventStatistics:
+        if connection.vendor == 'postgresql':
+            return self._aggregate_statistics_sql(start, end, statuses)
+        return self._aggregate_statistics_python(start, end, statuses)
+
+    def _aggregate_statistics_sql(self, start, end, statuses) -> EventStatistics:
+        params = [start, end]
+        status_filter = ''
+        if statuses:
+            statuses = list(statuses)
+            status_filter = ' AND processing_status IN (%s)' % ', '.join(['%s'] * len(statuses))
+            params.extend(statuses)
+
+        with connection.cursor() as cursor:
+            cursor.execute(MONTH_STATISTICS_SQL.format(status_filter=status_filter), params)
+            rows = cursor.fetchall()
+
+        statistics = EventStatistics()
+        for kind, value, count in rows:
+            if kind == 'event':
+                statistics.event_count = count
+            elif kind == 'category' and value in Category.__members__:
+                statistics.category_counts[Category[value]] = count
+            elif kind == 'country':
+                statistics.countries.add(value)
+            elif kind == 'age' and value in AgeRange.__members__:
+                statistics.age_ranges.add(AgeRange[value])
+        return statistics
+
+    def _aggregate_statistics_python(self, start, end, statuses) -> EventStatistics:
+        queryset = NewsEventModel.objects.filter(published_at__gte=start, published_at__lt=end)
+        if statuses:
+            queryset = queryset.filter(processing_status__in=list(statuses))
+        rows = queryset.order_by().values_list('categories', 'geographic_locations', 'age_appropriateness')
+
+        statistics = EventStatistics()
+        for categories, locations, age_appropriateness in rows.iterator(chunk_size=2000):
+            statistics.event_count += 1
+            for name in categories or []:
+                if name in Category.__members__:
+                    category = Category[name]
+                    statistics.category_counts[category] = statistics.category_counts.get(category, 0) + 1
+            for location in locations or []:
+                if isinstance(location, dict) and location.get('country'):
+                    statistics.countries.add(location['country'])
+            if age_appropriateness in AgeRange.__members__:
+                statistics.age_ranges.add(AgeRange[age_appropriateness])
+        return statistics
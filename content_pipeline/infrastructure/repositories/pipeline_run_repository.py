@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Optional
+
+from django.utils import timezone
+
+from content_pipeline.domain.ports.repository_ports import PipelineRunRepositoryPort
+from content_pipeline.models import PipelineRun
+
+# Use-case stats keys and the PipelineRun columns they are stored in
+STAGING_FIELDS = {
+    'fetched': 'articles_fetched',
+    'skipped_existing': 'skipped_existing',
+    'skipped_near_duplicate': 'skipped_near_duplicate',
+    'skipped_too_old': 'skipped_too_old',
+    'staged': 'articles_staged',
+}
+PROCESSING_FIELDS = {
+    'processed': 'events_processed',
+    'failed': 'events_failed',
+    'rejected_unsafe': 'rejected_unsafe',
+    'failed_chunks': 'failed_chunks',
+}
+
+
+class DjangoPipelineRunRepository(PipelineRunRepositoryPort):
+    def start_run(self, run_id: str, kind: str, started_at: Optional[datetime] = None) -> None:
+        PipelineRun.objects.update_or_create(
+            run_id=run_id, defaults={'kind': kind, 'started_at': started_at or timezone.now()}
+        )
+
+    def record_staging(self, run_id: str, stats: dict) -> None:
+        PipelineRun.objects.filter(run_id=run_id).update(
+            staged_at=timezone.now(),
+            **{field: stats.get(key, 0) for key, field in STAGING_FIELDS.items()},
+        )
+
+    def finish_run(self, run_id: str, stats: dict, stage_latency: dict) -> None:
+        PipelineRun.objects.filter(run_id=run_id).update(
+            status=PipelineRun.STATUS_FINISHED,
+            finished_at=timezone.now(),
+            stage_latency=stage_latency,
+            **{field: stats.get(key, 0) for key, field in PROCESSING_FIELDS.items()},
+        )
@@ -0,0 +1,58 @@
+from typing import Iterator, Optional, Tuple
+
+from django.db.models import Q
+from django.db.models.fields.json import KT
+
+from content_pipeline.domain.entities import PUBLISHED_STATUSES, STATUS_REJECTED
+from content_pipeline.domain.ports.repository_ports import PrescreenModelRepositoryPort
+from content_pipeline.domain.services.prescreen import (
+    DECIDED_BY_GEMINI, HashedNaiveBayes, LABEL_SAFE, LABEL_UNSAFE, SAFETY_DECISION,
+)
+from content_pipeline.models import NewsEventModel, PrescreenModel
+
+
+# Parsed models by name, keyed by the row they were loaded from. Parameters
+# run to megabytes of JSON, so they are only read again once a newer model
+# has been trained.
+_loaded = {}
+
+
+class DjangoPrescreenModelRepository(PrescreenModelRepositoryPort):
+    def get_latest(self, name: str) -> Optional[HashedNaiveBayes]:
+        latest = PrescreenModel.objects.filter(name=name).order_by('-trained_at').values_list(
+            'pk', 'trained_at'
+        ).first()
+        if latest is None:
+            return None
+        cached = _loaded.get(name)
+        if cached is None or cached[0] != latest:
+            parameters = PrescreenModel.objects.values_list('parameters', flat=True).get(pk=latest[0])
+            cached = _loaded[name] = (latest, HashedNaiveBayes.from_dict(parameters))
+        return cached[1]
+
+    def save(self, name: str, model: HashedNaiveBayes, sample_count: int, metrics: dict) -> None:
+        PrescreenModel.objects.create(
+            name=name, parameters=model.to_dict(), sample_count=sample_count, metrics=metrics
+        )
+
+    def iter_training_samples(self) -> Iterator[Tuple[str, str, str, Optional[str], Optional[str]]]:
+        # Trained on the text as fetched: published events' raw_content is the
+        # adapted story, which would teach the models writing style, not safety
+        safety_by = f'completed_stages__{SAFETY_DECISION}__decided_by'
+        category_by = 'completed_stages__categorize__decided_by'
+        rows = NewsEventModel.objects.filter(
+            Q(**{safety_by: DECIDED_BY_GEMINI}) | Q(**{category_by: DECIDED_BY_GEMINI}),
+            processing_status__in=list(PUBLISHED_STATUSES) + [STATUS_REJECTED],
+        ).exclude(source_content='').annotate(
+            safety_by=KT(safety_by), category_by=KT(category_by),
+        ).order_by('id').values_list(
+            'id', 'title', 'source_content', 'processing_status', 'categories', 'safety_by', 'category_by'
+        )
+        for event_id, title, content, status, categories, safety_decider, category_decider in rows.iterator(
+            chunk_size=2000
+        ):
+            label = None
+            if safety_decider == DECIDED_BY_GEMINI:
+                label = LABEL_UNSAFE if status == STATUS_REJECTED else LABEL_SAFE
+            category = categories[0] if categories and category_decider == DECIDED_BY_GEMINI else None
+            yield str(event_id), title, content, label, category
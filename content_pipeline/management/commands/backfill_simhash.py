@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+
+from content_pipeline.domain.entities import STATUS_CATEGORIZED, STATUS_RAW, STATUS_REJECTED
+from content_pipeline.domain.services.near_duplicate import simhash
+from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+from content_pipeline.models import NewsEventModel
+
+# Statuses whose raw_content is still the article as fetched; later ones hold
+# the adapted story
+UNADAPTED_STATUSES = (STATUS_RAW, STATUS_CATEGORIZED, STATUS_REJECTED)
+
+
+class Command(BaseCommand):
+    help = ('Computes near-duplicate fingerprints for news events stored before they existed, '
+            'from the article text as fetched. Events adapted before that text was kept are '
+            'fingerprinted from their title alone, since their stored content is the adapted story.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Events updated per query.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        pending = NewsEventModel.objects.filter(simhash__isnull=True).only(
+            'id', 'title', 'raw_content', 'source_content', 'processing_status'
+        )
+        updated = 0
+        last_id = None
+
+        while True:
+            page = pending.order_by('id')
+            if last_id is not None:
+                page = page.filter(id__gt=last_id)
+            models = list(page[:batch_size])
+            if not models:
+                break
+            for model in models:
+                DjangoNewsEventRepository.set_simhash_fields(model, simhash(model.title, self._source_text(model)))
+            NewsEventModel.objects.bulk_update(
+                models, ['simhash', 'simhash_band_0', 'simhash_band_1', 'simhash_band_2', 'simhash_band_3']
+            )
+            updated += len(models)
+            last_id = models[-1].id
+
+        self.stdout.write(self.style.SUCCESS(f"Fingerprinted {updated} events."))
+
+    @staticmethod
+    def _source_text(model):
+        if model.source_content:
+            return model.source_content
+        return model.raw_content if model.processing_status in UNADAPTED_STATUSES else ''
@@ -0,0 +1,258 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from content_pipeline.application.use_cases.ingest_news_events_use_case import IngestNewsEventsUseCase
+from content_pipeline.application.use_cases.reprocess_events_use_case import ReprocessEventsUseCase
+from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+from content_pipeline.domain.services.llm_usage import UsageLedger
+from content_pipeline.domain.services.stage_graph import summarize_stage_timings
+from content_pipeline.infrastructure.adapters.gemini_routing import summarize
+from content_pipeline.infrastructure.adapters.stand_ins import (
+    StandInGeminiApi,
+    StandInImageGeneration,
+    StandInNewsAggregator,
+    StandInPexels,
+    StandInYouTube,
+    build_profiles,
+    load_fixture,
+)
+from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+from content_pipeline.models import NewsEventModel
+from content_pipeline.tasks import route_stats, usage_snapshot
+
+
+class QueryCounter:
+    """execute_wrapper that counts queries and their time across threads."""
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.queries += 1
+                self.seconds += elapsed
+
+
+class Command(BaseCommand):
+    help = ('Benchmarks ingestion against local stand-ins for NewsAPI, Gemini, Pexels and YouTube, '
+            'reporting throughput, per-stage latency and database queries. No API quota is used. '
+            'Benchmark events are written to the configured database, so it only runs with DEBUG on '
+            'unless --allow-non-debug is given.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--articles',
+            type=int,
+            default=20,
+            help='Number of articles the stand-in news aggregator serves.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=1,
+            help='Events processed at once, each on its own thread and database connection.',
+        )
+        parser.add_argument(
+            '--profile',
+            help='Latency/error/response-size overrides as JSON, or a path to a JSON file, e.g. '
+                 '\'{"gemini": {"median_ms": 500, "p95_ms": 2000, "error_rate": 0.05}}\'.',
+        )
+        parser.add_argument(
+            '--fixture',
+            help='Recorded articles and responses to serve (defaults to the bundled fixture).',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed for simulated latencies and failures.',
+        )
+        parser.add_argument(
+            '--time-scale',
+            type=float,
+            default=1.0,
+            help='Multiplier for simulated latencies; 0 measures pipeline overhead alone.',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the report as JSON.',
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='Keep the benchmark events instead of deleting them afterwards.',
+        )
+        parser.add_argument(
+            '--allow-non-debug',
+            action='store_true',
+            help='Run with DEBUG off, e.g. against a staging database.',
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['allow_non_debug']:
+            raise CommandError(
+                'DEBUG is off, so this may be a production database; benchmark events are written to it '
+                'as PROCESSED. Pass --allow-non-debug to run anyway.'
+            )
+        if options['articles'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--articles and --concurrency must be at least 1')
+        profiles = build_profiles(self._load_profile(options['profile']))
+        fixture = load_fixture(options['fixture'])
+        stand_in = {'profiles': profiles, 'seed': options['seed'], 'time_scale': options['time_scale']}
+
+        usage = UsageLedger()
+        gemini_api = StandInGeminiApi(fixture, usage=usage, **stand_in)
+        image_generation = StandInImageGeneration(usage=usage, **stand_in)
+        news_aggregator = StandInNewsAggregator(fixture, options['articles'], **stand_in)
+        news_event_repository = DjangoNewsEventRepository()
+        service = ContentProcessingService(
+            gemini_api=gemini_api,
+            image_generation=image_generation,
+            pexels=StandInPexels(**stand_in),
+            youtube=StandInYouTube(**stand_in),
+        )
+        use_case = IngestNewsEventsUseCase(
+            news_aggregator=news_aggregator,
+            news_event_repository=news_event_repository,
+            content_processing_service=service,
+            gemini_api=gemini_api,
+            image_generation=image_generation,
+            event_processor=ReprocessEventsUseCase(news_event_repository, service),
+        )
+
+        pipeline_logger = logging.getLogger('content_pipeline')
+        level = pipeline_logger.level
+        if options['verbosity'] < 2:
+            # Per-event logging would drown the report and slow the run
+            pipeline_logger.setLevel(logging.WARNING)
+        try:
+            report = self._run(use_case, options['concurrency'])
+        finally:
+            pipeline_logger.setLevel(level)
+            if not options['keep']:
+                NewsEventModel.objects.filter(
+                    source_url__startswith=f"https://benchmark.invalid/{news_aggregator.run_token}/"
+                ).delete()
+
+        report['config'] = {key: options[key] for key in ('articles', 'concurrency', 'seed', 'time_scale')}
+        report['stages'] = summarize_stage_timings(
+            timing for _, timings in use_case.stage_timings for timing in timings
+        )
+        report['routes'] = summarize(route_stats(gemini_api, image_generation))
+        report['usage'] = usage_snapshot(gemini_api)['totals']
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
+        else:
+            self._print(report)
+
+    @staticmethod
+    def _load_profile(value):
+        if not value:
+            return {}
+        try:
+            if os.path.exists(value):
+                with open(value) as f:
+                    return json.load(f)
+            return json.loads(value)
+        except ValueError as e:
+            raise CommandError(f"Invalid --profile: {e}")
+
+    def _run(self, use_case, concurrency):
+        staging_queries = QueryCounter()
+        started = time.perf_counter()
+        with connection.execute_wrapper(staging_queries):
+            event_ids = use_case.stage_articles(['benchmark'])
+        staging_seconds = time.perf_counter() - started
+
+        processing_queries = QueryCounter()
+
+        def process(event_id):
+            with connection.execute_wrapper(processing_queries):
+                return use_case.process_staged(event_id)
+
+        def process_on_own_connection(event_id):
+            try:
+                return process(event_id)
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        if concurrency == 1:
+            for event_id in event_ids:
+                process(event_id)
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(process_on_own_connection, event_ids))
+        processing_seconds = time.perf_counter() - started
+
+        events = len(event_ids)
+        total_seconds = staging_seconds + processing_seconds
+        return {
+            'staging': dict(use_case.stats),
+            'processing': dict(use_case.event_processor.stats),
+            'seconds': {
+                'staging': round(staging_seconds, 3),
+                'processing': round(processing_seconds, 3),
+                'total': round(total_seconds, 3),
+            },
+            'articles_per_second': round(events / total_seconds, 2) if total_seconds else None,
+            'queries': {
+                'staging': staging_queries.queries,
+                'processing': processing_queries.queries,
+                'per_article': round((staging_queries.queries + processing_queries.queries) / events, 1)
+                if events else None,
+                'seconds': round(staging_queries.seconds + processing_queries.seconds, 3),
+            },
+        }
+
+    def _print(self, report):
+        config = report['config']
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{config['articles']} articles, concurrency {config['concurrency']}, "
+            f"seed {config['seed']}, time scale {config['time_scale']}"
+        ))
+        self.stdout.write("Staging: " + ", ".join(f"{k}={v}" for k, v in sorted(report['staging'].items())))
+        self.stdout.write("Processing: " + ", ".join(f"{k}={v}" for k, v in sorted(report['processing'].items())))
+        seconds, queries = report['seconds'], report['queries']
+        self.stdout.write(
+            f"Time: {seconds['staging']:.2f}s staging + {seconds['processing']:.2f}s processing; "
+            f"{report['articles_per_second']} articles/s"
+        )
+        self.stdout.write(
+            f"Queries: {queries['staging']} staging + {queries['processing']} processing "
+            f"({queries['per_article']} per article, {queries['seconds']:.2f}s in the database)"
+        )
+        self.stdout.write(f"  {'stage':<16} {'ok':>5} {'failed':>7} {'skipped':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+        for stage, row in report['stages'].items():
+            latencies = ' '.join(
+                f"{row[key]:>7.3f}s" if row[key] is not None else f"{'-':>8}"
+                for key in ('p50_seconds', 'p95_seconds', 'max_seconds')
+            )
+            self.stdout.write(f"  {stage:<16} {row['ok']:>5} {row['failed']:>7} {row['skipped']:>8} {latencies}")
+        for task, route in report['routes'].items():
+            self.stdout.write(
+                f"  {task:<30} {route['calls']:>5} calls  {route['failure_rate']:6.1%} failed  "
+                f"{route['mean_latency_ms']:7.0f} ms mean"
+            )
+        usage = report['usage']
+        self.stdout.write(
+            f"Simulated LLM usage: {usage['calls']} calls, {usage['total_tokens']:,} tokens, "
+            f"~${usage['estimated_cost']:.4f}"
+        )
@@ -1,14 +1,11 @@
+import uuid
+
 from django.core.management.base import BaseCommand
-from datetime import datetime
 
-from content_pipeline.infrastructure.adapters.news_api_adapter import NewsAPIAdapter
-from content_pipeline.infrastructure.adapters.gemini_api_adapter import GeminiApiAdapter
-from content_pipeline.infrastructure.adapters.image_generation_adapter import ImageGenerationAdapter
-from content_pipeline.infrastructure.adapters.pexels_adapter import PexelsAdapter
-from content_pipeline.infrastructure.adapters.youtube_adapter import YouTubeAdapter
-from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
-from content_pipeline.domain.services.content_processing_service import ContentProcessingService
-from content_pipeline.application.use_cases.ingest_news_events_use_case import IngestNewsEventsUseCase
+from content_pipeline.infrastructure.repositories.pipeline_run_repository import DjangoPipelineRunRepository
+from content_pipeline.domain.services.stage_graph import summarize_stage_timings
+from content_pipeline.infrastructure.adapters.gemini_routing import summarize
+from content_pipeline.tasks import build_ingest_use_case, record_usage_run, route_stats, tokens_saved, usage_snapshot
 
 
 class Command(BaseCommand):
@@ -17,9 +14,9 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
             '--query',
-            type=str,
-            help='Search query for news aggregation.',
-            default='world news for children',
+            dest='queries',
+            action='append',
+            help='Search query for news aggregation; repeat to fetch several topics at once.',
         )
         parser.add_argument(
             '--days-ago',
@@ -27,38 +24,50 @@ class Command(BaseCommand):
             help='Number of days ago to fetch news from.',
             default=1,
         )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Finish events left part-way through processing instead of fetching new articles.',
+        )
 
     def handle(self, *args, **options):
         self.stdout.write("Starting news ingestion process...")
 
-        # Initialize infrastructure components
-        news_aggregator = NewsAPIAdapter()
-        gemini_api = GeminiApiAdapter()
-        image_generation = ImageGenerationAdapter()
-        pexels = PexelsAdapter()
-        youtube = YouTubeAdapter()
-        news_event_repository = DjangoNewsEventRepository()
+        # Wired like the scheduled task, so model routes, prompt budgets,
+        # pricing and breaker thresholds all apply
+        ingest_use_case = build_ingest_use_case()
+        gemini_api = ingest_use_case.gemini_api
+        image_generation = ingest_use_case.image_generation
 
-        # Initialize domain service with all adapters
-        content_processing_service = ContentProcessingService(
-            gemini_api=gemini_api,
-            image_generation=image_generation,
-            pexels=pexels,
-            youtube=youtube,
-        )
+        if options['resume']:
+            ingest_use_case.resume()
+            self.stdout.write(self.style.SUCCESS('Resumed processing completed successfully!'))
+            return
 
-        # Initialize application use case
-        ingest_use_case = IngestNewsEventsUseCase(
-            news_aggregator=news_aggregator,
-            news_event_repository=news_event_repository,
-            content_processing_service=content_processing_service,
-            gemini_api=gemini_api,
-            image_generation=image_generation
-        )
-
-        query = options['query']
+        queries = options['queries'] or ['world news for children']
         days_ago = options['days_ago']
 
-        ingest_use_case.execute(query=query, days_ago=days_ago)
+        run_id = f"ingest-{uuid.uuid4().hex}"
+        runs = DjangoPipelineRunRepository()
+        runs.start_run(run_id, 'ingest')
+        event_ids = ingest_use_case.stage_articles(queries, days_ago)
+        runs.record_staging(run_id, ingest_use_case.stats)
+        self.stdout.write(", ".join(f"{key}={count}" for key, count in sorted(ingest_use_case.stats.items())))
+
+        for event_id in event_ids:
+            ingest_use_case.process_staged(event_id)
+        processing_stats = ingest_use_case.event_processor.stats
+        runs.finish_run(run_id, stats=processing_stats, stage_latency=summarize_stage_timings(
+            timing for _, timings in ingest_use_case.stage_timings for timing in timings
+        ))
+        self.stdout.write(", ".join(f"{key}={count}" for key, count in sorted(processing_stats.items())))
 
+        self.stdout.write(f"Prompt compaction saved ~{tokens_saved(gemini_api)} tokens.")
+        record_usage_run(run_id, 'ingest', usage_snapshot(gemini_api, image_generation))
+        self.stdout.write(f"Run recorded as {run_id}; see `manage.py llm_usage --run {run_id}` for token usage.")
+        for task, route in summarize(route_stats(gemini_api, image_generation)).items():
+            self.stdout.write(
+                f"  {task:<30} {route['model']:<24} {route['calls']:>4} calls  "
+                f"{route['failure_rate']:6.1%} failed  {route['mean_latency_ms']:7.0f} ms mean"
+            )
         self.stdout.write(self.style.SUCCESS('News ingestion process completed successfully!'))
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from content_pipeline.domain.services.llm_usage import merge_usage
+from content_pipeline.infrastructure.repositories.llm_usage_repository import DjangoLLMUsageRepository
+
+
+class Command(BaseCommand):
+    help = ('Reports Gemini token usage and estimated cost per ingestion/reprocessing run, '
+            'and which prompts and events were the most expensive.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--run',
+            help='Break down a single run by task, model and event.',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=7,
+            help='Report runs from the last N days.',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help='Maximum number of runs to list.',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            help='Number of most expensive events to show.',
+        )
+
+    def handle(self, *args, **options):
+        repository = DjangoLLMUsageRepository()
+        if options['run']:
+            run = repository.get_run(options['run'])
+            if run is None:
+                raise CommandError(f"No usage recorded for run {options['run']}")
+            self._breakdown(run, options['top'])
+            return
+
+        since = timezone.now() - timedelta(days=options['days'])
+        runs = repository.list_runs(limit=options['limit'], since=since)
+        if not runs:
+            self.stdout.write(f"No runs with LLM usage in the last {options['days']} days.")
+            return
+
+        self.stdout.write(f"{'started':<17} {'kind':<10} {'calls':>6} {'tokens':>11} {'cost':>10}  run")
+        for run in runs:
+            totals = run['totals']
+            self.stdout.write(
+                f"{run['created_at']:%Y-%m-%d %H:%M} {run['kind']:<10} {totals['calls']:>6} "
+                f"{totals['total_tokens']:>11,} {self._cost(totals['estimated_cost'])}  {run['run_id']}"
+            )
+        self._breakdown(merge_usage(*runs), options['top'], heading=f"All {len(runs)} runs listed")
+
+    def _breakdown(self, usage, top, heading=None):
+        totals = usage['totals']
+        self.stdout.write('')
+        self.stdout.write(self.style.MIGRATE_HEADING(heading or f"Run {usage['run_id']} ({usage['kind']})"))
+        self.stdout.write(
+            f"{totals['calls']} calls, {totals['prompt_tokens']:,} prompt + "
+            f"{totals['candidate_tokens']:,} candidate tokens, {self._cost(totals['estimated_cost']).strip()}"
+        )
+        for title, dimension, limit in (('By task', 'by_task', None), ('By model', 'by_model', None),
+                                        ('Most expensive events', 'by_event', top)):
+            rows = sorted(usage.get(dimension, {}).items(), key=lambda item: -item[1]['estimated_cost'])
+            if not rows:
+                continue
+            self.stdout.write(f"  {title}:")
+            for key, row in rows[:limit]:
+                self.stdout.write(
+                    f"    {key:<38} {row['calls']:>5} calls {row['prompt_tokens']:>10,} in "
+                    f"{row['candidate_tokens']:>9,} out {self._cost(row['estimated_cost'])}"
+                )
+
+    @staticmethod
+    def _cost(value):
+        return f"{f'${value:.4f}':>10}"
@@ -8,8 +8,8 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
             '--query',
-            type=str,
-            default='world news for children',
+            dest='queries',
+            action='append',
         )
         parser.add_argument(
             '--days-ago',
@@ -23,4 +23,4 @@ class Command(BaseCommand):
         self.stdout.write(f"Deleted {count} existing stories.")
 
         from django.core.management import call_command
-        call_command('ingest_news', query=options['query'], days_ago=options['days_ago'])
+        call_command('ingest_news', queries=options['queries'], days_ago=options['days_ago'])
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from content_pipeline.tasks import build_reprocess_use_case
+
+
+class Command(BaseCommand):
+    help = ('Processes in-progress news events under a lease. '
+            'Safe to run in several processes or on several nodes at once.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Events leased per claim.',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            help='Stop after this many batches (default: until the backlog is empty).',
+        )
+        parser.add_argument(
+            '--lease-seconds',
+            type=int,
+            help='How long a claimed event stays reserved for this worker.',
+        )
+
+    def handle(self, *args, **options):
+        use_case = build_reprocess_use_case(
+            batch_size=options['batch_size'],
+            lease_seconds=options['lease_seconds'],
+        )
+        self.stdout.write(f"Worker {use_case.worker_id} claiming events...")
+
+        results = use_case.run(max_batches=options['max_batches'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Reprocessing completed: {results['processed']} processed, {results['failed']} failed."
+        ))
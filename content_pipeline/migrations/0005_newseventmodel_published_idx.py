@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content_pipeline", "0004_add_video_url_and_fun_facts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="newseventmodel",
+            index=models.Index(fields=["published_at", "id"], name="news_events_published_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content_pipeline", "0005_newseventmodel_published_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="completed_stages",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content_pipeline", "0006_newseventmodel_completed_stages"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="lease_expires_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="lease_owner",
+            field=models.CharField(blank=True, default="", max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name="newseventmodel",
+            index=models.Index(
+                fields=["processing_status", "lease_expires_at"], name="news_events_claim_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content_pipeline", "0007_newseventmodel_processing_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="simhash",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="simhash_band_0",
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="simhash_band_1",
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="simhash_band_2",
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="simhash_band_3",
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content_pipeline", "0008_newseventmodel_simhash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PrescreenModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("name", models.CharField(max_length=50)),
+                ("parameters", models.JSONField()),
+                ("sample_count", models.PositiveIntegerField(default=0)),
+                ("metrics", models.JSONField(blank=True, default=dict)),
+                ("trained_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "prescreen_models",
+                "indexes": [
+                    models.Index(fields=["name", "-trained_at"], name="prescreen_models_latest_idx")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content_pipeline", "0009_prescreenmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LLMUsageRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("run_id", models.CharField(max_length=100, unique=True)),
+                ("kind", models.CharField(max_length=20)),
+                ("calls", models.PositiveIntegerField(default=0)),
+                ("prompt_tokens", models.BigIntegerField(default=0)),
+                ("candidate_tokens", models.BigIntegerField(default=0)),
+                ("total_tokens", models.BigIntegerField(default=0)),
+                ("estimated_cost", models.DecimalField(decimal_places=6, default=0, max_digits=12)),
+                ("breakdown", models.JSONField(blank=True, default=dict)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "llm_usage_runs",
+                "ordering": ["-created_at"],
+                "indexes": [models.Index(fields=["-created_at"], name="llm_usage_runs_recent_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content_pipeline", "0010_llmusagerun"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PipelineRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("run_id", models.CharField(max_length=100, unique=True)),
+                ("kind", models.CharField(max_length=20)),
+                ("status", models.CharField(default="running", max_length=20)),
+                ("started_at", models.DateTimeField()),
+                ("staged_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("articles_fetched", models.PositiveIntegerField(default=0)),
+                ("skipped_existing", models.PositiveIntegerField(default=0)),
+                ("skipped_near_duplicate", models.PositiveIntegerField(default=0)),
+                ("skipped_too_old", models.PositiveIntegerField(default=0)),
+                ("articles_staged", models.PositiveIntegerField(default=0)),
+                ("rejected_unsafe", models.PositiveIntegerField(default=0)),
+                ("events_processed", models.PositiveIntegerField(default=0)),
+                ("events_failed", models.PositiveIntegerField(default=0)),
+                ("failed_chunks", models.PositiveIntegerField(default=0)),
+                ("stage_latency", models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                "db_table": "pipeline_runs",
+                "ordering": ["-started_at"],
+                "indexes": [
+                    models.Index(fields=["kind", "-started_at"], name="pipeline_runs_recent_idx")
+                ],
+            },
+        ),
+    ]
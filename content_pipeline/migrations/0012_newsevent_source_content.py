@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:48
+
+from django.db import migrations, models
+
+# Statuses whose raw_content has not been replaced by the adapt stage yet
+UNADAPTED_STATUSES = ["RAW", "CATEGORIZED", "REJECTED"]
+
+
+def copy_unadapted_content(apps, schema_editor):
+    NewsEventModel = apps.get_model("content_pipeline", "NewsEventModel")
+    NewsEventModel.objects.filter(processing_status__in=UNADAPTED_STATUSES).update(
+        source_content=models.F("raw_content")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content_pipeline", "0011_pipelinerun"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newseventmodel",
+            name="source_content",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.RunPython(copy_unadapted_content, migrations.RunPython.noop),
+    ]
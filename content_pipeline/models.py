@@ -10,6 +10,9 @@ class NewsEventModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=500)
     raw_content = models.TextField()
+    # The article text as fetched; the adapt stage replaces raw_content with the
+    # age-adapted story, so classifiers and fingerprints use this column
+    source_content = models.TextField(blank=True, default='')
     source_url = models.URLField(max_length=1000)
     published_at = models.DateTimeField()
     # Storing as JSONField for simplicity in MVP. In a more complex scenario,
@@ -25,12 +28,121 @@ class NewsEventModel(models.Model):
     video_url = models.URLField(max_length=1000, null=True, blank=True)
     fun_facts = ListField(default=list)
     content_elements = models.JSONField(default=None, null=True)
+    # Checkpointed stage results, so interrupted processing resumes per stage
+    completed_stages = models.JSONField(default=dict, blank=True)
+    # Processing lease; a worker owns the event until lease_expires_at
+    lease_owner = models.CharField(max_length=100, blank=True, default='')
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    # SimHash of title and content, stored signed, plus its four indexed 16-bit
+    # bands (see content_pipeline/domain/services/near_duplicate.py)
+    simhash = models.BigIntegerField(null=True, blank=True)
+    simhash_band_0 = models.IntegerField(null=True, blank=True, db_index=True)
+    simhash_band_1 = models.IntegerField(null=True, blank=True, db_index=True)
+    simhash_band_2 = models.IntegerField(null=True, blank=True, db_index=True)
+    simhash_band_3 = models.IntegerField(null=True, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'news_events'
         ordering = ['-published_at']
+        indexes = [
+            # Keyset pagination for monthly book assembly
+            models.Index(fields=['published_at', 'id'], name='news_events_published_idx'),
+            # Claiming work for processing
+            models.Index(fields=['processing_status', 'lease_expires_at'], name='news_events_claim_idx'),
+        ]
 
     def __str__(self):
         return self.title
+
+
+class PrescreenModel(models.Model):
+    """A trained pre-screen classifier; the newest row per name is in use."""
+    name = models.CharField(max_length=50)
+    parameters = models.JSONField()
+    sample_count = models.PositiveIntegerField(default=0)
+    # Holdout precision/recall from training
+    metrics = models.JSONField(default=dict, blank=True)
+    trained_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'prescreen_models'
+        indexes = [
+            models.Index(fields=['name', '-trained_at'], name='prescreen_models_latest_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.trained_at:%Y-%m-%d})"
+
+
+class LLMUsageRun(models.Model):
+    """Gemini token usage and estimated cost of one ingestion or reprocessing run."""
+    run_id = models.CharField(max_length=100, unique=True)
+    kind = models.CharField(max_length=20)
+    calls = models.PositiveIntegerField(default=0)
+    prompt_tokens = models.BigIntegerField(default=0)
+    candidate_tokens = models.BigIntegerField(default=0)
+    total_tokens = models.BigIntegerField(default=0)
+    estimated_cost = models.DecimalField(max_digits=12, decimal_places=6, default=0)
+    # Usage by task, model and event (see domain/services/llm_usage.py)
+    breakdown = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'llm_usage_runs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='llm_usage_runs_recent_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.run_id} ({self.total_tokens} tokens)"
+
+
+class PipelineRun(models.Model):
+    """Counters and phase durations of one ingestion or reprocessing run."""
+    STATUS_RUNNING = 'running'
+    STATUS_FINISHED = 'finished'
+
+    run_id = models.CharField(max_length=100, unique=True)
+    kind = models.CharField(max_length=20)
+    status = models.CharField(max_length=20, default=STATUS_RUNNING)
+    started_at = models.DateTimeField()
+    # When fetching and deduplication finished and processing began
+    staged_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    articles_fetched = models.PositiveIntegerField(default=0)
+    skipped_existing = models.PositiveIntegerField(default=0)
+    skipped_near_duplicate = models.PositiveIntegerField(default=0)
+    skipped_too_old = models.PositiveIntegerField(default=0)
+    articles_staged = models.PositiveIntegerField(default=0)
+    rejected_unsafe = models.PositiveIntegerField(default=0)
+    events_processed = models.PositiveIntegerField(default=0)
+    events_failed = models.PositiveIntegerField(default=0)
+    failed_chunks = models.PositiveIntegerField(default=0)
+    # Per-stage outcome counts and p50/p95/max seconds (see summarize_stage_timings)
+    stage_latency = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        db_table = 'pipeline_runs'
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['kind', '-started_at'], name='pipeline_runs_recent_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.run_id} ({self.status})"
+
+    @property
+    def staging_seconds(self):
+        if self.staged_at is None:
+            return None
+        return (self.staged_at - self.started_at).total_seconds()
+
+    @property
+    def processing_seconds(self):
+        if self.finished_at is None:
+            return None
+        return (self.finished_at - (self.staged_at or self.started_at)).total_seconds()
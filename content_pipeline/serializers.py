@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import NewsEventModel
+from .models import NewsEventModel, PipelineRun
 
 
 class NewsEventSerializer(serializers.ModelSerializer):
@@ -35,3 +35,32 @@ class ContentPipelineDailyEntrySerializer(serializers.ModelSerializer):
     class Meta:
         model = NewsEventModel
         fields = ('id', 'title', 'image_url', 'video_url', 'fun_facts', 'discussion_questions', 'content_elements')
+
+
+class PipelineRunSerializer(serializers.ModelSerializer):
+    staging_seconds = serializers.FloatField(read_only=True)
+    processing_seconds = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = PipelineRun
+        fields = (
+            'run_id',
+            'kind',
+            'status',
+            'started_at',
+            'staged_at',
+            'finished_at',
+            'staging_seconds',
+            'processing_seconds',
+            'articles_fetched',
+            'skipped_existing',
+            'skipped_near_duplicate',
+            'skipped_too_old',
+            'articles_staged',
+            'rejected_unsafe',
+            'events_processed',
+            'events_failed',
+            'failed_chunks',
+            'stage_latency',
+        )
+        read_only_fields = fields
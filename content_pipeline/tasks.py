@@ -0,0 +1,304 @@
+# Background Tasks for django-q2
+#
+# Content pipeline tasks. Use `async_task('content_pipeline.tasks.function_name', ...)`
+# to queue them; any number can run at once across workers and instances.
+
+import logging
+import uuid
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Configuration defaults
+CLAIM_BATCH_SIZE = getattr(settings, 'CONTENT_CLAIM_BATCH_SIZE', 10)
+LEASE_SECONDS = getattr(settings, 'CONTENT_LEASE_SECONDS', 600)
+RETRY_DELAY_SECONDS = getattr(settings, 'CONTENT_RETRY_DELAY_SECONDS', 900)
+REPROCESS_MAX_BATCHES = getattr(settings, 'CONTENT_REPROCESS_MAX_BATCHES', 1)
+INGEST_FANOUT = getattr(settings, 'CONTENT_INGEST_FANOUT', True)
+INGEST_CHUNK_SIZE = getattr(settings, 'CONTENT_INGEST_CHUNK_SIZE', 5)
+INGEST_GROUP_TTL = 60 * 60 * 24
+NEWS_QUERIES = getattr(settings, 'CONTENT_NEWS_QUERIES', ['world news for children'])
+PRESCREEN_SAFETY_THRESHOLD = getattr(settings, 'CONTENT_PRESCREEN_SAFETY_THRESHOLD', 0.99)
+PRESCREEN_CATEGORY_THRESHOLD = getattr(settings, 'CONTENT_PRESCREEN_CATEGORY_THRESHOLD', 0.95)
+PROMPT_TOKEN_BUDGETS = getattr(settings, 'CONTENT_PROMPT_TOKEN_BUDGETS', {})
+MODEL_ROUTES = getattr(settings, 'GEMINI_MODEL_ROUTES', {})
+CIRCUIT_FAILURE_THRESHOLD = getattr(settings, 'CONTENT_CIRCUIT_FAILURE_THRESHOLD', 5)
+CIRCUIT_RESET_SECONDS = getattr(settings, 'CONTENT_CIRCUIT_RESET_SECONDS', 60)
+GEMINI_PRICING = getattr(settings, 'GEMINI_PRICING', {})
+
+
+def load_prescreen():
+    """The latest trained pre-screen models, or None before train_prescreen has run."""
+    from content_pipeline.domain.services.prescreen import Prescreen
+    from content_pipeline.infrastructure.repositories.prescreen_model_repository import (
+        DjangoPrescreenModelRepository,
+    )
+
+    repository = DjangoPrescreenModelRepository()
+    safety_model = repository.get_latest('safety')
+    category_model = repository.get_latest('category')
+    if safety_model is None and category_model is None:
+        return None
+    return Prescreen(
+        safety_model=safety_model,
+        category_model=category_model,
+        safety_threshold=PRESCREEN_SAFETY_THRESHOLD,
+        category_threshold=PRESCREEN_CATEGORY_THRESHOLD,
+    )
+
+
+def breaker(name):
+    """The process-wide circuit breaker for a dependency, with the configured thresholds."""
+    from content_pipeline.domain.services.circuit_breaker import circuit_breaker
+
+    return circuit_breaker(name, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS)
+
+
+def build_content_processing_service():
+    """Wire ContentProcessingService to the production adapters."""
+    from content_pipeline.infrastructure.adapters.gemini_api_adapter import GeminiApiAdapter
+    from content_pipeline.infrastructure.adapters.gemini_routing import build_routes
+    from content_pipeline.infrastructure.adapters.image_generation_adapter import ImageGenerationAdapter
+    from content_pipeline.infrastructure.adapters.pexels_adapter import PexelsAdapter
+    from content_pipeline.infrastructure.adapters.youtube_adapter import YouTubeAdapter
+    from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+    from content_pipeline.domain.services.llm_usage import UsageLedger
+    from content_pipeline.domain.services.prompt_compaction import PromptCompactor
+
+    routes = build_routes(MODEL_ROUTES)
+    usage = UsageLedger(GEMINI_PRICING)
+    return ContentProcessingService(
+        gemini_api=GeminiApiAdapter(
+            compactor=PromptCompactor(PROMPT_TOKEN_BUDGETS), routes=routes, breaker=breaker('gemini'), usage=usage,
+        ),
+        image_generation=ImageGenerationAdapter(
+            route=routes['generate_image'], breaker=breaker('image_generation'), usage=usage,
+        ),
+        pexels=PexelsAdapter(breaker=breaker('pexels')),
+        youtube=YouTubeAdapter(breaker=breaker('youtube')),
+        prescreen=load_prescreen(),
+    )
+
+
+def tokens_saved(gemini_api):
+    """Prompt tokens the adapter's compactor has saved so far."""
+    from content_pipeline.domain.services.prompt_compaction import PromptCompactor
+
+    compactor = getattr(gemini_api, 'compactor', None)
+    return compactor.stats['tokens_saved'] if isinstance(compactor, PromptCompactor) else 0
+
+
+def route_stats(*adapters):
+    """Merged per-route call totals of the given Gemini adapters."""
+    from content_pipeline.infrastructure.adapters.gemini_routing import RouteStats, merge_snapshots
+
+    stats = [getattr(adapter, 'route_stats', None) for adapter in adapters]
+    return merge_snapshots(*(s.snapshot() for s in stats if isinstance(s, RouteStats)))
+
+
+def log_route_stats(snapshot):
+    from content_pipeline.infrastructure.adapters.gemini_routing import summarize
+
+    for task, route in summarize(snapshot).items():
+        logger.info(
+            "Route %s (%s): %d calls, %.1f%% failed, mean %.0f ms, max %.0f ms, mean output %.0f chars",
+            task, route['model'], route['calls'], route['failure_rate'] * 100,
+            route['mean_latency_ms'], route['max_latency_ms'], route['mean_output_chars'],
+        )
+
+
+def usage_snapshot(*adapters):
+    """Merged token usage recorded by the given Gemini adapters."""
+    from content_pipeline.domain.services.llm_usage import UsageLedger, merge_usage
+
+    ledgers = {}
+    for adapter in adapters:
+        ledger = getattr(adapter, 'usage', None)
+        if isinstance(ledger, UsageLedger):
+            # Adapters built together share one ledger
+            ledgers[id(ledger)] = ledger
+    return merge_usage(*(ledger.snapshot() for ledger in ledgers.values()))
+
+
+def record_usage_run(run_id, kind, usage):
+    """Log a run's token usage and persist it for the llm_usage command."""
+    from content_pipeline.infrastructure.repositories.llm_usage_repository import DjangoLLMUsageRepository
+
+    totals = usage['totals']
+    logger.info("LLM usage for %s %s: %d calls, %d prompt + %d candidate tokens, ~$%.4f",
+                kind, run_id, totals['calls'], totals['prompt_tokens'], totals['candidate_tokens'],
+                totals['estimated_cost'])
+    DjangoLLMUsageRepository().save_run(run_id, kind, usage)
+
+
+def build_reprocess_use_case(batch_size=None, lease_seconds=None, retry_delay_seconds=None):
+    from content_pipeline.application.use_cases.reprocess_events_use_case import ReprocessEventsUseCase
+    from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+    return ReprocessEventsUseCase(
+        news_event_repository=DjangoNewsEventRepository(),
+        content_processing_service=build_content_processing_service(),
+        batch_size=batch_size or CLAIM_BATCH_SIZE,
+        lease_seconds=lease_seconds or LEASE_SECONDS,
+        retry_delay_seconds=RETRY_DELAY_SECONDS if retry_delay_seconds is None else retry_delay_seconds,
+    )
+
+
+def build_ingest_use_case():
+    from content_pipeline.application.use_cases.ingest_news_events_use_case import IngestNewsEventsUseCase
+    from content_pipeline.infrastructure.adapters.news_api_adapter import NewsAPIAdapter
+
+    event_processor = build_reprocess_use_case()
+    service = event_processor.content_processing_service
+    return IngestNewsEventsUseCase(
+        news_aggregator=NewsAPIAdapter(breaker=breaker('newsapi')),
+        news_event_repository=event_processor.news_event_repository,
+        content_processing_service=service,
+        gemini_api=service.gemini_api,
+        image_generation=service.image_generation,
+        event_processor=event_processor,
+    )
+
+
+def ingest_daily_news(queries=None, days_ago=1):
+    """
+    Stage recent articles for every query in NEWS_QUERIES (or the given
+    queries), then fan their processing out across the cluster.
+
+    Staged events are split into chunks of INGEST_CHUNK_SIZE and queued as one
+    django-q group, so processing scales with Q_CLUSTER_WORKERS and with the
+    number of qcluster instances. finalize_ingest runs once every chunk has
+    finished. With CONTENT_INGEST_FANOUT off (e.g. in Cloud Run Jobs, which
+    have no cluster) the chunks are processed inline instead.
+    """
+    from django.core.cache import cache
+    from django_q.tasks import async_task
+    from content_pipeline.infrastructure.repositories.pipeline_run_repository import DjangoPipelineRunRepository
+
+    # The group id doubles as the run id of the PipelineRun and LLMUsageRun records
+    group_id = f"ingest-{uuid.uuid4().hex}"
+    runs = DjangoPipelineRunRepository()
+    runs.start_run(group_id, 'ingest')
+
+    use_case = build_ingest_use_case()
+    event_ids = use_case.stage_articles(queries or NEWS_QUERIES, days_ago)
+    runs.record_staging(group_id, use_case.stats)
+    chunks = [event_ids[i:i + INGEST_CHUNK_SIZE] for i in range(0, len(event_ids), INGEST_CHUNK_SIZE)]
+    logger.info("Staged %d events for processing in %d chunks", len(event_ids), len(chunks))
+
+    if not INGEST_FANOUT or not chunks:
+        results = [process_event_chunk(chunk) for chunk in chunks]
+        return _finish_ingest(results, failed_chunks=0, run_id=group_id)
+
+    cache.set(f"{group_id}:expected", len(chunks), INGEST_GROUP_TTL)
+    for chunk in chunks:
+        async_task(
+            'content_pipeline.tasks.process_event_chunk', chunk,
+            group=group_id, hook='content_pipeline.tasks.on_chunk_complete',
+        )
+    return f"Queued {len(event_ids)} events in {len(chunks)} chunks as group {group_id}"
+
+
+def process_event_chunk(event_ids):
+    """Safety-check and process a chunk of staged events."""
+    use_case = build_ingest_use_case()
+    results = {'processed': 0, 'failed': 0}
+    for event_id in event_ids:
+        if use_case.process_staged(event_id):
+            results['processed'] += 1
+        else:
+            results['failed'] += 1
+    results['tokens_saved'] = tokens_saved(use_case.gemini_api)
+    results['routes'] = route_stats(use_case.gemini_api, use_case.image_generation)
+    results['usage'] = usage_snapshot(use_case.gemini_api, use_case.image_generation)
+    results['rejected_unsafe'] = use_case.event_processor.stats['rejected_unsafe']
+    results['stage_timings'] = [timing for _, timings in use_case.stage_timings for timing in timings]
+    return results
+
+
+def on_chunk_complete(task):
+    """Hook for each chunk; queues finalize_ingest once the whole group has finished."""
+    from django.core.cache import cache
+    from django_q.tasks import async_task, count_group
+
+    expected = cache.get(f"{task.group}:expected")
+    if expected is None or count_group(task.group) < expected:
+        return
+    # The last chunks can finish together; only one of them aggregates
+    if cache.add(f"{task.group}:aggregated", True, INGEST_GROUP_TTL):
+        async_task('content_pipeline.tasks.finalize_ingest', task.group)
+
+
+def finalize_ingest(group_id):
+    """
+    Sum the chunk results of an ingestion group and refresh the draft book.
+
+    Events in failed chunks stay in progress for the reprocess_events worker.
+    """
+    from django_q.tasks import fetch_group
+
+    tasks = fetch_group(group_id, failures=True) or []
+    results = [task.result for task in tasks if task.success]
+    return _finish_ingest(results, failed_chunks=sum(1 for task in tasks if not task.success), run_id=group_id)
+
+
+def _finish_ingest(results, failed_chunks, run_id):
+    from book_assembly.tasks import update_draft_book
+    from content_pipeline.domain.services.llm_usage import merge_usage
+    from content_pipeline.domain.services.stage_graph import summarize_stage_timings
+    from content_pipeline.infrastructure.adapters.gemini_routing import merge_snapshots
+    from content_pipeline.infrastructure.repositories.pipeline_run_repository import DjangoPipelineRunRepository
+
+    processed = sum(result['processed'] for result in results)
+    failed = sum(result['failed'] for result in results)
+    saved = sum(result.get('tokens_saved', 0) for result in results)
+    logger.info("Ingestion finished: %d processed, %d failed, %d chunks failed, ~%d prompt tokens saved",
+                processed, failed, failed_chunks, saved)
+    log_route_stats(merge_snapshots(*(result.get('routes', {}) for result in results)))
+    record_usage_run(run_id, 'ingest', merge_usage(*(result.get('usage') for result in results)))
+    DjangoPipelineRunRepository().finish_run(
+        run_id,
+        stats={
+            'processed': processed,
+            'failed': failed,
+            'rejected_unsafe': sum(result.get('rejected_unsafe', 0) for result in results),
+            'failed_chunks': failed_chunks,
+        },
+        stage_latency=summarize_stage_timings(
+            timing for result in results for timing in result.get('stage_timings', [])
+        ),
+    )
+
+    # Keep the current month's partial book up to date
+    update_draft_book()
+    return f"Ingested {processed} events, {failed} failed, {failed_chunks} chunks failed"
+
+
+def reprocess_events(max_batches=None):
+    """Lease and process a bounded number of batches of in-progress events."""
+    from django.utils import timezone
+    from content_pipeline.domain.services.stage_graph import summarize_stage_timings
+    from content_pipeline.infrastructure.repositories.pipeline_run_repository import DjangoPipelineRunRepository
+
+    started_at = timezone.now()
+    use_case = build_reprocess_use_case()
+    results = use_case.run(max_batches=max_batches or REPROCESS_MAX_BATCHES)
+
+    logger.info("Reprocessing worker %s: %d processed, %d failed, ~%d prompt tokens saved",
+                use_case.worker_id, results['processed'], results['failed'],
+                tokens_saved(use_case.content_processing_service.gemini_api))
+    service = use_case.content_processing_service
+    log_route_stats(route_stats(service.gemini_api, service.image_generation))
+
+    # Most scheduled runs find nothing to do; only runs that processed events are kept
+    if results['processed'] or results['failed']:
+        run_id = f"reprocess-{uuid.uuid4().hex}"
+        runs = DjangoPipelineRunRepository()
+        runs.start_run(run_id, 'reprocess', started_at=started_at)
+        runs.finish_run(
+            run_id, stats=use_case.stats,
+            stage_latency=summarize_stage_timings(timing for _, timings in use_case.stage_timings for timing in timings),
+        )
+        record_usage_run(run_id, 'reprocess', usage_snapshot(service.gemini_api, service.image_generation))
+    return f"Reprocessed {results['processed']} events, {results['failed']} failed"
@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework import routers
-from .views import NewsEventViewSet
+from .views import NewsEventViewSet, PipelineRunViewSet
 
 router = routers.DefaultRouter()
 router.register(r'news-events', NewsEventViewSet)
+router.register(r'pipeline-runs', PipelineRunViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
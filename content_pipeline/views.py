@@ -1,7 +1,7 @@
 from rest_framework import viewsets, permissions
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import NewsEventModel
-from .serializers import NewsEventSerializer
+from .models import NewsEventModel, PipelineRun
+from .serializers import NewsEventSerializer, PipelineRunSerializer
 from .filters import NewsEventFilter
 
 
@@ -9,9 +9,24 @@ class NewsEventViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that allows news events to be viewed and filtered.
     Public read-only access - no authentication required.
+    Only fully processed events are published; in-progress checkpoints are hidden.
     """
-    queryset = NewsEventModel.objects.all().order_by('-published_at')
+    queryset = NewsEventModel.objects.filter(processing_status='PROCESSED').order_by('-published_at')
     serializer_class = NewsEventSerializer
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend]
     filterset_class = NewsEventFilter
+
+
+class PipelineRunViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    API endpoint listing recent ingestion and reprocessing runs, newest first.
+    Staff only. Each run carries its counters, phase durations and per-stage
+    p50/p95 latency; filter with ?kind=ingest or ?kind=reprocess.
+    """
+    queryset = PipelineRun.objects.order_by('-started_at')
+    serializer_class = PipelineRunSerializer
+    permission_classes = [permissions.IsAdminUser]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['kind', 'status']
+    lookup_field = 'run_id'
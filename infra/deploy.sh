@@ -71,7 +71,7 @@ LOG_LEVEL=INFO"
     echo "   API deployed at: ${SERVICE_URL}"
 
     echo "==> Updating Cloud Run Jobs with latest image..."
-    JOBS=("process-daily-content" "send-reading-reminder" "cleanup-old-sessions" "generate-monthly-book")
+    JOBS=("process-daily-content" "send-reading-reminder" "run-maintenance" "generate-monthly-book" "drain-email-outbox" "reprocess-events")
     for JOB_NAME in "${JOBS[@]}"; do
         echo "   Updating job: ${JOB_NAME}"
         gcloud run jobs update "${JOB_NAME}" \
@@ -92,8 +92,10 @@ IMAGE="${REGION}-docker.pkg.dev/${PROJECT_ID}/${REPO_NAME}/api:latest"
 declare -A JOBS=(
     ["process-daily-content"]="users.tasks.process_daily_content"
     ["send-reading-reminder"]="users.tasks.send_reading_reminder"
-    ["cleanup-old-sessions"]="users.tasks.cleanup_old_sessions"
+    ["run-maintenance"]="users.tasks.run_maintenance"
     ["generate-monthly-book"]="users.tasks.generate_monthly_book"
+    ["drain-email-outbox"]="users.tasks.drain_email_outbox"
+    ["reprocess-events"]="content_pipeline.tasks.reprocess_events"
 )
 
 for JOB_NAME in "${!JOBS[@]}"; do
@@ -109,7 +111,7 @@ for JOB_NAME in "${!JOBS[@]}"; do
         --max-retries=1 \
         --task-timeout="300s" \
         --set-secrets="DATABASE_URL=DATABASE_URL:latest,DJANGO_SECRET_KEY=DJANGO_SECRET_KEY:latest" \
-        --set-env-vars="ENVIRONMENT=production,DJANGO_ALLOWED_HOSTS=*" \
+        --set-env-vars="ENVIRONMENT=production,DJANGO_ALLOWED_HOSTS=*,CONTENT_INGEST_FANOUT=False" \
         --command="python" \
         --args="manage.py,run_task,${TASK_PATH}" \
         2>/dev/null || echo "   (job '${JOB_NAME}' already exists - will update on deploy)"
@@ -124,15 +126,19 @@ PROJECT_NUMBER=$(gcloud projects describe "${PROJECT_ID}" --format="value(projec
 declare -A SCHEDULES=(
     ["process-daily-content"]="0 6 * * *"
     ["send-reading-reminder"]="0 18 * * *"
-    ["cleanup-old-sessions"]="0 3 * * 0"
-    ["generate-monthly-book"]="0 0 1 * *"
+    ["run-maintenance"]="0 3 * * *"
+    ["generate-monthly-book"]="0 7 1 * *"
+    ["drain-email-outbox"]="*/5 * * * *"
+    ["reprocess-events"]="*/30 * * * *"
 )
 
 declare -A DESCRIPTIONS=(
     ["process-daily-content"]="Process daily content at 6 AM UTC"
     ["send-reading-reminder"]="Send reading reminders at 6 PM UTC"
-    ["cleanup-old-sessions"]="Clean up old sessions on Sundays at 3 AM UTC"
-    ["generate-monthly-book"]="Generate monthly book on the 1st at midnight UTC"
+    ["run-maintenance"]="Purge expired sessions, tokens, cache rows and task history at 3 AM UTC"
+    ["generate-monthly-book"]="Finalize the previous month's book on the 1st at 7 AM UTC"
+    ["drain-email-outbox"]="Deliver queued emails every 5 minutes"
+    ["reprocess-events"]="Finish interrupted or failed content processing every 30 minutes"
 )
 
 for JOB_NAME in "${!SCHEDULES[@]}"; do
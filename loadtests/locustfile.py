@@ -1,178 +1,338 @@
 """
 Load testing configuration using Locust.
 
+The workload is a weighted mix of user journeys rather than independent
+requests:
+    FamilyUser   - child reading sessions (read, sync progress, bookmark,
+                   complete content), parent dashboards and quiz submissions
+    VisitorUser  - anonymous browsing, searching and category filtering
+    AdminUser    - staff listing users and pipeline runs
+
+Pre-seed the loadtest_user_N accounts and a realistic dataset first:
+    python manage.py seed_scale_data --users 200 --events 20000
+
+The anonymous throttle (100/hour per IP) would otherwise reject most of the
+traffic coming from one load generator; raise it on the target for the run:
+    THROTTLE_ANON_RATE=100000/hour THROTTLE_USER_RATE=100000/hour
+
 Run with: locust -f loadtests/locustfile.py --host=http://localhost:8000
+Evening login storm (a compressed day with a spike of logins at 7pm):
+    locust -f loadtests/locustfile.py,loadtests/login_storm.py --host=http://localhost:8000 --headless
+
+At the end p50/p95/p99 and the error rate of every endpoint are checked
+against SLO_THRESHOLDS; the run exits non-zero when any SLO is missed.
+
+Environment:
+    LOADTEST_USERS        Number of seeded loadtest_user_N accounts (default 100)
+    LOADTEST_SLO_FILE     JSON file overriding SLO_THRESHOLDS, keyed by endpoint name
+    LOADTEST_REPORT       Also write the SLO report to this JSON file
+    LOADTEST_ADMIN_USERNAME, LOADTEST_ADMIN_PASSWORD  Staff credentials for AdminUser
 """
-from locust import HttpUser, task, between, events
 import json
+import os
 import random
 
-
-class BookOfMonthUser(HttpUser):
-    """Simulates a typical user of the Book of the Month application."""
-
-    wait_time = between(1, 5)  # Wait 1-5 seconds between tasks
+import requests
+from locust import HttpUser, SequentialTaskSet, between, events, task
+from locust.runners import MasterRunner, WorkerRunner
+
+SEEDED_USERS = int(os.environ.get('LOADTEST_USERS', 100))
+PASSWORD = 'LoadTest123!'
+CATEGORIES = [
+    'ANIMALS_NATURE', 'SCIENCE_DISCOVERY', 'SPACE_EARTH', 'TECHNOLOGY_INNOVATION',
+    'SPORTS_HUMAN_ACHIEVEMENT', 'ARTS_CULTURE', 'WORLD_RECORDS_FUN_FACTS',
+]
+SEARCH_TERMS = ['science', 'animals', 'space', 'robot', 'record', 'ocean', 'game']
+
+# Milliseconds for p50/p95/p99 and a fraction for error_rate. Endpoints
+# without an entry use 'default'.
+SLO_THRESHOLDS = {
+    'default': {'p50': 100, 'p95': 300, 'p99': 800, 'error_rate': 0.01},
+    # Password hashing dominates logins
+    'POST /api/users/login/': {'p50': 300, 'p95': 800, 'p99': 1500, 'error_rate': 0.01},
+    'GET /api/content/news-events/': {'p50': 100, 'p95': 300, 'p99': 600, 'error_rate': 0.01},
+    'GET /api/assembly/monthly-books/': {'p50': 150, 'p95': 400, 'p99': 800, 'error_rate': 0.01},
+    'POST /api/quizzes/submissions/': {'p50': 150, 'p95': 500, 'p99': 1000, 'error_rate': 0.01},
+    'POST /api/users/reading-streaks/mark_content_complete/': {
+        'p50': 150, 'p95': 500, 'p99': 1000, 'error_rate': 0.01,
+    },
+}
+
+# Ids of public content, filled once per process by the pre-seeding step so
+# that journeys do not issue extra list requests just to find something to open
+content = {'events': [], 'books': []}
+
+
+def load_slo_thresholds():
+    thresholds = {name: dict(values) for name, values in SLO_THRESHOLDS.items()}
+    path = os.environ.get('LOADTEST_SLO_FILE')
+    if path:
+        with open(path) as f:
+            for name, values in json.load(f).items():
+                thresholds.setdefault(name, dict(thresholds['default'])).update(values)
+    return thresholds
+
+
+def results(response):
+    """Return the items of a paginated or plain list response."""
+    try:
+        data = response.json()
+    except ValueError:
+        return []
+    return data.get('results', []) if isinstance(data, dict) else data
+
+
+class AuthenticatedUser(HttpUser):
+    """Logs in as one of the seeded users when it starts."""
+
+    abstract = True
 
     def on_start(self):
-        """Called when a user starts. Login to get authentication token."""
-        # For load testing, create test users in advance or use registration
         self.token = None
-        self.user_id = None
+        self.login()
 
-        # Try to login with test credentials
+    def login(self, username=None, password=PASSWORD):
+        username = username or f"loadtest_user_{random.randint(1, SEEDED_USERS)}"
         response = self.client.post(
             "/api/users/login/",
-            json={
-                "username": f"loadtest_user_{random.randint(1, 100)}",
-                "password": "LoadTest123!"
-            },
-            headers={"Content-Type": "application/json"}
+            json={"username": username, "password": password},
+            name="POST /api/users/login/",
         )
-
         if response.status_code == 200:
-            data = response.json()
-            self.token = data.get("token")
-            self.user_id = data.get("user", {}).get("id")
+            self.token = response.json().get("token")
 
-    def get_auth_headers(self):
-        """Return authentication headers if logged in."""
-        if self.token:
-            return {
-                "Authorization": f"Token {self.token}",
-                "Content-Type": "application/json"
-            }
-        return {"Content-Type": "application/json"}
-
-    # Public endpoints (no auth required)
-    @task(10)
-    def get_news_events(self):
-        """Browse news events - most common action."""
-        self.client.get("/api/content/news-events/")
-
-    @task(5)
-    def get_news_event_detail(self):
-        """View a specific news event."""
-        # First get list to get a valid ID
-        response = self.client.get("/api/content/news-events/")
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("results"):
-                event_id = random.choice(data["results"])["id"]
-                self.client.get(f"/api/content/news-events/{event_id}/")
+    @property
+    def headers(self):
+        return {"Authorization": f"Token {self.token}"} if self.token else {}
 
-    @task(3)
-    def get_monthly_books(self):
-        """Browse monthly books."""
-        self.client.get("/api/assembly/monthly-books/")
+    def get(self, path, name=None, **kwargs):
+        return self.client.get(path, headers=self.headers, name=f"GET {name or path}", **kwargs)
 
-    @task(2)
-    def search_news(self):
-        """Search for news events."""
-        search_terms = ["science", "animals", "space", "technology", "sports"]
-        term = random.choice(search_terms)
-        self.client.get(f"/api/content/news-events/?search={term}")
+    def post(self, path, data, name=None, **kwargs):
+        return self.client.post(path, json=data, headers=self.headers, name=f"POST {name or path}", **kwargs)
 
-    @task(2)
-    def filter_by_category(self):
-        """Filter news by category."""
-        categories = ["Science", "Technology", "Animals", "Space", "Sports"]
-        category = random.choice(categories)
-        self.client.get(f"/api/content/news-events/?categories={category}")
+    def patch(self, path, data, name=None, **kwargs):
+        return self.client.patch(path, json=data, headers=self.headers, name=f"PATCH {name or path}", **kwargs)
 
-    @task(1)
-    def get_quizzes(self):
-        """View available quizzes."""
-        self.client.get("/api/quizzes/quizzes/")
 
-    # Authenticated endpoints
-    @task(3)
-    def get_bookmarks(self):
-        """View user bookmarks (requires auth)."""
-        if self.token:
-            self.client.get(
-                "/api/users/bookmarks/",
-                headers=self.get_auth_headers()
-            )
+class ChildReadingSession(SequentialTaskSet):
+    """A child reads a few stories, syncing progress as they go."""
+
+    @task
+    def browse(self):
+        if random.random() < 0.3:
+            self.user.get(f"/api/content/news-events/?category={random.choice(CATEGORIES)}",
+                          name="/api/content/news-events/?category=")
+        else:
+            self.user.get("/api/content/news-events/")
+
+    @task
+    def read_stories(self):
+        for _ in range(random.randint(1, 4)):
+            if not content['events']:
+                return
+            event_id = random.choice(content['events'])
+            self.user.get(f"/api/content/news-events/{event_id}/", name="/api/content/news-events/[id]/")
+            self.sync_progress(event_id, completed=random.random() < 0.6)
+            if random.random() < 0.15:
+                self.bookmark(event_id)
+
+    @task
+    def finish(self):
+        self.user.post("/api/users/reading-streaks/update_streak/", {})
+        self.interrupt()
+
+    def sync_progress(self, event_id, completed):
+        response = self.user.get(f"/api/users/reading-progress/?news_event_id={event_id}",
+                                 name="/api/users/reading-progress/?news_event_id=")
+        existing = results(response)
+        if existing:
+            self.user.patch(f"/api/users/reading-progress/{existing[0]['id']}/", {"completed": completed},
+                            name="/api/users/reading-progress/[id]/")
+        else:
+            self.user.post("/api/users/reading-progress/", {"news_event_id": event_id, "completed": completed})
+        if completed:
+            self.user.post("/api/users/reading-streaks/mark_content_complete/", {"news_event_id": event_id})
+
+    def bookmark(self, event_id):
+        with self.user.post("/api/users/bookmarks/", {"news_event_id": event_id},
+                            catch_response=True) as response:
+            if response.status_code == 400 and 'already exists' in response.text:
+                response.success()
+
+
+class ParentDashboard(SequentialTaskSet):
+    """A parent checks on their children's reading."""
+
+    @task
+    def dashboard(self):
+        self.user.get("/api/users/users/me/")
+        self.user.get("/api/users/child-profiles/")
+        self.user.get("/api/users/reading-streaks/")
+        self.user.get("/api/users/user-achievements/")
+        self.user.get("/api/users/reading-progress/?completed=true", name="/api/users/reading-progress/?completed=")
+        self.user.get("/api/users/bookmarks/")
+        self.user.get("/api/assembly/monthly-books/")
+        self.interrupt()
 
-    @task(2)
-    def get_reading_progress(self):
-        """View reading progress (requires auth)."""
-        if self.token:
-            self.client.get(
-                "/api/users/reading-progress/",
-                headers=self.get_auth_headers()
-            )
+
+class QuizJourney(SequentialTaskSet):
+    """A child takes the quiz of a monthly book, or revisits their result."""
+
+    @task
+    def take_quiz(self):
+        if not content['books']:
+            self.interrupt()
+            return
+        book_id = random.choice(content['books'])
+        self.user.get(f"/api/assembly/monthly-books/{book_id}/", name="/api/assembly/monthly-books/[id]/")
+        quizzes = results(self.user.get(f"/api/quizzes/quizzes/?monthly_book={book_id}",
+                                        name="/api/quizzes/quizzes/?monthly_book="))
+        if quizzes:
+            self.submit(quizzes[0])
+        self.interrupt()
+
+    def submit(self, quiz):
+        with self.user.get(f"/api/quizzes/submissions/by_quiz/?quiz_id={quiz['id']}",
+                           name="/api/quizzes/submissions/by_quiz/", catch_response=True) as response:
+            if response.status_code == 404:
+                response.success()
+            elif response.status_code == 200:
+                return
+        answers = [
+            {"question": question['id'], "selected_answer": random.choice(question['options'])}
+            for question in quiz['questions'] if question['options']
+        ]
+        response = self.user.post("/api/quizzes/submissions/", {"quiz": quiz['id'], "answers": answers})
+        if response.status_code == 201:
+            self.user.get(f"/api/quizzes/submissions/{response.json()['id']}/",
+                          name="/api/quizzes/submissions/[id]/")
+
+
+class FamilyUser(AuthenticatedUser):
+    """A seeded family account, mostly reading with some dashboards and quizzes."""
+
+    wait_time = between(2, 8)
+    weight = 8
+    tasks = {ChildReadingSession: 6, ParentDashboard: 2, QuizJourney: 2}
+
+
+class VisitorUser(HttpUser):
+    """An anonymous visitor browsing public content."""
+
+    wait_time = between(1, 5)
+    weight = 3
+
+    @task(6)
+    def browse_news(self):
+        self.client.get("/api/content/news-events/", name="GET /api/content/news-events/")
+
+    @task(4)
+    def read_story(self):
+        if content['events']:
+            self.client.get(f"/api/content/news-events/{random.choice(content['events'])}/",
+                            name="GET /api/content/news-events/[id]/")
 
     @task(2)
-    def get_child_profiles(self):
-        """View child profiles (requires auth)."""
-        if self.token:
-            self.client.get(
-                "/api/users/child-profiles/",
-                headers=self.get_auth_headers()
-            )
+    def search_news(self):
+        self.client.get(f"/api/content/news-events/?title={random.choice(SEARCH_TERMS)}",
+                        name="GET /api/content/news-events/?title=")
 
-    @task(1)
-    def get_achievements(self):
-        """View achievements (requires auth)."""
-        if self.token:
-            self.client.get(
-                "/api/users/achievements/",
-                headers=self.get_auth_headers()
-            )
+    @task(2)
+    def filter_by_category(self):
+        self.client.get(f"/api/content/news-events/?category={random.choice(CATEGORIES)}",
+                        name="GET /api/content/news-events/?category=")
 
-    @task(1)
-    def get_reading_streaks(self):
-        """View reading streaks (requires auth)."""
-        if self.token:
-            self.client.get(
-                "/api/users/reading-streaks/",
-                headers=self.get_auth_headers()
-            )
+    @task(2)
+    def browse_books(self):
+        self.client.get("/api/assembly/monthly-books/", name="GET /api/assembly/monthly-books/")
 
     @task(1)
     def health_check(self):
-        """Check application health."""
-        self.client.get("/api/health/")
+        self.client.get("/api/health/", name="GET /api/health/")
 
 
-class AdminUser(HttpUser):
+class AdminUser(AuthenticatedUser):
     """Simulates an admin user for admin operations."""
 
     wait_time = between(5, 15)
     weight = 1  # Much fewer admin users
 
     def on_start(self):
-        """Login as admin."""
-        response = self.client.post(
-            "/api/users/login/",
-            json={
-                "username": "admin",
-                "password": "AdminPassword123!"
-            },
-            headers={"Content-Type": "application/json"}
+        self.token = None
+        self.login(
+            os.environ.get('LOADTEST_ADMIN_USERNAME', 'admin'),
+            os.environ.get('LOADTEST_ADMIN_PASSWORD', 'AdminPassword123!'),
         )
 
-        if response.status_code == 200:
-            data = response.json()
-            self.token = data.get("token")
-        else:
-            self.token = None
-
-    @task
+    @task(3)
     def list_users(self):
-        """List all users (admin only)."""
         if self.token:
-            self.client.get(
-                "/api/users/users/",
-                headers={
-                    "Authorization": f"Token {self.token}",
-                    "Content-Type": "application/json"
-                }
-            )
+            self.get("/api/users/users/")
+
+    @task(1)
+    def list_pipeline_runs(self):
+        if self.token:
+            self.get("/api/content/pipeline-runs/")
+
+
+def preseed(host):
+    """Collect ids of public content for the journeys to open.
+
+    Uses a plain requests session so that these requests are not counted in
+    the workload's statistics.
+    """
+    session = requests.Session()
+    for page in range(1, 6):
+        response = session.get(f"{host}/api/content/news-events/?page={page}")
+        if response.status_code != 200:
+            break
+        content['events'].extend(item['id'] for item in results(response))
+    content['books'] = [item['id'] for item in results(session.get(f"{host}/api/assembly/monthly-books/"))]
+    login = session.post(f"{host}/api/users/login/", json={"username": "loadtest_user_1", "password": PASSWORD})
+    if login.status_code != 200:
+        print("loadtest_user_1 cannot log in; run `python manage.py seed_scale_data` against the target first")
+    print(f"Pre-seeded {len(content['events'])} events and {len(content['books'])} books")
+
+
+def slo_report(stats, thresholds):
+    """Check p50/p95/p99 and the error rate of every endpoint against its SLO."""
+    report = {}
+    for (name, _method), entry in sorted(stats.entries.items()):
+        if not entry.num_requests:
+            continue
+        slo = thresholds.get(name, thresholds['default'])
+        measured = {
+            'requests': entry.num_requests,
+            'p50': entry.get_response_time_percentile(0.5),
+            'p95': entry.get_response_time_percentile(0.95),
+            'p99': entry.get_response_time_percentile(0.99),
+            'error_rate': round(entry.num_failures / entry.num_requests, 4),
+        }
+        report[name] = {
+            **measured,
+            'slo': slo,
+            'violations': [key for key in ('p50', 'p95', 'p99', 'error_rate') if measured[key] > slo[key]],
+        }
+    return report
+
+
+def print_slo_report(report):
+    print(f"{'endpoint':<62} {'reqs':>7} {'p50':>6} {'p95':>6} {'p99':>6} {'errors':>7}  SLO")
+    for name, row in report.items():
+        status = 'MISSED ' + ','.join(row['violations']) if row['violations'] else 'ok'
+        print(f"{name:<62} {row['requests']:>7} {row['p50']:>6.0f} {row['p95']:>6.0f} {row['p99']:>6.0f} "
+              f"{row['error_rate']:>7.2%}  {status}")
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Called when test starts. Every process running users pre-seeds its own ids."""
+    print("Load test starting...")
+    if not isinstance(environment.runner, MasterRunner):
+        preseed(environment.host.rstrip('/'))
 
 
-# Event hooks for custom reporting
 @events.request.add_listener
 def on_request(request_type, name, response_time, response_length, response, **kwargs):
     """Log slow requests for analysis."""
@@ -180,13 +340,16 @@ def on_request(request_type, name, response_time, response_length, response, **k
         print(f"SLOW REQUEST: {request_type} {name} - {response_time}ms")
 
 
-@events.test_start.add_listener
-def on_test_start(environment, **kwargs):
-    """Called when test starts."""
-    print("Load test starting...")
-
-
-@events.test_stop.add_listener
-def on_test_stop(environment, **kwargs):
-    """Called when test stops."""
-    print("Load test completed.")
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    """Print the SLO report and fail the run when an SLO is missed."""
+    if isinstance(environment.runner, WorkerRunner):
+        return
+    report = slo_report(environment.stats, load_slo_thresholds())
+    print_slo_report(report)
+    path = os.environ.get('LOADTEST_REPORT')
+    if path:
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if any(row['violations'] for row in report.values()):
+        environment.process_exit_code = 1
@@ -0,0 +1,50 @@
+"""
+Load shape for a compressed day with an evening login storm.
+
+Families log in together when children settle down to read at 7pm. The day
+is replayed in LOADTEST_DAY_SECONDS (default 600) seconds: concurrency
+follows HOURLY_USERS, and at 19:00 the extra storm users are spawned at
+LOADTEST_STORM_SPAWN_RATE per second. They follow the locustfile's user
+mix, so its FamilyUser and AdminUser share hits /api/users/login/ within a
+few seconds.
+
+Run together with the workload:
+    locust -f loadtests/locustfile.py,loadtests/login_storm.py --host=http://localhost:8000 --headless
+
+Environment:
+    LOADTEST_DAY_SECONDS       Length of the simulated day in seconds (default 600)
+    LOADTEST_PEAK_USERS        Users at the busiest regular hour (default 100)
+    LOADTEST_STORM_USERS       Extra users logging in at 7pm (default 400)
+    LOADTEST_STORM_SPAWN_RATE  Users spawned per second during the storm (default 100)
+"""
+import os
+
+from locust import LoadTestShape
+
+# Share of LOADTEST_PEAK_USERS active in each hour of the day
+HOURLY_USERS = [
+    0.02, 0.01, 0.01, 0.01, 0.01, 0.02, 0.05, 0.15, 0.20, 0.10, 0.08, 0.08,
+    0.10, 0.10, 0.15, 0.35, 0.55, 0.70, 0.85, 1.00, 0.80, 0.40, 0.15, 0.05,
+]
+STORM_HOUR = 19
+
+
+class EveningLoginStorm(LoadTestShape):
+    """One simulated day, with a burst of logins at 7pm."""
+
+    day_seconds = float(os.environ.get('LOADTEST_DAY_SECONDS', 600))
+    peak_users = int(os.environ.get('LOADTEST_PEAK_USERS', 100))
+    storm_users = int(os.environ.get('LOADTEST_STORM_USERS', 400))
+    storm_spawn_rate = float(os.environ.get('LOADTEST_STORM_SPAWN_RATE', 100))
+
+    def tick(self):
+        run_time = self.get_run_time()
+        if run_time >= self.day_seconds:
+            return None
+        hour = int(run_time / self.day_seconds * 24)
+        users = max(1, round(HOURLY_USERS[hour] * self.peak_users))
+        # Ramp between hours over a few seconds of run time
+        spawn_rate = max(1.0, self.peak_users * 24 / self.day_seconds)
+        if hour == STORM_HOUR:
+            return users + self.storm_users, self.storm_spawn_rate
+        return users, spawn_rate
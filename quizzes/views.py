@@ -18,7 +18,7 @@ class QuizViewSet(viewsets.ReadOnlyModelViewSet):
     Public read-only access - no authentication required.
     Questions are returned WITHOUT correct answers.
     """
-    queryset = Quiz.objects.all()
+    queryset = Quiz.objects.prefetch_related('questions')
     serializer_class = QuizListSerializer
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend]
@@ -46,7 +46,10 @@ class QuizSubmissionViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return QuizSubmission.objects.filter(user=self.request.user)
+        queryset = QuizSubmission.objects.filter(user=self.request.user)
+        if self.action == 'list':
+            return queryset.prefetch_related('answers')
+        return queryset.prefetch_related('answers__question')
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -73,7 +76,7 @@ class QuizSubmissionViewSet(viewsets.ModelViewSet):
             quiz_id = request.query_params['quiz_id']
 
             try:
-                submission = QuizSubmission.objects.get(
+                submission = QuizSubmission.objects.prefetch_related('answers__question').get(
                     user=request.user,
                     quiz_id=quiz_id
                 )
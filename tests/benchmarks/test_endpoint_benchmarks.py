@@ -0,0 +1,251 @@
+"""
+Endpoint latency and query-count benchmarks.
+
+Every router endpoint of content_pipeline, book_assembly, users and quizzes
+is requested against a dataset built by `seed_scale_data`. Each endpoint
+must stay within its query budget in ENDPOINTS and must not use more
+queries than recorded in baseline.json (plus the query margin).
+
+Latency percentiles are measured on every run but only gated when
+BENCHMARK_ENFORCE_LATENCY=1, since they are only comparable on the machine
+that recorded the baseline: a run then fails when an endpoint's p95 exceeds
+the baseline p95 by more than the latency margin.
+
+Environment:
+    BENCHMARK_EVENTS, BENCHMARK_USERS  Dataset size (default 2000 events, 20 users)
+    BENCHMARK_ROUNDS                   Timed requests per endpoint (default 5)
+    BENCHMARK_BASELINE                 Baseline file (default tests/benchmarks/baseline.json)
+    BENCHMARK_UPDATE_BASELINE=1        Rewrite the baseline from this run
+    BENCHMARK_ENFORCE_LATENCY=1        Fail on latency regressions
+    BENCHMARK_LATENCY_MARGIN           Allowed p95 increase, e.g. 0.25 for 25% (default from the baseline)
+    BENCHMARK_QUERY_MARGIN             Allowed extra queries per request (default from the baseline)
+"""
+import json
+import os
+import time
+from collections import namedtuple
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from content_pipeline.domain.services.stage_graph import percentile
+
+BASELINE_PATH = os.environ.get(
+    'BENCHMARK_BASELINE', os.path.join(os.path.dirname(__file__), 'baseline.json')
+)
+EVENTS = int(os.environ.get('BENCHMARK_EVENTS', 2000))
+USERS = int(os.environ.get('BENCHMARK_USERS', 20))
+ROUNDS = int(os.environ.get('BENCHMARK_ROUNDS', 5))
+UPDATE_BASELINE = os.environ.get('BENCHMARK_UPDATE_BASELINE') == '1'
+ENFORCE_LATENCY = os.environ.get('BENCHMARK_ENFORCE_LATENCY') == '1'
+DEFAULT_CONFIG = {'query_margin': 0, 'latency_margin': 0.5, 'latency_slack_ms': 5.0}
+
+# max_queries is the measured count per request; lower it when an endpoint gets
+# cheaper, never raise it without a reason.
+# as_user: None (anonymous), 'reader' (a seeded user with activity) or 'staff'
+Endpoint = namedtuple('Endpoint', 'name method path max_queries as_user data', defaults=('reader', None))
+
+ENDPOINTS = [
+    # content_pipeline
+    Endpoint('news-events-list', 'get', '/api/content/news-events/', 2, None),
+    Endpoint('news-events-filtered', 'get', '/api/content/news-events/?category=SPACE_EARTH&title=in', 2, None),
+    Endpoint('news-events-detail', 'get', '/api/content/news-events/{event}/', 1, None),
+    Endpoint('pipeline-runs-list', 'get', '/api/content/pipeline-runs/', 3, 'staff'),
+    Endpoint('pipeline-runs-detail', 'get', '/api/content/pipeline-runs/{run}/', 2, 'staff'),
+    # book_assembly
+    Endpoint('monthly-books-list', 'get', '/api/assembly/monthly-books/', 3, None),
+    Endpoint('monthly-books-detail', 'get', '/api/assembly/monthly-books/{book}/', 2, None),
+    # users
+    Endpoint('users-list', 'get', '/api/users/users/', 3, 'staff'),
+    Endpoint('users-detail', 'get', '/api/users/users/{user}/', 2, 'staff'),
+    Endpoint('users-me', 'get', '/api/users/users/me/', 1),
+    Endpoint('bookmarks-list', 'get', '/api/users/bookmarks/', 3),
+    Endpoint('bookmarks-detail', 'get', '/api/users/bookmarks/{bookmark}/', 2),
+    Endpoint('reading-progress-list', 'get', '/api/users/reading-progress/', 3),
+    Endpoint('reading-progress-detail', 'get', '/api/users/reading-progress/{progress}/', 2),
+    Endpoint('child-profiles-list', 'get', '/api/users/child-profiles/', 3),
+    Endpoint('child-profiles-detail', 'get', '/api/users/child-profiles/{child}/', 2),
+    Endpoint('reading-streaks-list', 'get', '/api/users/reading-streaks/', 3),
+    Endpoint('reading-streaks-detail', 'get', '/api/users/reading-streaks/{streak}/', 2),
+    Endpoint('reading-streaks-update', 'post', '/api/users/reading-streaks/update_streak/', 4),
+    Endpoint('reading-streaks-complete', 'post', '/api/users/reading-streaks/mark_content_complete/', 13,
+             data={'news_event_id': '{event}'}),
+    Endpoint('achievements-list', 'get', '/api/users/achievements/', 3),
+    Endpoint('achievements-detail', 'get', '/api/users/achievements/{achievement}/', 2),
+    Endpoint('user-achievements-list', 'get', '/api/users/user-achievements/', 3),
+    Endpoint('user-achievements-detail', 'get', '/api/users/user-achievements/{user_achievement}/', 2),
+    # quizzes
+    Endpoint('quizzes-list', 'get', '/api/quizzes/quizzes/', 3, None),
+    Endpoint('quizzes-filtered', 'get', '/api/quizzes/quizzes/?monthly_book={book}', 3, None),
+    Endpoint('quizzes-detail', 'get', '/api/quizzes/quizzes/{quiz}/', 2, None),
+    Endpoint('questions-list', 'get', '/api/quizzes/questions/', 2, None),
+    Endpoint('questions-detail', 'get', '/api/quizzes/questions/{question}/', 1, None),
+    Endpoint('submissions-list', 'get', '/api/quizzes/submissions/', 4),
+    Endpoint('submissions-detail', 'get', '/api/quizzes/submissions/{submission}/', 3),
+    Endpoint('submissions-by-quiz', 'get', '/api/quizzes/submissions/by_quiz/?quiz_id={quiz}', 3),
+]
+
+
+def load_baseline():
+    try:
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        baseline = {}
+    config = {**DEFAULT_CONFIG, **baseline.get('config', {})}
+    for key in ('query_margin', 'latency_margin'):
+        override = os.environ.get(f'BENCHMARK_{key.upper()}')
+        if override is not None:
+            config[key] = float(override)
+    return config, baseline.get('dataset'), baseline.get('endpoints', {})
+
+
+# Throttle counters go to a local-memory cache so that the database cache's
+# bookkeeping queries do not count against the endpoints
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+@pytest.mark.django_db
+@pytest.mark.usefixtures('detect_n_plus_one')
+class EndpointBenchmarkTestCase(TestCase):
+    """Benchmark every router endpoint against a seeded dataset."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from book_assembly.models import MonthlyBookModel
+        from content_pipeline.models import NewsEventModel, PipelineRun
+        from quizzes.models import Question, Quiz, QuizSubmission
+        from users.models import Achievement, Bookmark, ChildProfile, CustomUser, ReadingProgress, \
+            ReadingStreak, UserAchievement
+
+        call_command('seed_scale_data', events=EVENTS, users=USERS, years=1, end='2025-06', stdout=StringIO())
+
+        # The seeded reader with the most bookmarks, so list endpoints have rows to serialize
+        reader = CustomUser.objects.filter(username__startswith='loadtest_user_').annotate(
+            bookmark_count=Count('bookmark')
+        ).order_by('-bookmark_count', 'username').first()
+        staff = CustomUser.objects.create_user(username='benchmark_staff', password='pass12345', is_staff=True)
+        submission = QuizSubmission.objects.filter(user=reader).first() or QuizSubmission.objects.create(
+            user=reader, quiz=Quiz.objects.order_by('monthly_book__year', 'monthly_book__month').first(),
+            score=3, total_questions=5,
+        )
+        quiz = submission.quiz
+        for name in ('Sam', 'Alex'):
+            ChildProfile.objects.create(user=reader, name=name, age=8)
+        achievements = [Achievement.objects.create(name=f'Benchmark {i}', description='Benchmark') for i in range(3)]
+        now = timezone.now()
+        run = PipelineRun.objects.create(run_id='ingest-benchmark', kind='ingest', status='finished',
+                                         started_at=now, finished_at=now)
+        ReadingStreak.objects.get_or_create(user=reader)
+
+        cls.tokens = {
+            role: Token.objects.create(user=user).key for role, user in (('reader', reader), ('staff', staff))
+        }
+        cls.ids = {
+            'event': NewsEventModel.objects.filter(processing_status='PROCESSED').values_list('id', flat=True)[0],
+            'run': run.run_id,
+            'book': MonthlyBookModel.objects.order_by('year', 'month').values_list('id', flat=True)[0],
+            'user': reader.id,
+            'bookmark': Bookmark.objects.filter(user=reader).values_list('id', flat=True)[0],
+            'progress': ReadingProgress.objects.filter(user=reader).values_list('id', flat=True)[0],
+            'child': ChildProfile.objects.filter(user=reader).values_list('id', flat=True)[0],
+            'streak': ReadingStreak.objects.get(user=reader).id,
+            'achievement': achievements[0].id,
+            'user_achievement': UserAchievement.objects.create(user=reader, achievement=achievements[0]).id,
+            'quiz': quiz.id,
+            'question': Question.objects.filter(quiz=quiz).values_list('id', flat=True)[0],
+            'submission': submission.id,
+        }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.config, cls.baseline_dataset, cls.baseline = load_baseline()
+        cls.results = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        if UPDATE_BASELINE and len(cls.results) == len(ENDPOINTS):
+            with open(BASELINE_PATH, 'w') as f:
+                json.dump({
+                    'config': cls.config,
+                    'dataset': {'events': EVENTS, 'users': USERS, 'rounds': ROUNDS},
+                    'endpoints': dict(sorted(cls.results.items())),
+                }, f, indent=2)
+                f.write('\n')
+        super().tearDownClass()
+
+    def _request(self, client, endpoint):
+        path = endpoint.path.format(**self.ids)
+        data = {key: value.format(**self.ids) for key, value in (endpoint.data or {}).items()}
+        # Throttle counters live in the cache; keep repeated requests under the anonymous rate
+        cache.clear()
+        return getattr(client, endpoint.method)(path, data, format='json') if data \
+            else getattr(client, endpoint.method)(path)
+
+    def _benchmark(self, endpoint):
+        client = APIClient()
+        if endpoint.as_user:
+            client.credentials(HTTP_AUTHORIZATION=f'Token {self.tokens[endpoint.as_user]}')
+
+        # Warm-up request, also used to count queries. An execute_wrapper is
+        # used rather than the query log, which is a bounded deque that the
+        # seeding has usually filled
+        statements = []
+
+        def record(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            response = self._request(client, endpoint)
+        self.assertLess(response.status_code, 400, f"{endpoint.name}: {response.status_code} {response.content[:200]}")
+
+        latencies = []
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            self._request(client, endpoint)
+            latencies.append((time.perf_counter() - started) * 1000)
+        result = {
+            'queries': len(statements),
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+        }
+        self.results[endpoint.name] = result
+
+        self.assertLessEqual(
+            result['queries'], endpoint.max_queries,
+            f"{endpoint.name} made {result['queries']} queries (budget {endpoint.max_queries}):\n"
+            + '\n'.join(statements)
+        )
+        baseline = self.baseline.get(endpoint.name)
+        if baseline is None or UPDATE_BASELINE:
+            return
+        self.assertLessEqual(
+            result['queries'], baseline['queries'] + self.config['query_margin'],
+            f"{endpoint.name} made {result['queries']} queries; the baseline is {baseline['queries']}",
+        )
+        if ENFORCE_LATENCY and self.baseline_dataset == {'events': EVENTS, 'users': USERS, 'rounds': ROUNDS}:
+            limit = baseline['p95_ms'] * (1 + self.config['latency_margin']) + self.config['latency_slack_ms']
+            self.assertLessEqual(
+                result['p95_ms'], limit,
+                f"{endpoint.name} p95 {result['p95_ms']} ms exceeds the baseline {baseline['p95_ms']} ms "
+                f"by more than {self.config['latency_margin']:.0%}",
+            )
+
+
+def _benchmark_test(endpoint):
+    def test(self):
+        self._benchmark(endpoint)
+    test.__doc__ = f"Test {endpoint.method.upper()} {endpoint.path} against its query budget and the baseline."
+    return test
+
+
+for _endpoint in ENDPOINTS:
+    setattr(EndpointBenchmarkTestCase, f"test_{_endpoint.name.replace('-', '_')}", _benchmark_test(_endpoint))
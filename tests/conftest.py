@@ -16,6 +16,17 @@ def enable_db_access_for_all_tests(db):
     pass
 
 
+@pytest.fixture
+def detect_n_plus_one():
+    """Make requests that run N+1 queries raise NPlusOneError.
+
+    Use on TestCase classes with @pytest.mark.usefixtures('detect_n_plus_one').
+    """
+    from django.test import override_settings
+    with override_settings(N_PLUS_ONE_DETECTION='raise'):
+        yield
+
+
 @pytest.fixture
 def api_client():
     """Return a Django REST Framework API client."""
@@ -117,6 +117,7 @@ class MonthlyBookModelTestCase(TestCase):
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('detect_n_plus_one')
 class MonthlyBookViewSetTestCase(TestCase):
     """Test MonthlyBookViewSet endpoints."""
 
@@ -187,6 +188,30 @@ class MonthlyBookViewSetTestCase(TestCase):
         self.assertIn('next', data)
         self.assertIn('previous', data)
 
+    def test_list_loads_daily_entries_in_one_query(self):
+        """Test that the daily entries of all listed books are fetched together."""
+        from content_pipeline.models import NewsEventModel
+        from book_assembly.models import MonthlyBookModel
+        books = [self.book1, self.book2, MonthlyBookModel.objects.create(month=3, year=2024, title='March 2024')]
+        for i, book in enumerate(books):
+            events = [
+                NewsEventModel.objects.create(
+                    title=f'Event {i}-{n}', raw_content='Content', source_url=f'https://example.com/{i}/{n}',
+                    published_at=datetime.now(), processing_status='PROCESSED',
+                )
+                for n in range(2)
+            ]
+            book.daily_entries = [str(event.id) for event in events]
+            book.save()
+
+        # Count, books, daily entries
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/assembly/monthly-books/')
+
+        results = response.json()['results']
+        self.assertEqual([len(book['daily_entries']) for book in results], [2, 2, 2])
+        self.assertEqual(results[0]['daily_entries'][0]['title'], 'Event 2-0')
+
 
 @pytest.mark.django_db
 class MonthlyBookSerializerTestCase(TestCase):
@@ -224,7 +249,7 @@ class MonthlyBookSerializerTestCase(TestCase):
         expected_fields = [
             'id', 'month', 'year', 'title', 'cover_image_url',
             'daily_entries', 'end_of_month_quiz', 'parents_guide',
-            'created_at', 'updated_at'
+            'status', 'created_at', 'updated_at'
         ]
 
         for field in expected_fields:
@@ -232,6 +257,7 @@ class MonthlyBookSerializerTestCase(TestCase):
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('detect_n_plus_one')
 class MonthlyBookFilterTestCase(TestCase):
     """Test MonthlyBookFilter."""
 
@@ -352,6 +378,394 @@ class BookAssemblyIntegrationTestCase(TestCase):
 
         self.assertEqual(len(book.daily_entries), 5)
 
+    def test_assemble_book_for_month_streams_events(self):
+        """Test assembling a book from the month's events."""
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+        from content_pipeline.models import NewsEventModel
+        from datetime import timezone as dt_timezone
+
+        for i in range(8):
+            NewsEventModel.objects.create(
+                title=f'News {i}', raw_content=f'Content {i}',
+                source_url=f'https://example.com/{i}',
+                published_at=datetime(2024, 5, i + 1, tzinfo=dt_timezone.utc),
+                categories=['SCIENCE_DISCOVERY'], processing_status='PROCESSED',
+                geographic_locations=[{'country': 'Kenya', 'continent': 'Africa'}],
+                age_appropriateness='AGE_7_9'
+            )
+
+        book = BookAssemblyService(DjangoNewsEventRepository()).assemble_book_for_month(2024, 5)
+
+        self.assertEqual(len(book.daily_entry_ids), 8)
+        self.assertEqual(len(book.end_of_month_quiz), 5)
+        self.assertIn('Kenya', book.parents_guide)
+
+    def test_quiz_events_span_continents(self):
+        """Test that quiz events are spread across the continents the month covers."""
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+        from content_pipeline.models import NewsEventModel
+        from datetime import timezone as dt_timezone
+
+        places = [('France', 'Europe')] * 9 + [('Kenya', 'Africa'), ('Japan', 'Asia'), ('Peru', 'South America')]
+        for i, (country, continent) in enumerate(places):
+            NewsEventModel.objects.create(
+                title=f'News {i}', raw_content=f'Content {i}',
+                source_url=f'https://example.com/{i}',
+                published_at=datetime(2024, 7, i + 1, tzinfo=dt_timezone.utc),
+                categories=['SCIENCE_DISCOVERY'], processing_status='PROCESSED',
+                geographic_locations=[{'country': country, 'continent': continent}],
+            )
+
+        service = BookAssemblyService(DjangoNewsEventRepository())
+        book = service.assemble_book_for_month(2024, 7)
+        quiz_events = service._load_quiz_events(book.assembly_state['quiz_candidates'])
+
+        self.assertEqual(len(quiz_events), 5)
+        self.assertEqual(
+            {event.geographic_locations[0].continent for event in quiz_events},
+            {'Europe', 'Africa', 'Asia', 'South America'}
+        )
+
+    def test_assemble_book_for_empty_month(self):
+        """Test assembling a month with no events."""
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+        book = BookAssemblyService(DjangoNewsEventRepository()).assemble_book_for_month(2024, 6)
+
+        self.assertEqual(book.daily_entry_ids, [])
+        self.assertEqual(book.end_of_month_quiz, [])
+        self.assertEqual(book.parents_guide, "No content available for this month's book.")
+
+
+@pytest.mark.django_db
+class IncrementalBookAssemblyTestCase(TestCase):
+    """Test appending daily events to a draft book."""
+
+    def _create_events(self, start_day, count):
+        from content_pipeline.models import NewsEventModel
+        from datetime import timezone as dt_timezone
+
+        return [
+            NewsEventModel.objects.create(
+                title=f'News {day}', raw_content='Content',
+                source_url=f'https://example.com/{day}',
+                published_at=datetime(2024, 7, day, tzinfo=dt_timezone.utc),
+                categories=['ANIMALS_NATURE'], processing_status='PROCESSED'
+            )
+            for day in range(start_day, start_day + count)
+        ]
+
+    def _use_case(self):
+        from book_assembly.application.use_cases.update_draft_book_use_case import UpdateDraftBookUseCase
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from book_assembly.infrastructure.repositories.monthly_book_repository import DjangoMonthlyBookRepository
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+        return UpdateDraftBookUseCase(
+            book_assembly_service=BookAssemblyService(DjangoNewsEventRepository()),
+            monthly_book_repository=DjangoMonthlyBookRepository()
+        )
+
+    def test_draft_appends_new_events_and_finalizes(self):
+        """Test that daily updates append events and finalization marks the book final."""
+        from book_assembly.models import MonthlyBookModel
+
+        first = self._create_events(1, 3)
+        self._use_case().execute(2024, 7)
+
+        book = MonthlyBookModel.objects.get(year=2024, month=7)
+        self.assertEqual(book.status, MonthlyBookModel.STATUS_DRAFT)
+        self.assertEqual(book.daily_entries, [str(event.id) for event in first])
+
+        second = self._create_events(10, 2)
+        self._use_case().execute(2024, 7, finalize=True)
+
+        book.refresh_from_db()
+        self.assertEqual(book.status, MonthlyBookModel.STATUS_FINAL)
+        self.assertEqual(book.daily_entries, [str(event.id) for event in first + second])
+        self.assertEqual(book.assembly_state['statistics']['category_counts'], {'ANIMALS_NATURE': 5})
+        self.assertEqual(MonthlyBookModel.objects.count(), 1)
+
+    def test_draft_rebuilds_when_included_event_changes(self):
+        """Test that re-categorized or unpublished events are not left stale in the draft."""
+        from book_assembly.models import MonthlyBookModel
+
+        first, second, third = self._create_events(1, 3)
+        self._use_case().execute(2024, 7)
+
+        first.categories = ['SPACE_EARTH']
+        first.save()
+        second.processing_status = 'REJECTED'
+        second.save()
+        self._use_case().execute(2024, 7)
+
+        book = MonthlyBookModel.objects.get(year=2024, month=7)
+        self.assertEqual(book.daily_entries, [str(first.id), str(third.id)])
+        self.assertEqual(
+            book.assembly_state['statistics']['category_counts'], {'ANIMALS_NATURE': 1, 'SPACE_EARTH': 1}
+        )
+
+    def test_unchanged_draft_update_does_not_rebuild(self):
+        """Test that an update with no new saves keeps the draft as it is."""
+        from unittest.mock import patch
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+
+        self._create_events(1, 3)
+        self._use_case().execute(2024, 7)
+
+        with patch.object(BookAssemblyService, 'assemble_book_for_month') as assemble:
+            self._use_case().execute(2024, 7)
+
+        assemble.assert_not_called()
+
+    def test_resaved_event_is_applied_without_rebuild(self):
+        """Test that re-saving a published event with unchanged counted fields only updates its version."""
+        from unittest.mock import patch
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+        first, _, _ = self._create_events(1, 3)
+        self._use_case().execute(2024, 7)
+
+        first.video_url = 'https://youtube.com/watch?v=owls'
+        first.save()
+        with patch.object(BookAssemblyService, 'assemble_book_for_month') as assemble:
+            draft = self._use_case().execute(2024, 7)
+
+        assemble.assert_not_called()
+        self.assertEqual(len(draft.daily_entry_ids), 3)
+        self.assertEqual(
+            draft.input_fingerprint,
+            BookAssemblyService(DjangoNewsEventRepository()).compute_fingerprint(2024, 7),
+        )
+
+    def test_finalize_does_not_reread_the_month(self):
+        """Test that finalizing uses the fingerprint and statistics kept in the assembly state."""
+        from unittest.mock import patch
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+        self._create_events(1, 3)
+        self._use_case().execute(2024, 7)
+        self._create_events(10, 2)
+
+        with patch.object(DjangoNewsEventRepository, 'get_month_statistics') as statistics, \
+                patch.object(DjangoNewsEventRepository, 'iter_event_versions_for_month') as versions:
+            final = self._use_case().execute(2024, 7, finalize=True)
+
+        statistics.assert_not_called()
+        versions.assert_not_called()
+        self.assertEqual(
+            final.input_fingerprint,
+            BookAssemblyService(DjangoNewsEventRepository()).compute_fingerprint(2024, 7),
+        )
+
+    def test_finalize_matches_full_assembly(self):
+        """Test that the final book's guide and statistics match a one-shot assembly."""
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+        self._create_events(1, 3)
+        self._use_case().execute(2024, 7)
+        self._create_events(10, 2)
+        final = self._use_case().execute(2024, 7, finalize=True)
+
+        rebuilt = BookAssemblyService(DjangoNewsEventRepository()).assemble_book_for_month(2024, 7)
+
+        self.assertEqual(final.parents_guide, rebuilt.parents_guide)
+        self.assertEqual(final.assembly_state['statistics'], rebuilt.assembly_state['statistics'])
+        self.assertEqual(final.end_of_month_quiz, rebuilt.end_of_month_quiz)
+
+    def test_incremental_quiz_candidates_match_full_rebuild(self):
+        """Test that the draft samples the same quiz events as a one-shot assembly."""
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+        self._create_events(1, 4)
+        self._use_case().execute(2024, 7)
+        self._create_events(5, 6)
+        draft = self._use_case().execute(2024, 7)
+
+        rebuilt = BookAssemblyService(DjangoNewsEventRepository()).assemble_book_for_month(2024, 7)
+
+        self.assertEqual(
+            draft.assembly_state['quiz_candidates'], rebuilt.assembly_state['quiz_candidates']
+        )
+        self.assertEqual(len(draft.end_of_month_quiz), 5)
+
+
+@pytest.mark.django_db
+class BookAssemblyFingerprintTestCase(TestCase):
+    """Test skipping re-assembly of unchanged months."""
+
+    def setUp(self):
+        from content_pipeline.models import NewsEventModel
+        from datetime import timezone as dt_timezone
+
+        self.events = [
+            NewsEventModel.objects.create(
+                title=f'News {day}', raw_content='Content',
+                source_url=f'https://example.com/{day}',
+                published_at=datetime(2024, 8, day, tzinfo=dt_timezone.utc),
+                categories=['ARTS_CULTURE'], processing_status='PROCESSED'
+            )
+            for day in range(1, 8)
+        ]
+
+    def _assemble(self, **options):
+        from django.core.management import call_command
+        from io import StringIO
+
+        out = StringIO()
+        call_command('assemble_book', year=2024, month=8, stdout=out, **options)
+        return out.getvalue()
+
+    def test_unchanged_month_is_skipped(self):
+        """Test that a second run without changes leaves the book untouched."""
+        from book_assembly.models import MonthlyBookModel
+
+        self._assemble()
+        book = MonthlyBookModel.objects.get(year=2024, month=8)
+
+        output = self._assemble()
+
+        self.assertIn('up to date', output)
+        self.assertEqual(MonthlyBookModel.objects.get(id=book.id).updated_at, book.updated_at)
+
+    def test_changed_event_or_force_rebuilds_with_same_quiz(self):
+        """Test that edits change the fingerprint and unchanged inputs give the same quiz."""
+        from book_assembly.models import MonthlyBookModel
+
+        self._assemble()
+        book = MonthlyBookModel.objects.get(year=2024, month=8)
+
+        self.assertIn('assembled successfully', self._assemble(force=True))
+        rebuilt = MonthlyBookModel.objects.get(id=book.id)
+        self.assertEqual(rebuilt.end_of_month_quiz, book.end_of_month_quiz)
+
+        self.events[0].title = 'Edited headline'
+        self.events[0].save()
+
+        self.assertIn('assembled successfully', self._assemble())
+        self.assertNotEqual(
+            MonthlyBookModel.objects.get(id=book.id).input_fingerprint, book.input_fingerprint
+        )
+
+    def test_finalized_draft_is_up_to_date(self):
+        """Test that a finalized draft carries the fingerprint of a full assembly."""
+        from book_assembly.tasks import finalize_book, update_draft_book
+
+        update_draft_book(2024, 8)
+        finalize_book(2024, 8)
+
+        self.assertIn('up to date', self._assemble())
+
+    def test_rebuilt_draft_is_finalized(self):
+        """Test that a draft carrying a full assembly's fingerprint is not mistaken for a final book."""
+        from book_assembly.models import MonthlyBookModel
+        from book_assembly.tasks import update_draft_book
+
+        update_draft_book(2024, 8)
+        draft = MonthlyBookModel.objects.get(year=2024, month=8)
+        self.assertEqual(draft.status, MonthlyBookModel.STATUS_DRAFT)
+        self.assertTrue(draft.input_fingerprint)
+
+        self.assertIn('assembled successfully', self._assemble())
+        self.assertEqual(MonthlyBookModel.objects.get(id=draft.id).status, MonthlyBookModel.STATUS_FINAL)
+        self.assertIn('up to date', self._assemble())
+
+
+@pytest.mark.django_db
+class AssembleBooksCommandTestCase(TestCase):
+    """Test the multi-month assemble_books command."""
+
+    def setUp(self):
+        from content_pipeline.models import NewsEventModel
+        from datetime import timezone as dt_timezone
+
+        for month in (1, 2, 3):
+            for day in range(1, 4):
+                NewsEventModel.objects.create(
+                    title=f'News {month}-{day}', raw_content='Content',
+                    source_url=f'https://example.com/{month}/{day}',
+                    published_at=datetime(2024, month, day, tzinfo=dt_timezone.utc),
+                    categories=['SPACE_EARTH'], processing_status='PROCESSED'
+                )
+
+    def _run(self, *args):
+        from django.core.management import call_command
+        from io import StringIO
+
+        out = StringIO()
+        call_command('assemble_books', *args, stdout=out)
+        return out.getvalue()
+
+    def test_assembles_each_month_and_skips_unchanged(self):
+        """Test that every month in the range is assembled once."""
+        from book_assembly.models import MonthlyBookModel
+
+        output = self._run('--from', '2024-01', '--to', '2024-03')
+
+        self.assertIn('3 assembled, 0 skipped, 0 failed', output)
+        self.assertEqual(
+            [len(book.daily_entries) for book in MonthlyBookModel.objects.order_by('month')], [3, 3, 3]
+        )
+        self.assertIn('0 assembled, 3 skipped', self._run('--from', '2024-01', '--to', '2024-03'))
+
+    def test_preloaded_events_match_streamed_assembly(self):
+        """Test that a book built from preloaded events matches one read from the database."""
+        from book_assembly.domain.services.book_assembly_service import BookAssemblyService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+        repository = DjangoNewsEventRepository()
+        service = BookAssemblyService(repository)
+        preloaded = service.assemble_book_for_month(2024, 2, events=list(repository.iter_events_for_month(2024, 2)))
+        streamed = service.assemble_book_for_month(2024, 2)
+
+        self.assertEqual(preloaded.input_fingerprint, streamed.input_fingerprint)
+        self.assertEqual(preloaded.end_of_month_quiz, streamed.end_of_month_quiz)
+        self.assertEqual(preloaded.parents_guide, streamed.parents_guide)
+
+    def test_crashed_worker_is_reported_per_month(self):
+        """Test that a broken process pool fails its months without aborting the run."""
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+        from unittest.mock import patch
+        from django.core.management.base import CommandError
+        from book_assembly.management.commands import assemble_books
+
+        class CrashingExecutor:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def submit(self, fn, year, month, force):
+                future = Future()
+                if month == 2:
+                    future.set_exception(BrokenProcessPool('worker died'))
+                else:
+                    future.set_result(fn(year, month, force))
+                return future
+
+        with patch.object(assemble_books, 'ProcessPoolExecutor', CrashingExecutor):
+            with self.assertRaisesMessage(CommandError, '2 assembled, 0 skipped, 1 failed'):
+                self._run('--from', '2024-01', '--to', '2024-03', '--workers', '2')
+
+    def test_invalid_range(self):
+        """Test that an inverted range is rejected."""
+        from django.core.management.base import CommandError
+
+        with self.assertRaises(CommandError):
+            self._run('--from', '2024-03', '--to', '2024-01')
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
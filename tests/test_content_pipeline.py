@@ -4,7 +4,7 @@ Tests for Content Pipeline module.
 import pytest
 import json
 from datetime import datetime, timedelta
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -13,6 +13,39 @@ from unittest.mock import patch, MagicMock
 User = get_user_model()
 
 
+def make_gemini_stub(**return_values):
+    """A Gemini port whose pipeline calls all succeed, with the given return values overridden."""
+    gemini = MagicMock()
+    gemini.filter_content_safety.return_value = True
+    gemini.categorize_content.return_value = 'ANIMALS_NATURE'
+    gemini.adapt_content_for_age.return_value = 'Adapted story'
+    gemini.generate_educational_context.return_value = 'Context'
+    gemini.verify_fact.return_value = True
+    gemini.extract_fun_facts.return_value = []
+    gemini.generate_questions.return_value = []
+    for name, value in return_values.items():
+        getattr(gemini, name).return_value = value
+    return gemini
+
+
+def make_ingest_use_case(gemini, articles):
+    """An IngestNewsEventsUseCase on the Django repository, fetching the given articles."""
+    from content_pipeline.application.use_cases.ingest_news_events_use_case import IngestNewsEventsUseCase
+    from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+    from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+    aggregator = MagicMock()
+    aggregator.iter_recent_news.return_value = articles
+    image_generation = MagicMock()
+    return IngestNewsEventsUseCase(
+        news_aggregator=aggregator,
+        news_event_repository=DjangoNewsEventRepository(),
+        content_processing_service=ContentProcessingService(gemini_api=gemini, image_generation=image_generation),
+        gemini_api=gemini,
+        image_generation=image_generation
+    )
+
+
 @pytest.mark.django_db
 class NewsEventModelTestCase(TestCase):
     """Test NewsEventModel."""
@@ -286,6 +319,72 @@ class NewsAPIAdapterTestCase(TestCase):
 
         self.assertEqual(articles, [])
 
+    def _page(self, query, page, count, total, start_day=20):
+        """Fake NewsAPI page whose articles get older page by page."""
+        articles = [
+            {
+                'title': f'{query} {page}-{i}',
+                'url': f'https://example.com/{query}/{page}/{i}',
+                'publishedAt': f'2024-01-{start_day - page:02d}T10:00:00Z',
+                'content': 'Content',
+                'source': {'name': 'Test Source'}
+            }
+            for i in range(count)
+        ]
+        response = MagicMock()
+        response.json.return_value = {'status': 'ok', 'totalResults': total, 'articles': articles}
+        return response
+
+    @patch('requests.get')
+    def test_iter_recent_news_pages_until_since(self, mock_get):
+        """Test that paging stops at the first page reaching past the since boundary."""
+        from content_pipeline.infrastructure.adapters.news_api_adapter import NewsAPIAdapter
+
+        mock_get.side_effect = lambda url, params, timeout: self._page(params['q'], params['page'], 2, 100)
+
+        adapter = NewsAPIAdapter(api_key='test-api-key', page_size=2, max_pages=10, max_workers=1)
+        articles = list(adapter.iter_recent_news(['science'], since=datetime(2024, 1, 17)))
+
+        # Pages 1-3 are on or after Jan 17; page 4 crosses the boundary
+        self.assertEqual(len(articles), 6)
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch('requests.get')
+    def test_iter_recent_news_requests_no_page_past_since(self, mock_get):
+        """Test that a query's next page is only requested while its results are newer than since."""
+        from content_pipeline.infrastructure.adapters.news_api_adapter import NewsAPIAdapter
+
+        mock_get.side_effect = lambda url, params, timeout: self._page(params['q'], params['page'], 2, 100)
+
+        adapter = NewsAPIAdapter(api_key='test-api-key', page_size=2, max_pages=10, max_workers=4)
+        articles = list(adapter.iter_recent_news(['science'], since=datetime(2024, 1, 18)))
+
+        # Page 2 reaches Jan 18; page 3 is older, so pages 4 and later are never requested
+        self.assertEqual(len(articles), 4)
+        self.assertEqual([c.kwargs['params']['page'] for c in mock_get.call_args_list], [1, 2, 3])
+
+    @patch('requests.get')
+    def test_iter_recent_news_fans_out_queries_and_deduplicates(self, mock_get):
+        """Test that several queries are fetched and shared URLs are yielded once."""
+        from content_pipeline.infrastructure.adapters.news_api_adapter import NewsAPIAdapter
+
+        def fetch(url, params, timeout):
+            response = self._page(params['q'], params['page'], 2 if params['page'] < 2 else 1, 3)
+            if params['page'] == 1:
+                # Both topics lead with the same story
+                response.json.return_value['articles'][0]['url'] = 'https://example.com/shared'
+            return response
+
+        mock_get.side_effect = fetch
+
+        adapter = NewsAPIAdapter(api_key='test-api-key', page_size=2)
+        articles = list(adapter.iter_recent_news(['space', 'animals'], since=datetime(2024, 1, 1)))
+
+        urls = [article.url for article in articles]
+        self.assertEqual(len(urls), len(set(urls)))
+        self.assertEqual(len(urls), 5)
+        self.assertEqual(mock_get.call_count, 4)
+
     def test_adapter_without_api_key(self):
         """Test adapter initialization without API key."""
         from content_pipeline.infrastructure.adapters.news_api_adapter import NewsAPIAdapter
@@ -430,6 +529,63 @@ class NewsEventRepositoryTestCase(TestCase):
         finally:
             del NewsEventModel.image_path
 
+    def test_iter_events_for_month_pages_through_month(self):
+        """Test streaming a month's events across keyset pages."""
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+        from content_pipeline.models import NewsEventModel
+        from datetime import timezone as dt_timezone
+
+        repo = DjangoNewsEventRepository()
+        published_at = datetime(2024, 3, 15, tzinfo=dt_timezone.utc)
+        for i in range(5):
+            # Shared timestamps exercise the id tie-breaker
+            NewsEventModel.objects.create(
+                title=f'March {i}', raw_content='Content',
+                source_url=f'https://example.com/march/{i}', published_at=published_at
+            )
+        NewsEventModel.objects.create(
+            title='April', raw_content='Content',
+            source_url='https://example.com/april',
+            published_at=datetime(2024, 4, 1, tzinfo=dt_timezone.utc)
+        )
+
+        events = list(repo.iter_events_for_month(2024, 3, chunk_size=2))
+
+        self.assertEqual(len(events), 5)
+        self.assertEqual(len({event.id for event in events}), 5)
+        self.assertTrue(all(event.raw_content == '' for event in events))
+
+    def test_get_month_statistics(self):
+        """Test aggregating guide statistics for a month."""
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+        from content_pipeline.domain.value_objects import AgeRange, Category
+        from content_pipeline.models import NewsEventModel
+        from datetime import timezone as dt_timezone
+
+        published_at = datetime(2024, 3, 15, tzinfo=dt_timezone.utc)
+        NewsEventModel.objects.create(
+            title='Space', raw_content='Content', source_url='https://example.com/1',
+            published_at=published_at, categories=['SCIENCE_DISCOVERY', 'SPACE_EARTH'],
+            geographic_locations=[{'country': 'Japan', 'continent': 'Asia'}], age_appropriateness='AGE_7_9'
+        )
+        NewsEventModel.objects.create(
+            title='Lab', raw_content='Content', source_url='https://example.com/2',
+            published_at=published_at, categories=['SCIENCE_DISCOVERY'],
+            geographic_locations=[{'country': 'Chile', 'continent': 'South America'}]
+        )
+        NewsEventModel.objects.create(
+            title='Next month', raw_content='Content', source_url='https://example.com/3',
+            published_at=datetime(2024, 4, 2, tzinfo=dt_timezone.utc), categories=['SCIENCE_DISCOVERY']
+        )
+
+        statistics = DjangoNewsEventRepository().get_month_statistics(2024, 3)
+
+        self.assertEqual(statistics.event_count, 2)
+        self.assertEqual(statistics.category_counts[Category.SCIENCE_DISCOVERY], 2)
+        self.assertEqual(statistics.category_counts[Category.SPACE_EARTH], 1)
+        self.assertEqual(statistics.countries, {'Japan', 'Chile'})
+        self.assertEqual(statistics.age_ranges, {AgeRange.AGE_7_9})
+
 
 @pytest.mark.django_db
 class ContentProcessingServiceTestCase(TestCase):
@@ -456,5 +612,1071 @@ class ContentProcessingServiceTestCase(TestCase):
         mock_gemini_api.filter_content_safety.assert_called_once_with(safe_content)
 
 
+class StageGraphTestCase(TestCase):
+    """Test the content processing stage graph."""
+
+    def _event(self):
+        from content_pipeline.domain.entities import NewsEvent
+
+        return NewsEvent(
+            id='event-1', title='Whales sing', raw_content='Original story',
+            source_url='https://example.com/whales', published_at=datetime.now()
+        )
+
+    def _service(self):
+        from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+
+        gemini = make_gemini_stub(
+            generate_educational_context='Whales are mammals.',
+            extract_fun_facts=['Whales sing for hours'],
+            generate_questions=['Why do whales sing?'],
+            suggest_search_terms={'image_query': 'whale', 'youtube_query': 'whale song'},
+        )
+        pexels = MagicMock()
+        pexels.search_photo.return_value = 'https://images.example.com/whale.jpg'
+        youtube = MagicMock()
+        youtube.search_video.return_value = 'https://youtube.com/watch?v=whale'
+        service = ContentProcessingService(
+            gemini_api=gemini, image_generation=MagicMock(), pexels=pexels, youtube=youtube
+        )
+        return service, gemini
+
+    def test_process_event_applies_every_stage(self):
+        """Test that the graph produces the fully processed event."""
+        from content_pipeline.domain.value_objects import Category
+
+        service, gemini = self._service()
+        stage_run = service.process_event(self._event())
+
+        self.assertTrue(stage_run.succeeded)
+        event = stage_run.event
+        self.assertEqual(event.categories, [Category.ANIMALS_NATURE])
+        self.assertEqual(event.raw_content, 'Adapted story')
+        self.assertTrue(event.is_verified)
+        self.assertEqual(event.image_path, 'https://images.example.com/whale.jpg')
+        self.assertEqual(event.video_url, 'https://youtube.com/watch?v=whale')
+        # Stages downstream of adaptation see the adapted story
+        gemini.generate_questions.assert_called_once_with('Adapted story', 3)
+        # Search terms are computed once and shared by image and video lookups
+        gemini.suggest_search_terms.assert_called_once_with('Whales sing', 'Adapted story')
+        self.assertEqual(
+            {t.stage for t in stage_run.timings},
+            {'categorize', 'locations', 'adapt', 'extract_facts', 'verify_facts', 'fun_facts',
+             'questions', 'search_terms', 'image', 'video'}
+        )
+
+    def test_failed_stage_skips_dependents(self):
+        """Test that a failure only skips the stages that depend on it."""
+        service, gemini = self._service()
+        gemini.suggest_search_terms.side_effect = RuntimeError('quota exceeded')
+
+        stage_run = service.process_event(self._event())
+        outcomes = {t.stage: t.outcome for t in stage_run.timings}
+
+        self.assertFalse(stage_run.succeeded)
+        self.assertEqual(stage_run.failed_stages, ['search_terms'])
+        self.assertEqual(outcomes['image'], 'skipped')
+        self.assertEqual(outcomes['video'], 'skipped')
+        self.assertEqual(outcomes['questions'], 'ok')
+        self.assertIn('quota exceeded', [t for t in stage_run.timings if t.stage == 'search_terms'][0].error)
+
+    def test_independent_stages_run_concurrently(self):
+        """Test that stages without dependencies between them overlap."""
+        import threading
+        from content_pipeline.domain.services.stage_graph import Stage, StageGraph
+
+        barrier = threading.Barrier(2, timeout=5)
+        graph = StageGraph([
+            Stage(name='a', run=lambda event, _: barrier.wait()),
+            Stage(name='b', run=lambda event, _: barrier.wait()),
+        ])
+
+        self.assertTrue(graph.run(self._event()).succeeded)
+
+    def test_cycle_is_rejected(self):
+        """Test that cyclic dependencies are rejected."""
+        from content_pipeline.domain.services.stage_graph import Stage, StageGraph
+
+        with self.assertRaises(ValueError):
+            StageGraph([
+                Stage(name='a', run=lambda event, _: None, depends_on=('b',)),
+                Stage(name='b', run=lambda event, _: None, depends_on=('a',)),
+            ])
+
+
+@pytest.mark.django_db
+class ResumableIngestionTestCase(TestCase):
+    """Test per-stage checkpoints and resuming interrupted processing."""
+
+    def _use_case(self, gemini):
+        from content_pipeline.domain.ports.external_service_ports import RawNewsArticle
+        from datetime import timezone as dt_timezone
+
+        return make_ingest_use_case(gemini, [RawNewsArticle(
+            title='Bees dance', content='Original story', url='https://example.com/bees',
+            published_at=datetime.now(dt_timezone.utc), source_name='Example'
+        )])
+
+    def _gemini(self):
+        return make_gemini_stub(
+            generate_educational_context='Bees talk by dancing.', generate_questions=['How do bees talk?']
+        )
+
+    def test_failed_stage_is_checkpointed_and_retried_alone(self):
+        """Test that completed stages survive a failure and only the failed one re-runs."""
+        from content_pipeline.models import NewsEventModel
+
+        gemini = self._gemini()
+        gemini.extract_fun_facts.side_effect = RuntimeError('Gemini unavailable')
+        self._use_case(gemini).execute(query='bees')
+
+        event = NewsEventModel.objects.get(source_url='https://example.com/bees')
+        self.assertEqual(event.processing_status, 'ADAPTED')
+        self.assertEqual(event.raw_content, 'Adapted story')
+        self.assertEqual(event.source_content, 'Original story')
+        self.assertNotIn('fun_facts', event.completed_stages)
+        self.assertEqual(event.completed_stages['categorize'],
+                         {'categories': ['ANIMALS_NATURE'], 'decided_by': 'gemini'})
+        self.assertEqual(event.completed_stages['safety'], {'safe': True, 'decided_by': 'gemini'})
+
+        gemini.extract_fun_facts.side_effect = None
+        gemini.extract_fun_facts.return_value = ['Bees have five eyes']
+        self._use_case(gemini).resume()
+
+        event.refresh_from_db()
+        self.assertEqual(event.processing_status, 'PROCESSED')
+        self.assertEqual(event.fun_facts, ['Bees have five eyes'])
+        self.assertEqual(gemini.categorize_content.call_count, 1)
+        self.assertEqual(gemini.adapt_content_for_age.call_count, 1)
+        self.assertEqual(event.completed_stages['safety'], {'safe': True, 'decided_by': 'gemini'})
+
+    def test_in_progress_events_are_not_published(self):
+        """Test that checkpointed events are hidden from the public API."""
+        gemini = self._gemini()
+        gemini.extract_fun_facts.side_effect = RuntimeError('Gemini unavailable')
+        self._use_case(gemini).execute(query='bees')
+
+        response = Client().get('/api/content/news-events/')
+
+        self.assertEqual(response.json()['results'], [])
+
+
+@pytest.mark.django_db
+class EventLeaseTestCase(TestCase):
+    """Test leasing events for concurrent reprocessing."""
+
+    def setUp(self):
+        from content_pipeline.models import NewsEventModel
+
+        self.events = [
+            NewsEventModel.objects.create(
+                title=f'Backlog {i}', raw_content='Content', source_url=f'https://example.com/backlog/{i}',
+                published_at=datetime.now() - timedelta(hours=i), processing_status='RAW'
+            )
+            for i in range(4)
+        ]
+        NewsEventModel.objects.create(
+            title='Done', raw_content='Content', source_url='https://example.com/done',
+            published_at=datetime.now(), processing_status='PROCESSED'
+        )
+
+    def test_workers_claim_disjoint_batches(self):
+        """Test that two workers never lease the same event."""
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+
+        repo = DjangoNewsEventRepository()
+        first = repo.claim_events_for_processing('worker-a', 3, 600)
+        second = repo.claim_events_for_processing('worker-b', 3, 600)
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 1)
+        self.assertFalse({e.id for e in first} & {e.id for e in second})
+        self.assertEqual(repo.claim_events_for_processing('worker-c', 3, 600), [])
+        self.assertFalse(repo.claim_event(first[0].id, 'worker-c', 600))
+
+    def test_expired_lease_can_be_reclaimed(self):
+        """Test that a crashed worker's events become claimable after the lease expires."""
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+        from content_pipeline.models import NewsEventModel
+        from django.utils import timezone
+
+        repo = DjangoNewsEventRepository()
+        claimed = repo.claim_events_for_processing('worker-a', 4, 600)
+        NewsEventModel.objects.filter(id=claimed[0].id).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+        reclaimed = repo.claim_events_for_processing('worker-b', 4, 600)
+
+        self.assertEqual([e.id for e in reclaimed], [claimed[0].id])
+
+    def test_worker_loop_processes_backlog_and_delays_failures(self):
+        """Test that the worker finishes the backlog and holds back failed events."""
+        from content_pipeline.application.use_cases.reprocess_events_use_case import ReprocessEventsUseCase
+        from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+        from content_pipeline.models import NewsEventModel
+
+        gemini = make_gemini_stub()
+
+        def adapt(content, level):
+            # The first article times out, the rest succeed
+            if gemini.adapt_content_for_age.call_count == 1:
+                raise RuntimeError('timeout')
+            return 'Adapted'
+
+        gemini.adapt_content_for_age.side_effect = adapt
+
+        repo = DjangoNewsEventRepository()
+        use_case = ReprocessEventsUseCase(
+            news_event_repository=repo,
+            content_processing_service=ContentProcessingService(gemini_api=gemini, image_generation=MagicMock()),
+            worker_id='worker-a', batch_size=2, retry_delay_seconds=900
+        )
+
+        results = use_case.run()
+
+        self.assertEqual(results, {'processed': 3, 'failed': 1})
+        self.assertEqual(NewsEventModel.objects.filter(processing_status='PROCESSED').count(), 4)
+        failed = NewsEventModel.objects.exclude(processing_status='PROCESSED').get()
+        self.assertEqual(failed.lease_owner, '')
+        self.assertIsNotNone(failed.lease_expires_at)
+        self.assertEqual(repo.claim_events_for_processing('worker-b', 10, 600), [])
+
+    def _lease_use_case(self, repo):
+        from content_pipeline.application.use_cases.reprocess_events_use_case import ReprocessEventsUseCase
+        from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+
+        return ReprocessEventsUseCase(
+            news_event_repository=repo,
+            content_processing_service=ContentProcessingService(
+                gemini_api=make_gemini_stub(), image_generation=MagicMock()
+            ),
+            worker_id='worker-a', lease_seconds=120
+        )
+
+    def _leased_event(self):
+        from content_pipeline.domain.entities import NewsEvent
+
+        return NewsEvent(
+            id='event-1', title='Whales sing', raw_content='Original story',
+            source_url='https://example.com/whales', published_at=datetime.now()
+        )
+
+    def test_lease_is_renewed_at_every_checkpoint(self):
+        """Test that each completed stage extends the lease before it is saved."""
+        repo = MagicMock()
+        repo.claim_event.return_value = True
+
+        self.assertTrue(self._lease_use_case(repo).process_event(self._leased_event()))
+
+        # One renewal per checkpointed stage, then the final save
+        self.assertEqual(repo.claim_event.call_count, repo.save.call_count - 1)
+        self.assertGreater(repo.claim_event.call_count, 1)
+        repo.claim_event.assert_called_with('event-1', 'worker-a', 120)
+
+    def test_lost_lease_stops_processing_without_saving(self):
+        """Test that a worker whose lease was taken over does not overwrite the event."""
+        repo = MagicMock()
+        repo.claim_event.return_value = False
+        use_case = self._lease_use_case(repo)
+
+        self.assertFalse(use_case.process_event(self._leased_event()))
+
+        repo.save.assert_not_called()
+        self.assertEqual(use_case.stats['failed'], 1)
+
+
+
+@pytest.mark.django_db
+class IngestFanOutTestCase(TestCase):
+    """Test fanning daily ingestion out as a django-q group."""
+
+    def _articles(self, *slugs):
+        from content_pipeline.domain.ports.external_service_ports import RawNewsArticle
+        from datetime import timezone as dt_timezone
+
+        return [
+            RawNewsArticle(
+                title=f'Story {slug}', content=f'Story about {slug}', url=f'https://example.com/{slug}',
+                published_at=datetime.now(dt_timezone.utc), source_name='Example'
+            )
+            for slug in slugs
+        ]
+
+    def _gemini(self):
+        gemini = make_gemini_stub()
+        gemini.filter_content_safety.side_effect = lambda content: 'unsafe' not in content
+        return gemini
+
+    def test_staging_deduplicates_without_llm_calls(self):
+        """Test that staging stores each article once as RAW and calls no LLM."""
+        from content_pipeline.models import NewsEventModel
+
+        gemini = self._gemini()
+        use_case = make_ingest_use_case(gemini, self._articles('owls', 'owls', 'seals'))
+
+        staged = use_case.stage_articles('animals')
+
+        self.assertEqual(len(staged), 2)
+        self.assertEqual(NewsEventModel.objects.filter(processing_status='RAW').count(), 2)
+        self.assertFalse(gemini.method_calls)
+
+    def test_group_processes_chunks_and_aggregates_once(self):
+        """Test that every chunk is processed and the aggregation step runs once."""
+        from content_pipeline import tasks
+        from content_pipeline.models import LLMUsageRun, NewsEventModel, PipelineRun
+        from django_q.models import Task
+
+        gemini = self._gemini()
+        articles = self._articles('owls', 'seals', 'unsafe-bears')
+        caches = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+        with override_settings(CACHES=caches), \
+                patch('django_q.tasks.Conf.SYNC', True), \
+                patch.object(tasks, 'INGEST_CHUNK_SIZE', 2), \
+                patch.object(tasks, 'build_ingest_use_case', side_effect=lambda: make_ingest_use_case(gemini, articles)), \
+                patch('book_assembly.tasks.update_draft_book') as update_draft_book:
+            tasks.ingest_daily_news()
+
+        self.assertEqual(NewsEventModel.objects.filter(processing_status='PROCESSED').count(), 2)
+        self.assertEqual(NewsEventModel.objects.get(source_url='https://example.com/unsafe-bears').processing_status, 'REJECTED')
+        self.assertEqual(Task.objects.filter(func='content_pipeline.tasks.process_event_chunk').count(), 2)
+        finalize = Task.objects.get(func='content_pipeline.tasks.finalize_ingest')
+        self.assertEqual(finalize.result, 'Ingested 3 events, 0 failed, 0 chunks failed')
+        self.assertTrue(LLMUsageRun.objects.filter(run_id=finalize.args[0], kind='ingest').exists())
+        run = PipelineRun.objects.get(run_id=finalize.args[0])
+        self.assertEqual((run.articles_fetched, run.articles_staged, run.rejected_unsafe, run.events_processed),
+                         (3, 3, 1, 3))
+        self.assertEqual(run.stage_latency['adapt']['ok'], 2)
+        update_draft_book.assert_called_once_with()
+
+    def test_rejected_articles_are_not_staged_again(self):
+        """Test that articles which failed the safety check are skipped on later runs."""
+        gemini = self._gemini()
+        use_case = make_ingest_use_case(gemini, self._articles('unsafe-bears'))
+        for event_id in use_case.stage_articles('animals'):
+            use_case.process_staged(event_id)
+
+        self.assertEqual(use_case.stage_articles('animals'), [])
+        gemini.categorize_content.assert_not_called()
+
+
+@pytest.mark.django_db
+class NearDuplicateTestCase(TestCase):
+    """Test SimHash near-duplicate detection."""
+
+    STORY = (
+        'Scientists tracking humpback whales off the coast of Australia have recorded '
+        'a new song that spread from one group of whales to another across the ocean. '
+        'Researchers say the song changed slowly over two years as young whales copied older ones.'
+    )
+
+    def test_syndicated_copy_is_near_duplicate(self):
+        """Test that outlet suffixes and truncation differences stay within the distance."""
+        from content_pipeline.domain.services.near_duplicate import hamming_distance, is_near_duplicate, simhash
+
+        original = simhash('Whales share a new song - BBC News', self.STORY + ' [+1830 chars]')
+        syndicated = simhash('Whales share a new song | Reuters', self.STORY[:-12] + ' [+2200 chars]')
+        unrelated = simhash('Robot explores Mars crater', 'A rover climbed the rim of a crater on Mars to study old lake beds.')
+
+        self.assertTrue(is_near_duplicate(original, syndicated))
+        self.assertGreater(hamming_distance(original, unrelated), 10)
+
+    def test_repository_finds_duplicate_by_band(self):
+        """Test lookups across the signed storage of fingerprints with the top bit set."""
+        from content_pipeline.domain.entities import NewsEvent
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+        from django.utils import timezone
+
+        repo = DjangoNewsEventRepository()
+        fingerprint = 0xF0F0_1234_5678_9ABC
+        repo.save(NewsEvent(
+            id='6f1c1d4e-4b9f-4c0e-9c6a-1d2e3f4a5b6c', title='Stored', raw_content='Body',
+            source_url='https://example.com/stored', published_at=timezone.now(), simhash=fingerprint
+        ))
+
+        self.assertEqual(repo.get_by_id('6f1c1d4e-4b9f-4c0e-9c6a-1d2e3f4a5b6c').simhash, fingerprint)
+        self.assertEqual(repo.find_near_duplicate(fingerprint ^ 0b101), '6f1c1d4e-4b9f-4c0e-9c6a-1d2e3f4a5b6c')
+        self.assertIsNone(repo.find_near_duplicate(fingerprint ^ 0b1111))
+        self.assertIsNone(repo.find_near_duplicate(fingerprint, exclude_id='6f1c1d4e-4b9f-4c0e-9c6a-1d2e3f4a5b6c'))
+
+    def test_syndicated_copies_are_staged_once(self):
+        """Test that the same story under several URLs is only staged once."""
+        from content_pipeline.domain.ports.external_service_ports import RawNewsArticle
+        from content_pipeline.models import NewsEventModel
+        from datetime import timezone as dt_timezone
+
+        use_case = make_ingest_use_case(make_gemini_stub(), [
+            RawNewsArticle(
+                title='Whales share a new song', content=self.STORY, url=f'https://outlet{i}.example.com/whales',
+                published_at=datetime.now(dt_timezone.utc), source_name=f'Outlet {i}'
+            )
+            for i in range(5)
+        ])
+
+        staged = use_case.stage_articles('whales')
+
+        self.assertEqual(len(staged), 1)
+        self.assertEqual(NewsEventModel.objects.count(), 1)
+        self.assertIsNotNone(NewsEventModel.objects.get().simhash_band_0)
+
+
+    def test_backfill_fingerprints_the_fetched_text(self):
+        """Test that backfilled fingerprints never come from an adapted story."""
+        from content_pipeline.domain.services.near_duplicate import simhash
+        from content_pipeline.models import NewsEventModel
+        from django.core.management import call_command
+        from django.utils import timezone
+        from io import StringIO
+
+        for slug, processing_status, source_content in (
+            ('kept', 'PROCESSED', self.STORY), ('staged', 'RAW', ''), ('legacy', 'PROCESSED', ''),
+        ):
+            NewsEventModel.objects.create(
+                title=slug, raw_content='Adapted story' if processing_status == 'PROCESSED' else self.STORY,
+                source_content=source_content, source_url=f'https://example.com/{slug}',
+                published_at=timezone.now(), processing_status=processing_status
+            )
+
+        call_command('backfill_simhash', stdout=StringIO())
+
+        fingerprints = dict(NewsEventModel.objects.values_list('title', 'simhash'))
+        self.assertEqual(fingerprints['kept'] % (1 << 64), simhash('kept', self.STORY))
+        self.assertEqual(fingerprints['staged'] % (1 << 64), simhash('staged', self.STORY))
+        self.assertEqual(fingerprints['legacy'] % (1 << 64), simhash('legacy', ''))
+
+@pytest.mark.django_db
+class PrescreenTestCase(TestCase):
+    """Test the local safety and category pre-screen."""
+
+    SAFE_TEXTS = [
+        'Baby panda cubs play in the snow at the zoo',
+        'Students build a robot that plants trees in the park',
+        'Astronomers spot a comet shining over the mountains',
+        'Young swimmer breaks a national record at the games',
+    ]
+    UNSAFE_TEXTS = [
+        'Gunman kills three in violent shooting downtown',
+        'Bomb attack kills soldiers as war escalates',
+        'Police investigate brutal murder after shooting',
+        'Violent attack leaves victims dead in war zone',
+    ]
+
+    def _create_events(self, copies=15):
+        from content_pipeline.models import NewsEventModel
+        from django.utils import timezone
+
+        for i in range(copies):
+            for j, text in enumerate(self.SAFE_TEXTS):
+                category = 'ANIMALS_NATURE' if j % 2 == 0 else 'SPACE_EARTH'
+                # Published events carry the adapted story in raw_content
+                NewsEventModel.objects.create(
+                    title=f'Story {i}-{j}', raw_content='Adapted story for children', source_content=text,
+                    source_url=f'https://example.com/safe/{i}/{j}',
+                    published_at=timezone.now(), processing_status='PROCESSED', categories=[category],
+                    completed_stages={
+                        'safety': {'safe': True, 'decided_by': 'gemini'},
+                        'categorize': {'categories': [category], 'decided_by': 'gemini'},
+                    }
+                )
+            for j, text in enumerate(self.UNSAFE_TEXTS):
+                NewsEventModel.objects.create(
+                    title=f'Story {i}-{j}', raw_content=text, source_content=text,
+                    source_url=f'https://example.com/unsafe/{i}/{j}',
+                    published_at=timezone.now(), processing_status='REJECTED',
+                    completed_stages={'safety': {'safe': False, 'decided_by': 'gemini'}}
+                )
+
+    def test_model_round_trips_through_json(self):
+        """Test that a trained model predicts the same after serialization."""
+        from content_pipeline.domain.services.prescreen import HashedNaiveBayes
+
+        model = HashedNaiveBayes().fit(
+            [(text, 'SAFE') for text in self.SAFE_TEXTS] + [(text, 'UNSAFE') for text in self.UNSAFE_TEXTS]
+        )
+        restored = HashedNaiveBayes.from_dict(json.loads(json.dumps(model.to_dict())))
+
+        self.assertEqual(model.predict('A deadly shooting and war attack')[0], 'UNSAFE')
+        self.assertEqual(restored.predict_proba('Panda cubs at the zoo'), model.predict_proba('Panda cubs at the zoo'))
+
+    def test_confident_decisions_skip_gemini(self):
+        """Test that confident cases are decided locally and uncertain ones are deferred."""
+        from content_pipeline.domain.entities import NewsEvent
+        from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+        from content_pipeline.domain.services.prescreen import HashedNaiveBayes, Prescreen
+        from content_pipeline.domain.value_objects import Category
+
+        safety = HashedNaiveBayes().fit(
+            [(text, 'SAFE') for text in self.SAFE_TEXTS] + [(text, 'UNSAFE') for text in self.UNSAFE_TEXTS] * 3
+        )
+        category = HashedNaiveBayes().fit([(text, 'ANIMALS_NATURE') for text in self.SAFE_TEXTS[:1]] * 5
+                                          + [(text, 'SPACE_EARTH') for text in self.SAFE_TEXTS[2:3]] * 5)
+        gemini = MagicMock()
+        gemini.filter_content_safety.return_value = True
+        gemini.categorize_content.return_value = 'ARTS_CULTURE'
+        service = ContentProcessingService(
+            gemini_api=gemini, image_generation=MagicMock(),
+            prescreen=Prescreen(safety_model=safety, category_model=category, safety_threshold=0.9, category_threshold=0.9),
+        )
+
+        self.assertFalse(service.filter_content_safety('Gunman kills soldiers in violent bomb attack'))
+        gemini.filter_content_safety.assert_not_called()
+        self.assertTrue(service.filter_content_safety('A quiet afternoon'))
+        gemini.filter_content_safety.assert_called_once_with('A quiet afternoon')
+
+        event = NewsEvent(id='1', title='Panda cubs', raw_content='Baby panda cubs play in the snow at the zoo',
+                          source_url='https://example.com', published_at=datetime.now())
+        self.assertEqual(service.categorize_event(event).categories, [Category.ANIMALS_NATURE])
+        gemini.categorize_content.assert_not_called()
+        self.assertEqual(service.prescreen.stats['safety_local'], 1)
+        self.assertEqual(service.prescreen.stats['safety_deferred'], 1)
+
+    def test_decisions_record_who_took_them(self):
+        """Test that safety and category decisions name the pre-screen, Gemini or the fallback."""
+        from content_pipeline.domain.entities import NewsEvent
+        from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+        from content_pipeline.domain.value_objects import Category
+
+        prescreen = MagicMock()
+        prescreen.is_unsafe.side_effect = lambda content: 'shooting' in content
+        prescreen.category.return_value = None
+        gemini = make_gemini_stub(filter_content_safety=None, categorize_content=None)
+        service = ContentProcessingService(gemini_api=gemini, image_generation=MagicMock(), prescreen=prescreen)
+        event = NewsEvent(id='1', title='Comet', raw_content='A comet was seen.',
+                          source_url='https://example.com', published_at=datetime.now())
+
+        self.assertEqual(service.check_content_safety('A deadly shooting'), (False, 'prescreen'))
+        self.assertEqual(service.check_content_safety('A comet was seen.'), (True, 'fallback'))
+        self.assertEqual(service.decide_category(event), ([Category.SCIENCE_DISCOVERY], 'fallback'))
+
+        gemini.filter_content_safety.return_value = False
+        gemini.categorize_content.return_value = 'SPACE_EARTH'
+        self.assertEqual(service.check_content_safety('A comet was seen.'), (False, 'gemini'))
+        self.assertEqual(service.decide_category(event), ([Category.SPACE_EARTH], 'gemini'))
+
+    def test_prescreen_classifies_the_fetched_text(self):
+        """Test that a resumed event is categorized from its source text, not the adapted story."""
+        from content_pipeline.domain.entities import NewsEvent
+        from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+
+        prescreen = MagicMock()
+        prescreen.category.return_value = None
+        gemini = make_gemini_stub()
+        service = ContentProcessingService(gemini_api=gemini, image_generation=MagicMock(), prescreen=prescreen)
+        event = NewsEvent(id='1', title='Panda cubs', raw_content='Adapted story', source_content='Original story',
+                          source_url='https://example.com', published_at=datetime.now())
+
+        service.categorize_event(event)
+
+        prescreen.category.assert_called_once_with('Panda cubs', 'Original story')
+        gemini.categorize_content.assert_called_once_with('Panda cubs', 'Original story')
+
+    def test_train_command_reports_and_saves_models(self):
+        """Test that train_prescreen evaluates on a holdout and stores both models."""
+        from content_pipeline.models import PrescreenModel
+        from content_pipeline.tasks import load_prescreen
+        from django.core.management import call_command
+        from io import StringIO
+
+        from content_pipeline.domain.value_objects import Category
+        from content_pipeline.models import NewsEventModel
+        from django.utils import timezone
+
+        self._create_events()
+        # Adapted before the original text was kept; left out of training
+        NewsEventModel.objects.create(
+            title='Legacy', raw_content='Adapted story for children', source_url='https://example.com/legacy',
+            published_at=timezone.now(), processing_status='PROCESSED', categories=['ANIMALS_NATURE']
+        )
+        # Labels Gemini did not decide are left out, so the models never learn from their own guesses
+        NewsEventModel.objects.create(
+            title='Prescreened', raw_content='A quiet afternoon', source_content='A quiet afternoon',
+            source_url='https://example.com/prescreened', published_at=timezone.now(),
+            processing_status='REJECTED', completed_stages={'safety': {'safe': False, 'decided_by': 'prescreen'}}
+        )
+        NewsEventModel.objects.create(
+            title='Fallback', raw_content='Adapted story for children', source_content='Gemini was down',
+            source_url='https://example.com/fallback', published_at=timezone.now(),
+            processing_status='PROCESSED', categories=['SCIENCE_DISCOVERY'], completed_stages={
+                'safety': {'safe': True, 'decided_by': 'fallback'},
+                'categorize': {'categories': ['SCIENCE_DISCOVERY'], 'decided_by': 'fallback'},
+            }
+        )
+        out = StringIO()
+        call_command('train_prescreen', stdout=out, stderr=StringIO())
+
+        self.assertIn('precision', out.getvalue())
+        self.assertEqual(set(PrescreenModel.objects.values_list('name', flat=True)), {'safety', 'category'})
+        safety = PrescreenModel.objects.get(name='safety')
+        self.assertEqual(safety.sample_count, 120)
+        self.assertIn('UNSAFE', safety.metrics['labels'])
+        self.assertEqual(PrescreenModel.objects.get(name='category').sample_count, 60)
+
+        prescreen = load_prescreen()
+        self.assertTrue(prescreen.is_unsafe('Gunman kills three in violent shooting downtown'))
+        self.assertEqual(prescreen.category('Robots', self.SAFE_TEXTS[1]), Category.SPACE_EARTH)
+
+    def test_loaded_models_are_reused_until_retrained(self):
+        """Test that model parameters are parsed once per trained model, not per service."""
+        from content_pipeline.tasks import load_prescreen
+        from django.core.management import call_command
+        from io import StringIO
+
+        self._create_events()
+        call_command('train_prescreen', stdout=StringIO(), stderr=StringIO())
+        first = load_prescreen()
+
+        self.assertIs(load_prescreen().safety_model, first.safety_model)
+
+        call_command('train_prescreen', stdout=StringIO(), stderr=StringIO())
+        self.assertIsNot(load_prescreen().safety_model, first.safety_model)
+
+    def test_train_command_skips_without_enough_labels(self):
+        """Test that no model is saved from too few labelled events."""
+        from content_pipeline.models import PrescreenModel
+        from content_pipeline.tasks import load_prescreen
+        from django.core.management import call_command
+        from io import StringIO
+
+        err = StringIO()
+        call_command('train_prescreen', stdout=StringIO(), stderr=err)
+
+        self.assertIn('not enough to train', err.getvalue())
+        self.assertFalse(PrescreenModel.objects.exists())
+        self.assertIsNone(load_prescreen())
+
+
+class GeographicExtractionTestCase(TestCase):
+    """Test gazetteer-based location extraction and diverse selection."""
+
+    def test_extracts_places_in_order_of_mention(self):
+        """Test longest matches, aliases, and cities standing in for their country."""
+        from content_pipeline.domain.services.geography import default_extractor
+
+        locations = default_extractor().extract(
+            'Scientists in Nairobi, Kenya teamed up with a lab in Papua New Guinea and the U.S. space agency.'
+        )
+
+        self.assertEqual(
+            [(loc.country, loc.continent, loc.city) for loc in locations],
+            [('Kenya', 'Africa', 'Nairobi'), ('Papua New Guinea', 'Oceania', None),
+             ('United States', 'North America', None)]
+        )
+
+    def test_ignores_lowercase_and_partial_words(self):
+        """Test that common words and word fragments are not taken for places."""
+        from content_pipeline.domain.services.geography import default_extractor
+
+        self.assertEqual(default_extractor().extract('The guinea pig ate turkey in Romanian-style china bowls.'), [])
+
+    def test_diverse_selection_round_robins_continents(self):
+        """Test that picks alternate between continents before repeating one."""
+        from content_pipeline.domain.entities import NewsEvent
+        from content_pipeline.domain.services.geography import select_geographically_diverse
+        from content_pipeline.domain.value_objects import GeographicLocation
+
+        def event(event_id, continent=None):
+            locations = [GeographicLocation(country='X', continent=continent)] if continent else []
+            return NewsEvent(id=event_id, title=event_id, raw_content='', source_url='https://example.com',
+                             published_at=datetime.now(), geographic_locations=locations)
+
+        events = [event('eu1', 'Europe'), event('eu2', 'Europe'), event('none'), event('eu3', 'Europe'),
+                  event('af1', 'Africa'), event('as1', 'Asia')]
+
+        selected = select_geographically_diverse(events, limit=5)
+
+        self.assertEqual([e.id for e in selected], ['eu1', 'af1', 'as1', 'eu2', 'eu3'])
+
+
+@pytest.mark.django_db
+class PromptCompactionTestCase(TestCase):
+    """Test compacting article text before it enters a Gemini prompt."""
+
+    def test_strips_boilerplate_and_repeated_sentences(self):
+        """Test that markup, truncation markers, boilerplate and repeats are dropped."""
+        from content_pipeline.domain.services.prompt_compaction import PromptCompactor
+
+        compactor = PromptCompactor()
+        content = ('<p>A baby otter learned to swim.</p> Advertisement. A baby otter learned to swim! '
+                   'Keepers cheered &amp; clapped. Read more at https://example.com/otter … [+2143 chars]')
+
+        compacted = compactor.compact(content, 'adapt_content_for_age')
+
+        self.assertEqual(compacted, 'A baby otter learned to swim. Keepers cheered & clapped.')
+        self.assertGreater(compactor.stats['tokens_saved'], 0)
+        self.assertEqual(compactor.stats['tokens_saved'], compactor.stats['adapt_content_for_age_tokens_saved'])
+
+    def test_truncates_to_task_budget_at_sentence_boundary(self):
+        """Test that text is cut to whole sentences within the task's budget."""
+        from content_pipeline.domain.services.prompt_compaction import PromptCompactor, estimate_tokens
+
+        sentences = [f'Sentence number {i} describes the rover.' for i in range(50)]
+        compactor = PromptCompactor(budgets={'generate_questions': 40})
+
+        compacted = compactor.compact(' '.join(sentences), 'generate_questions')
+
+        self.assertLessEqual(estimate_tokens(compacted), 40)
+        self.assertTrue(compacted.startswith(sentences[0]))
+        self.assertTrue(compacted.endswith('rover.'))
+
+        # A single sentence over budget is cut at a word boundary instead
+        truncated = compactor.compact('One enormously long sentence ' * 30, 'generate_questions')
+        self.assertTrue(truncated.startswith('One enormously long sentence'))
+        self.assertLessEqual(estimate_tokens(truncated), 40)
+
+    @patch('content_pipeline.infrastructure.adapters.gemini_api_adapter.requests.post')
+    def test_adapter_sends_compacted_content(self, mock_post):
+        """Test that the adapter prompts with compacted text rather than the raw article."""
+        from content_pipeline.infrastructure.adapters.gemini_api_adapter import GeminiApiAdapter
+
+        mock_post.return_value.json.return_value = {'candidates': [{'content': {'parts': [{'text': 'true'}]}}]}
+        adapter = GeminiApiAdapter(api_key='test-key')
+
+        self.assertTrue(adapter.filter_content_safety('Pandas play in snow. Pandas play in snow. [+900 chars]'))
+
+        prompt = mock_post.call_args.kwargs['json']['contents'][0]['parts'][0]['text']
+        self.assertTrue(prompt.endswith('Content: Pandas play in snow.'))
+        self.assertGreater(adapter.compactor.stats['filter_content_safety_tokens_saved'], 0)
+
+
+@pytest.mark.django_db
+class ModelRoutingTestCase(TestCase):
+    """Test routing each Gemini task to its own model and recording per-route stats."""
+
+    def _response(self, text):
+        response = MagicMock()
+        response.json.return_value = {'candidates': [{'content': {'parts': [{'text': text}]}}]}
+        return response
+
+    @patch('content_pipeline.infrastructure.adapters.gemini_api_adapter.requests.post')
+    def test_classification_and_writing_use_different_routes(self, mock_post):
+        """Test that categorization goes to the fast model with a tight output cap."""
+        from content_pipeline.infrastructure.adapters.gemini_api_adapter import GeminiApiAdapter
+        from content_pipeline.infrastructure.adapters.gemini_routing import DEFAULT_MODEL, FAST_MODEL
+
+        mock_post.side_effect = [self._response('SPACE_EARTH'), self._response('Once upon a comet...')]
+        adapter = GeminiApiAdapter(api_key='test-key')
+
+        adapter.categorize_content('Comet spotted', 'A comet was seen.')
+        adapter.adapt_content_for_age('A comet was seen.', '7-9')
+
+        (categorize_url,), categorize_kwargs = mock_post.call_args_list[0]
+        (adapt_url,), _ = mock_post.call_args_list[1]
+        self.assertIn(f'/{FAST_MODEL}:', categorize_url)
+        self.assertEqual(categorize_kwargs['json']['generationConfig'], {'maxOutputTokens': 16, 'temperature': 0.0})
+        self.assertIn(f'/{DEFAULT_MODEL}:', adapt_url)
+
+        snapshot = adapter.route_stats.snapshot()
+        self.assertEqual(snapshot['categorize_content']['calls'], 1)
+        self.assertEqual(snapshot['adapt_content_for_age']['output_chars'], len('Once upon a comet...'))
+
+    @patch('content_pipeline.infrastructure.adapters.gemini_api_adapter.requests.post')
+    def test_failures_are_recorded_per_route(self, mock_post):
+        """Test that failed calls count towards their route's failure rate."""
+        import requests
+        from content_pipeline.infrastructure.adapters.gemini_api_adapter import GeminiApiAdapter
+        from content_pipeline.infrastructure.adapters.gemini_routing import summarize
+
+        mock_post.side_effect = [requests.exceptions.Timeout('slow'), self._response('true')]
+        adapter = GeminiApiAdapter(api_key='test-key')
+
+        self.assertFalse(adapter.verify_fact('Owls can turn their heads.'))
+        self.assertTrue(adapter.verify_fact('Owls can turn their heads.'))
+
+        summary = summarize(adapter.route_stats.snapshot())
+        self.assertEqual(summary['verify_fact']['calls'], 2)
+        self.assertEqual(summary['verify_fact']['failure_rate'], 0.5)
+        self.assertEqual(summary['verify_fact']['mean_output_chars'], 4)
+
+    def test_overrides_keep_unset_fields(self):
+        """Test that a route override only replaces the fields it names."""
+        from content_pipeline.infrastructure.adapters.gemini_routing import DEFAULT_ROUTES, build_routes
+
+        routes = build_routes({'categorize_content': {'model': 'gemini-2.0-flash'}})
+
+        self.assertEqual(routes['categorize_content'].model, 'gemini-2.0-flash')
+        self.assertEqual(routes['categorize_content'].max_output_tokens,
+                         DEFAULT_ROUTES['categorize_content'].max_output_tokens)
+        self.assertEqual(routes['adapt_content_for_age'], DEFAULT_ROUTES['adapt_content_for_age'])
+
+
+@pytest.mark.django_db
+class CircuitBreakerTestCase(TestCase):
+    """Test failing fast on a degraded dependency and retrying the affected stages."""
+
+    def _breaker(self, **kwargs):
+        from content_pipeline.domain.services.circuit_breaker import CircuitBreaker
+
+        self.now = 0.0
+        return CircuitBreaker('test', clock=lambda: self.now, **kwargs)
+
+    def test_opens_after_threshold_then_half_opens(self):
+        """Test closed -> open -> half-open -> closed/open transitions."""
+        from content_pipeline.domain.services.circuit_breaker import CircuitOpenError
+
+        breaker = self._breaker(failure_threshold=2, reset_timeout=30)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, 'closed')
+        breaker.record_failure()
+        self.assertEqual(breaker.state, 'open')
+        with self.assertRaises(CircuitOpenError):
+            breaker.allow()
+
+        self.now = 30.0
+        breaker.allow()
+        # Only one trial call while half-open
+        with self.assertRaises(CircuitOpenError):
+            breaker.allow()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, 'open')
+
+        self.now = 60.0
+        breaker.allow()
+        breaker.record_success()
+        self.assertEqual(breaker.state, 'closed')
+
+    @patch('content_pipeline.infrastructure.adapters.pexels_adapter.requests.get')
+    def test_client_errors_do_not_trip_the_breaker(self, mock_get):
+        """Test that timeouts count against the breaker but a 404 does not."""
+        import requests
+        from content_pipeline.infrastructure.adapters.pexels_adapter import PexelsAdapter
+
+        not_found = MagicMock()
+        not_found.raise_for_status.side_effect = requests.exceptions.HTTPError(response=MagicMock(status_code=404))
+        mock_get.side_effect = [not_found, requests.exceptions.Timeout('slow'), requests.exceptions.Timeout('slow')]
+        adapter = PexelsAdapter(api_key='key', breaker=self._breaker(failure_threshold=2))
+
+        self.assertIsNone(adapter.search_photo('owls'))
+        self.assertEqual(adapter.breaker.state, 'closed')
+        adapter.search_photo('owls')
+        adapter.search_photo('owls')
+        self.assertEqual(adapter.breaker.state, 'open')
+
+    @patch('content_pipeline.infrastructure.adapters.gemini_api_adapter.requests.post')
+    def test_open_circuit_fails_stages_for_retry(self, mock_post):
+        """Test that an open Gemini circuit fails fast and leaves the event to be retried."""
+        from content_pipeline.application.use_cases.reprocess_events_use_case import ReprocessEventsUseCase
+        from content_pipeline.domain.entities import NewsEvent
+        from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+        from content_pipeline.infrastructure.adapters.gemini_api_adapter import GeminiApiAdapter
+        from content_pipeline.infrastructure.repositories.news_event_repository import DjangoNewsEventRepository
+        from content_pipeline.models import NewsEventModel
+        from django.utils import timezone
+        import uuid
+
+        breaker = self._breaker(failure_threshold=1)
+        breaker.record_failure()
+        gemini = GeminiApiAdapter(api_key='test-key', breaker=breaker)
+        repository = DjangoNewsEventRepository()
+        event_id = str(uuid.uuid4())
+        repository.save(NewsEvent(id=event_id, title='Bees dance', raw_content='Bees dance to talk.',
+                                  source_url='https://example.com/bees', published_at=timezone.now(),
+                                  processing_status='CATEGORIZED',
+                                  completed_stages={'categorize': ['ANIMALS_NATURE']}))
+        use_case = ReprocessEventsUseCase(
+            news_event_repository=repository,
+            content_processing_service=ContentProcessingService(gemini_api=gemini, image_generation=MagicMock()),
+            retry_delay_seconds=900,
+        )
+
+        results = use_case.run()
+
+        mock_post.assert_not_called()
+        self.assertEqual(results, {'processed': 0, 'failed': 1})
+        model = NewsEventModel.objects.get(id=event_id)
+        self.assertEqual(model.processing_status, 'CATEGORIZED')
+        self.assertEqual(set(model.completed_stages), {'categorize', 'locations'})
+        self.assertGreater(model.lease_expires_at, timezone.now())
+        (_, timings), = use_case.stage_timings
+        self.assertTrue(all('CircuitOpenError' in t.error for t in timings if t.outcome == 'failed'))
+
+
+@pytest.mark.django_db
+class LLMUsageTestCase(TestCase):
+    """Test capturing Gemini token usage per call, event and run."""
+
+    def _response(self, text, prompt_tokens, candidate_tokens):
+        response = MagicMock()
+        response.json.return_value = {
+            'candidates': [{'content': {'parts': [{'text': text}]}}],
+            'usageMetadata': {'promptTokenCount': prompt_tokens, 'candidatesTokenCount': candidate_tokens,
+                              'totalTokenCount': prompt_tokens + candidate_tokens},
+        }
+        return response
+
+    @patch('content_pipeline.infrastructure.adapters.gemini_api_adapter.requests.post')
+    def test_usage_is_attributed_to_task_and_event(self, mock_post):
+        """Test that calls made by stage threads are tagged with the event being processed."""
+        from content_pipeline.domain.services.content_processing_service import ContentProcessingService
+        from content_pipeline.domain.services.llm_usage import attribute_to_event
+        from content_pipeline.domain.entities import NewsEvent
+        from content_pipeline.infrastructure.adapters.gemini_api_adapter import GeminiApiAdapter
+
+        mock_post.side_effect = lambda *args, **kwargs: self._response('true', 1000, 10)
+        gemini = GeminiApiAdapter(api_key='test-key')
+        service = ContentProcessingService(gemini_api=gemini, image_generation=MagicMock())
+        event = NewsEvent(id='evt-1', title='Bees dance', raw_content='Bees dance to talk.',
+                          source_url='https://example.com/bees', published_at=datetime.now())
+
+        with attribute_to_event(event.id):
+            service.process_event(event)
+        gemini.verify_fact('Unattributed call')
+
+        usage = gemini.usage.snapshot()
+        calls = mock_post.call_count
+        self.assertEqual(usage['totals']['calls'], calls)
+        self.assertEqual(usage['by_event']['evt-1']['calls'], calls - 1)
+        self.assertEqual(usage['by_task']['categorize_content']['prompt_tokens'], 1000)
+        # gemini-2.0-flash-lite: $0.075 per million prompt tokens, $0.30 per million candidate tokens
+        self.assertAlmostEqual(usage['by_task']['categorize_content']['estimated_cost'], 0.000078)
+
+    def test_run_is_persisted_and_reported(self):
+        """Test that a run's merged usage is stored and shown by the llm_usage command."""
+        from io import StringIO
+        from django.core.management import call_command
+        from content_pipeline.domain.services.llm_usage import UsageLedger, merge_usage
+        from content_pipeline.models import LLMUsageRun
+        from content_pipeline.tasks import record_usage_run
+
+        chunks = [UsageLedger(), UsageLedger()]
+        chunks[0].record('adapt_content_for_age', 'gemini-2.0-flash', 2000, 500, event_id='evt-1')
+        chunks[1].record('categorize_content', 'gemini-2.0-flash-lite', 100, 2, event_id='evt-2')
+
+        record_usage_run('ingest-abc', 'ingest', merge_usage(*(chunk.snapshot() for chunk in chunks)))
+
+        run = LLMUsageRun.objects.get(run_id='ingest-abc')
+        self.assertEqual((run.calls, run.prompt_tokens, run.candidate_tokens), (2, 2100, 502))
+        out = StringIO()
+        call_command('llm_usage', run='ingest-abc', stdout=out)
+        self.assertIn('adapt_content_for_age', out.getvalue())
+        self.assertLess(out.getvalue().index('evt-1'), out.getvalue().index('evt-2'))
+
+
+@pytest.mark.django_db
+class PipelineRunTestCase(TestCase):
+    """Test persisted pipeline run records and the staff-only runs endpoint."""
+
+    def test_stage_latency_summary(self):
+        """Test per-stage percentiles, leaving skipped stages out of the latency."""
+        from content_pipeline.domain.services.stage_graph import StageTiming, summarize_stage_timings
+
+        timings = [StageTiming(stage='adapt', seconds=float(s), outcome='ok') for s in range(1, 21)]
+        timings += [StageTiming(stage='video', seconds=0.0, outcome='skipped'),
+                    StageTiming(stage='video', seconds=2.0, outcome='failed', error='Timeout')]
+
+        summary = summarize_stage_timings(timings)
+
+        self.assertEqual((summary['adapt']['p50_seconds'], summary['adapt']['p95_seconds']), (10.0, 19.0))
+        self.assertEqual(summary['video'], {'ok': 0, 'failed': 1, 'skipped': 1, 'p50_seconds': 2.0,
+                                            'p95_seconds': 2.0, 'max_seconds': 2.0})
+
+    def test_endpoint_is_staff_only(self):
+        """Test that runs are listed for staff and hidden from other users."""
+        from content_pipeline.infrastructure.repositories.pipeline_run_repository import DjangoPipelineRunRepository
+
+        runs = DjangoPipelineRunRepository()
+        runs.start_run('ingest-1', 'ingest')
+        runs.record_staging('ingest-1', {'fetched': 10, 'skipped_too_old': 2, 'staged': 8})
+        runs.finish_run('ingest-1', {'processed': 7, 'failed': 1}, {'adapt': {'p50_seconds': 1.5}})
+
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user(username='reader', password='pass12345'))
+        self.assertEqual(client.get('/api/content/pipeline-runs/').status_code, status.HTTP_403_FORBIDDEN)
+
+        client.force_authenticate(User.objects.create_user(username='staff', password='pass12345', is_staff=True))
+        response = client.get('/api/content/pipeline-runs/?kind=ingest')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        run, = response.data['results']
+        self.assertEqual((run['articles_fetched'], run['skipped_too_old'], run['events_processed']), (10, 2, 7))
+        self.assertEqual(run['status'], 'finished')
+        self.assertEqual(run['stage_latency']['adapt']['p50_seconds'], 1.5)
+        self.assertIsNotNone(run['processing_seconds'])
+
+
+@pytest.mark.django_db
+class BenchmarkHarnessTestCase(TestCase):
+    """Test the stand-in services and the offline pipeline benchmark."""
+
+    def test_profiles_and_seeded_draws(self):
+        """Test that per-task profiles build on their service and draws repeat for a seed."""
+        import random
+        from content_pipeline.infrastructure.adapters.stand_ins import build_profiles
+
+        profiles = build_profiles({'gemini.verify_fact': {'median_ms': 50}, 'gemini': {'error_rate': 0.5}})
+
+        self.assertEqual(profiles['gemini'].error_rate, 0.5)
+        self.assertEqual(profiles['gemini.verify_fact'].error_rate, 0.5)
+        self.assertEqual(profiles['gemini.verify_fact'].median_ms, 50)
+        draws = [profiles['gemini'].sample_latency_ms(random.Random(7)) for _ in range(2)]
+        self.assertEqual(draws[0], draws[1])
+
+    def test_stand_ins_answer_from_fixture(self):
+        """Test that the Gemini stand-in parses like the real adapter and records usage."""
+        from content_pipeline.infrastructure.adapters.stand_ins import (
+            StandInGeminiApi, StandInNewsAggregator, build_profiles, load_fixture,
+        )
+        from content_pipeline.domain.services.near_duplicate import simhash
+
+        fixture = load_fixture()
+        gemini = StandInGeminiApi(fixture, build_profiles({'gemini': {'error_rate': 0}}), time_scale=0)
+
+        self.assertIn(gemini.categorize_content('Title', 'Some content.'), fixture['responses']['categorize_content'])
+        self.assertEqual(len(gemini.generate_questions('Some content.')), 3)
+        self.assertEqual(set(gemini.suggest_search_terms('Title', 'Some content.')), {'youtube_query', 'image_query'})
+        self.assertEqual(gemini.usage.snapshot()['totals']['calls'], 3)
+
+        articles = StandInNewsAggregator(fixture, 20, time_scale=0).fetch_recent_news('q', datetime(2000, 1, 1).astimezone())
+        self.assertEqual(len({article.url for article in articles}), 20)
+        self.assertEqual(len({simhash(article.title, article.content) for article in articles}), 20)
+
+    def test_benchmark_command_reports_and_cleans_up(self):
+        """Test the benchmark's report and that its events are deleted afterwards."""
+        from io import StringIO
+        from django.core.management import call_command
+        from content_pipeline.models import NewsEventModel
+
+        out = StringIO()
+        with override_settings(DEBUG=True):
+            call_command('benchmark_pipeline', articles=5, time_scale=0, json=True,
+                         profile='{"gemini": {"error_rate": 0}}', stdout=out)
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['staging']['staged'], 5)
+        self.assertEqual(report['processing']['processed'], 5)
+        self.assertEqual(report['stages']['adapt']['ok'], 5)
+        self.assertGreater(report['queries']['processing'], 0)
+        self.assertGreater(report['articles_per_second'], 0)
+        self.assertFalse(NewsEventModel.objects.exists())
+
+    def test_benchmark_command_refuses_to_run_without_debug(self):
+        """Test that the benchmark does not write to a database that may be production's."""
+        from io import StringIO
+        from django.core.management import CommandError, call_command
+        from content_pipeline.models import NewsEventModel
+
+        with override_settings(DEBUG=False), self.assertRaises(CommandError):
+            call_command('benchmark_pipeline', articles=1, time_scale=0, stdout=StringIO())
+
+        self.assertFalse(NewsEventModel.objects.exists())
+
+    def test_stand_ins_are_left_out_of_metrics(self):
+        """Test that simulated calls do not count toward the production LLM metrics."""
+        from content_pipeline.infrastructure.adapters.stand_ins import (
+            StandInGeminiApi, StandInImageGeneration, build_profiles, load_fixture,
+        )
+
+        profiles = build_profiles({'gemini': {'error_rate': 0}, 'image_generation': {'error_rate': 0}})
+        gemini = StandInGeminiApi(load_fixture(), profiles, time_scale=0)
+        image_generation = StandInImageGeneration(profiles, time_scale=0)
+        with patch('content_pipeline.infrastructure.adapters.gemini_api_adapter.record_llm_call') as gemini_metrics, \
+                patch('content_pipeline.infrastructure.adapters.image_generation_adapter.record_llm_call') as image_metrics:
+            gemini.categorize_content('Title', 'Some content.')
+            result = image_generation.generate_image('A whale')
+
+        self.assertTrue(result['image_path'].startswith('benchmark/'))
+        self.assertEqual(result['metadata']['usage']['candidate_tokens'], 1290)
+        gemini_metrics.assert_not_called()
+        image_metrics.assert_not_called()
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -11,6 +11,7 @@ User = get_user_model()
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('detect_n_plus_one')
 class QuizTestCase(TestCase):
     """Test quiz functionality."""
 
@@ -194,6 +195,7 @@ class QuizTestCase(TestCase):
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('detect_n_plus_one')
 class QuestionTestCase(TestCase):
     """Test quiz questions."""
 
@@ -152,6 +152,7 @@ class UserProfileTestCase(TestCase):
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('detect_n_plus_one')
 class ReadingProgressTestCase(TestCase):
     """Test reading progress tracking."""
 
@@ -207,6 +208,7 @@ class ReadingProgressTestCase(TestCase):
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('detect_n_plus_one')
 class AchievementTestCase(TestCase):
     """Test achievement system."""
 
@@ -248,7 +250,33 @@ class AchievementTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+    def test_content_achievements_awarded_once(self):
+        """Test that content achievements are created and awarded without duplicates."""
+        from content_pipeline.models import NewsEventModel
+        from users.models import Achievement, ReadingProgress, UserAchievement
+        from users.services import AchievementService
+        events = [
+            NewsEventModel.objects.create(
+                title=f'Event {i}', raw_content='Test content', source_url=f'https://example.com/{i}',
+                processing_status='RAW', published_at=datetime.now()
+            )
+            for i in range(10)
+        ]
+        ReadingProgress.objects.bulk_create(
+            [ReadingProgress(user=self.user, news_event=event, completed=True) for event in events]
+        )
+        Achievement.objects.create(name='First Article', description='Existing')
+
+        AchievementService.award_content_achievement(self.user, 'article')
+        AchievementService.award_content_achievement(self.user, 'article')
+
+        awarded = UserAchievement.objects.filter(user=self.user).values_list('achievement__name', flat=True)
+        self.assertEqual(sorted(awarded), ['Curious Reader', 'First Article'])
+        self.assertEqual(Achievement.objects.get(name='First Article').description, 'Existing')
+
+
 @pytest.mark.django_db
+@pytest.mark.usefixtures('detect_n_plus_one')
 class ChildProfileTestCase(TestCase):
     """Test child profile management."""
 
@@ -308,5 +336,244 @@ class ChildProfileTestCase(TestCase):
         self.assertEqual(profile.age, 9)
 
 
+@pytest.mark.django_db
+class EmailOutboxTestCase(TestCase):
+    """Test the transactional email outbox."""
+
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='TestPass123!'
+        )
+
+    def test_password_reset_queues_email_instead_of_sending(self):
+        """Test that password reset writes to the outbox without touching SMTP."""
+        from django.core import mail
+        from users.models import OutboundEmail
+
+        response = self.client.post(
+            '/api/users/password-reset/',
+            data=json.dumps({'email': 'test@example.com'}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(mail.outbox), 0)
+        queued = OutboundEmail.objects.get(to_email='test@example.com')
+        self.assertEqual(queued.status, OutboundEmail.STATUS_PENDING)
+        self.assertIn('/reset-password/', queued.body)
+
+    def test_drain_sends_and_records_latency(self):
+        """Test that draining delivers queued emails and records latency."""
+        from django.core import mail
+        from users.email_outbox import queue_email, drain_outbox
+        from users.models import OutboundEmail
+
+        queue_email('Hello', 'Body', ['a@example.com', 'b@example.com'], drain=False)
+        results = drain_outbox()
+
+        self.assertEqual(results, {'sent': 2, 'failed': 0})
+        self.assertEqual(len(mail.outbox), 2)
+        for email in OutboundEmail.objects.all():
+            self.assertEqual(email.status, OutboundEmail.STATUS_SENT)
+            self.assertEqual(email.attempts, 1)
+            self.assertIsNotNone(email.delivery_latency_ms)
+
+    def test_failed_delivery_is_retried_with_backoff(self):
+        """Test that a failed send is rescheduled and eventually marked failed."""
+        from django.utils import timezone
+        from users import email_outbox
+        from users.models import OutboundEmail
+
+        email_outbox.queue_email('Hello', 'Body', ['a@example.com'], drain=False)
+
+        with patch('users.email_outbox.EmailMessage.send', side_effect=OSError('SMTP down')):
+            results = email_outbox.drain_outbox()
+
+        self.assertEqual(results, {'sent': 0, 'failed': 1})
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.status, OutboundEmail.STATUS_PENDING)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+        self.assertEqual(email.last_error, 'SMTP down')
+
+        # Not due yet, so a second drain does nothing
+        self.assertEqual(email_outbox.drain_outbox(), {'sent': 0, 'failed': 0})
+
+        email.attempts = email_outbox.MAX_ATTEMPTS - 1
+        email.next_attempt_at = timezone.now()
+        email.save()
+        with patch('users.email_outbox.EmailMessage.send', side_effect=OSError('SMTP down')):
+            email_outbox.drain_outbox()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.STATUS_FAILED)
+
+
+@pytest.mark.django_db
+class MaintenanceTestCase(TestCase):
+    """Test batched maintenance jobs."""
+
+    def test_delete_in_batches_removes_all_matching_rows(self):
+        """Test that batched deletion removes every matching row and nothing else."""
+        from users.maintenance import delete_in_batches
+        from users.models import Achievement
+
+        for i in range(7):
+            Achievement.objects.create(name=f'Old {i}', description='old')
+        Achievement.objects.create(name='Keep', description='keep')
+
+        deleted = delete_in_batches(
+            Achievement.objects.filter(description='old'), batch_size=3, sleep_seconds=0
+        )
+
+        self.assertEqual(deleted, 7)
+        self.assertEqual(list(Achievement.objects.values_list('name', flat=True)), ['Keep'])
+
+    def test_run_maintenance_purges_sessions_and_expired_tokens(self):
+        """Test that expired sessions and tokens are removed and reported."""
+        from datetime import timedelta
+        from django.contrib.sessions.models import Session
+        from django.utils import timezone
+        from users.authentication import TOKEN_EXPIRATION_DAYS
+        from users.maintenance import run_maintenance
+
+        now = timezone.now()
+        Session.objects.create(session_key='expired', session_data='', expire_date=now - timedelta(days=1))
+        Session.objects.create(session_key='active', session_data='', expire_date=now + timedelta(days=1))
+
+        old_user = User.objects.create_user(username='old', password='TestPass123!')
+        new_user = User.objects.create_user(username='new', password='TestPass123!')
+        old_token = Token.objects.create(user=old_user)
+        Token.objects.filter(pk=old_token.pk).update(
+            created=now - timedelta(days=TOKEN_EXPIRATION_DAYS + 1)
+        )
+        Token.objects.create(user=new_user)
+
+        report = run_maintenance(jobs=['sessions', 'expired_tokens'], sleep_seconds=0)
+
+        self.assertEqual(report['sessions']['deleted'], 1)
+        self.assertEqual(report['expired_tokens']['deleted'], 1)
+        self.assertIn('seconds', report['sessions'])
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['active'])
+        self.assertEqual(list(Token.objects.values_list('user__username', flat=True)), ['new'])
+
+    def test_purge_outbox_emails_removes_old_sent_and_failed_rows(self):
+        """Test that sent and failed emails past retention are purged, pending ones are kept."""
+        from datetime import timedelta
+        from django.utils import timezone
+        from users.maintenance import EMAIL_OUTBOX_RETENTION_DAYS, run_maintenance
+        from users.models import OutboundEmail
+
+        old = timezone.now() - timedelta(days=EMAIL_OUTBOX_RETENTION_DAYS + 1)
+        rows = {
+            'old-sent': (OutboundEmail.STATUS_SENT, old),
+            'old-failed': (OutboundEmail.STATUS_FAILED, old),
+            'old-pending': (OutboundEmail.STATUS_PENDING, None),
+            'new-failed': (OutboundEmail.STATUS_FAILED, None),
+        }
+        for subject, (status_value, sent_at) in rows.items():
+            email = OutboundEmail.objects.create(
+                subject=subject, body='reset link', from_email='a@example.com', to_email='b@example.com',
+                status=status_value, sent_at=sent_at,
+            )
+            if subject.startswith('old'):
+                OutboundEmail.objects.filter(pk=email.pk).update(created_at=old)
+
+        report = run_maintenance(jobs=['outbox_emails'], sleep_seconds=0)
+
+        self.assertEqual(report['outbox_emails']['deleted'], 2)
+        self.assertEqual(
+            sorted(OutboundEmail.objects.values_list('subject', flat=True)), ['new-failed', 'old-pending']
+        )
+
+    def test_purge_expired_cache_rows(self):
+        """Test that expired rows are removed from the database cache table."""
+        from datetime import timedelta
+        from django.core.management import call_command
+        from django.db import connection
+        from django.test import override_settings
+        from django.utils import timezone
+        from users.maintenance import purge_expired_cache_rows
+
+        caches = {'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'test_maintenance_cache',
+        }}
+        with override_settings(CACHES=caches):
+            call_command('createcachetable', verbosity=0)
+            now = timezone.now()
+            with connection.cursor() as cursor:
+                for i, expires in enumerate([now - timedelta(hours=1)] * 3 + [now + timedelta(hours=1)]):
+                    cursor.execute(
+                        "INSERT INTO test_maintenance_cache (cache_key, value, expires) VALUES (%s, %s, %s)",
+                        [f'key{i}', 'v', expires],
+                    )
+
+            deleted = purge_expired_cache_rows(batch_size=2, sleep_seconds=0)
+
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT cache_key FROM test_maintenance_cache")
+                remaining = [row[0] for row in cursor.fetchall()]
+
+        self.assertEqual(deleted, 3)
+        self.assertEqual(remaining, ['key3'])
+
+
+@pytest.mark.django_db
+class SeedScaleDataTestCase(TestCase):
+    """Test the synthetic capacity-testing dataset."""
+
+    def seed(self, *args):
+        from io import StringIO
+        from django.core.management import call_command
+
+        call_command('seed_scale_data', '--events=300', '--users=5', '--years=1', '--end=2025-06',
+                     '--batch-size=50', *args, stdout=StringIO())
+
+    def test_builds_linked_dataset_with_load_test_logins(self):
+        """Test that books, quizzes and activity reference seeded rows and users can log in."""
+        from book_assembly.models import MonthlyBookModel
+        from content_pipeline.models import NewsEventModel
+        from quizzes.models import Question, Quiz
+        from users.models import ReadingProgress, ReadingStreak
+
+        self.seed()
+
+        self.assertEqual(NewsEventModel.objects.count(), 300)
+        self.assertEqual(MonthlyBookModel.objects.count(), 12)
+        self.assertEqual(Quiz.objects.count(), 12)
+        self.assertEqual(Question.objects.count(), 60)
+        book = MonthlyBookModel.objects.get(year=2025, month=6)
+        self.assertEqual(book.status, MonthlyBookModel.STATUS_DRAFT)
+        self.assertTrue(book.daily_entries)
+        self.assertEqual(NewsEventModel.objects.filter(id__in=book.daily_entries).count(), len(book.daily_entries))
+        self.assertEqual(ReadingStreak.objects.count(), ReadingProgress.objects.values('user').distinct().count())
+        response = Client().post('/api/users/login/', {'username': 'loadtest_user_5', 'password': 'LoadTest123!'},
+                                 content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_same_seed_rebuilds_same_dataset(self):
+        """Test that --reset with the same seed reproduces the data and other seeds differ."""
+        from django.core.management.base import CommandError
+        from content_pipeline.models import NewsEventModel
+        from users.models import Bookmark
+
+        def snapshot():
+            return (list(NewsEventModel.objects.order_by('id').values_list('id', 'title', 'published_at')),
+                    sorted(Bookmark.objects.values_list('user__username', 'news_event_id')))
+
+        self.seed()
+        first = snapshot()
+        with self.assertRaises(CommandError):
+            self.seed()
+        self.seed('--reset')
+        self.assertEqual(snapshot(), first)
+        self.seed('--reset', '--seed=1')
+        self.assertNotEqual(snapshot()[0], first[0])
+        self.assertEqual(User.objects.filter(username__startswith='loadtest_user_').count(), 5)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
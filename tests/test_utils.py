@@ -2,6 +2,7 @@
 Tests for Utils module - Error Handling and Helper Functions.
 """
 import pytest
+from datetime import datetime
 from django.test import TestCase, RequestFactory
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
@@ -380,5 +381,105 @@ class HealthCheckTestCase(TestCase):
         self.assertIn('status', data)
 
 
+
+@pytest.mark.django_db
+class NPlusOneDetectorTestCase(TestCase):
+    """Test N+1 query detection."""
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        from content_pipeline.models import NewsEventModel
+        from rest_framework.authtoken.models import Token
+        from users.models import Bookmark
+
+        self.user = get_user_model().objects.create_user(username='reader', password='TestPass123!')
+        self.token = Token.objects.create(user=self.user)
+        for i in range(4):
+            event = NewsEventModel.objects.create(
+                title=f'Event {i}', raw_content='Content', source_url=f'https://example.com/{i}',
+                published_at=datetime.now(), processing_status='PROCESSED',
+            )
+            Bookmark.objects.create(user=self.user, news_event=event)
+
+    def test_fingerprint_collapses_in_lists(self):
+        """Test that IN lists of any length share a fingerprint."""
+        from bookofmonth_backend.query_inspection import fingerprint
+
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s, %s)'),
+            fingerprint('SELECT *\n FROM t WHERE id IN (%s)'),
+        )
+
+    def test_detects_lazy_related_loads(self):
+        """Test that a loop of lazy foreign key loads is reported with its relation."""
+        from bookofmonth_backend.query_inspection import NPlusOneDetector
+        from users.models import Bookmark
+
+        with NPlusOneDetector() as detector:
+            titles = [bookmark.news_event.title for bookmark in Bookmark.objects.all()]
+
+        self.assertEqual(len(titles), 4)
+        [detection] = detector.detections
+        self.assertEqual(detection.count, 4)
+        self.assertEqual(detection.lazy_load, 'Bookmark.news_event')
+        self.assertTrue(any('test_utils.py' in line for line in detection.stack))
+
+    def test_select_related_is_not_reported(self):
+        """Test that loading the relation up front is not reported."""
+        from bookofmonth_backend.query_inspection import NPlusOneDetector
+        from users.models import Bookmark
+
+        with NPlusOneDetector() as detector:
+            [bookmark.news_event.title for bookmark in Bookmark.objects.select_related('news_event')]
+
+        self.assertEqual(detector.detections, [])
+
+    def test_reports_originating_serializer_field(self):
+        """Test that the serializer field triggering the queries is named."""
+        from bookofmonth_backend.query_inspection import NPlusOneDetector
+        from users.models import Bookmark
+        from users.serializers import BookmarkSerializer
+
+        with NPlusOneDetector() as detector:
+            BookmarkSerializer(Bookmark.objects.all(), many=True).data
+
+        [detection] = detector.detections
+        self.assertEqual(detection.serializer_field, 'BookmarkSerializer.news_event')
+        self.assertIn('serializer field BookmarkSerializer.news_event', detection.describe())
+
+    def test_middleware_raises_in_raise_mode(self):
+        """Test that a request with N+1 queries fails when detection is set to raise."""
+        from django.test import override_settings
+        from rest_framework.test import APIClient
+        from bookofmonth_backend.query_inspection import NPlusOneError
+        from users.models import Bookmark
+        from users.views import BookmarkViewSet
+
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        with override_settings(N_PLUS_ONE_DETECTION='raise'):
+            self.assertEqual(client.get('/api/users/bookmarks/').status_code, status.HTTP_200_OK)
+            with patch.object(BookmarkViewSet, 'queryset', Bookmark.objects.all()):
+                with self.assertRaisesMessage(NPlusOneError, 'GET /api/users/bookmarks/'):
+                    client.get('/api/users/bookmarks/')
+
+    def test_middleware_logs_in_log_mode(self):
+        """Test that log mode reports N+1 queries without failing the request."""
+        from django.test import override_settings
+        from rest_framework.test import APIClient
+        from users.models import Bookmark
+        from users.views import BookmarkViewSet
+
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        with override_settings(N_PLUS_ONE_DETECTION='log'), \
+                patch.object(BookmarkViewSet, 'queryset', Bookmark.objects.all()), \
+                self.assertLogs('bookofmonth_backend.query_inspection', level='WARNING') as logs:
+            response = client.get('/api/users/bookmarks/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('lazy load of Bookmark.news_event', logs.output[0])
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
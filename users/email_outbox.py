@@ -0,0 +1,212 @@
+"""
+Transactional email outbox.
+
+Emails are written to the OutboundEmail table inside the caller's transaction
+and delivered later by a django-q drainer over a single pooled SMTP
+connection, so a slow mail server never adds latency to a request.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+# Configuration defaults
+BATCH_SIZE = getattr(settings, 'EMAIL_OUTBOX_BATCH_SIZE', 50)
+MAX_BATCHES_PER_RUN = getattr(settings, 'EMAIL_OUTBOX_MAX_BATCHES_PER_RUN', 20)
+MAX_ATTEMPTS = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+RETRY_BASE_SECONDS = getattr(settings, 'EMAIL_OUTBOX_RETRY_BASE_SECONDS', 60)
+RETRY_MAX_SECONDS = getattr(settings, 'EMAIL_OUTBOX_RETRY_MAX_SECONDS', 3600)
+CLAIM_TIMEOUT_SECONDS = getattr(settings, 'EMAIL_OUTBOX_CLAIM_TIMEOUT_SECONDS', 300)
+DRAIN_ON_COMMIT = getattr(settings, 'EMAIL_OUTBOX_DRAIN_ON_COMMIT', True)
+
+DRAIN_TASK = 'users.tasks.drain_email_outbox'
+
+
+def queue_email(subject, message, recipient_list, from_email=None, drain=True):
+    """
+    Queue an email for asynchronous delivery.
+
+    Mirrors the signature of django.core.mail.send_mail. One outbox row is
+    written per recipient in the current transaction.
+
+    Args:
+        subject: Email subject
+        message: Plain text body
+        recipient_list: List of recipient addresses
+        from_email: Sender address (defaults to DEFAULT_FROM_EMAIL)
+        drain: Whether to schedule a drain once the transaction commits
+
+    Returns:
+        list: The created OutboundEmail instances
+    """
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL
+    emails = OutboundEmail.objects.bulk_create([
+        OutboundEmail(subject=subject, body=message, from_email=from_email, to_email=recipient)
+        for recipient in recipient_list
+    ])
+
+    if drain:
+        request_drain()
+
+    return emails
+
+
+def request_drain():
+    """
+    Ask a django-q worker to drain the outbox once the current transaction commits.
+
+    The scheduled drainer picks up anything left behind if no worker is running.
+    """
+    if not DRAIN_ON_COMMIT:
+        return
+
+    def _enqueue():
+        try:
+            from django_q.tasks import async_task
+            async_task(DRAIN_TASK)
+        except Exception as e:
+            logger.warning("Could not enqueue outbox drain: %s", e)
+
+    transaction.on_commit(_enqueue)
+
+
+def get_retry_delay(attempts):
+    """
+    Exponential backoff delay for the given number of attempts.
+
+    Args:
+        attempts: Number of delivery attempts made so far
+
+    Returns:
+        timedelta: Delay before the next attempt
+    """
+    seconds = RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, RETRY_MAX_SECONDS))
+
+
+def claim_batch(batch_size=None):
+    """
+    Claim a batch of due emails.
+
+    Rows are locked with SKIP LOCKED so concurrent drainers never pick the
+    same message, then leased by pushing next_attempt_at forward. A drainer
+    that dies mid-batch therefore only delays its messages by the claim timeout.
+
+    Args:
+        batch_size: Maximum number of emails to claim
+
+    Returns:
+        list: Claimed OutboundEmail instances
+    """
+    batch_size = batch_size or BATCH_SIZE
+    now = timezone.now()
+
+    with transaction.atomic():
+        ids = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        OutboundEmail.objects.filter(id__in=ids).update(
+            attempts=F('attempts') + 1,
+            next_attempt_at=now + timedelta(seconds=CLAIM_TIMEOUT_SECONDS),
+        )
+
+    return list(OutboundEmail.objects.filter(id__in=ids).order_by('created_at'))
+
+
+def deliver(email, connection):
+    """
+    Send a single claimed email over an open connection and record the outcome.
+
+    Args:
+        email: A claimed OutboundEmail instance
+        connection: An open email backend connection
+
+    Returns:
+        bool: True if the message was handed to the mail server
+    """
+    started = time.monotonic()
+    message = EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email,
+        to=[email.to_email],
+        connection=connection,
+    )
+
+    try:
+        message.send()
+    except Exception as e:
+        email.last_error = str(e)
+        if email.attempts >= MAX_ATTEMPTS:
+            email.status = OutboundEmail.STATUS_FAILED
+            logger.error("Giving up on email %s to %s after %d attempts: %s",
+                         email.id, email.to_email, email.attempts, e)
+        else:
+            email.next_attempt_at = timezone.now() + get_retry_delay(email.attempts)
+            logger.warning("Email %s to %s failed (attempt %d), retrying at %s: %s",
+                           email.id, email.to_email, email.attempts, email.next_attempt_at, e)
+        email.save(update_fields=['status', 'last_error', 'next_attempt_at'])
+        return False
+
+    now = timezone.now()
+    email.status = OutboundEmail.STATUS_SENT
+    email.sent_at = now
+    email.last_error = ''
+    email.delivery_latency_ms = int((now - email.created_at).total_seconds() * 1000)
+    email.save(update_fields=['status', 'sent_at', 'last_error', 'delivery_latency_ms'])
+
+    logger.info("Email %s delivered to %s in %.0fms (%dms after queueing)",
+                email.id, email.to_email, (time.monotonic() - started) * 1000,
+                email.delivery_latency_ms)
+    return True
+
+
+def drain_outbox(batch_size=None, max_batches=None):
+    """
+    Deliver due emails in batches over one pooled connection.
+
+    Args:
+        batch_size: Emails claimed per batch
+        max_batches: Upper bound on batches per run
+
+    Returns:
+        dict: Counts of sent and failed deliveries
+    """
+    max_batches = max_batches or MAX_BATCHES_PER_RUN
+    results = {'sent': 0, 'failed': 0}
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        logger.error("Could not open email connection, leaving outbox untouched: %s", e)
+        return results
+
+    try:
+        for _ in range(max_batches):
+            batch = claim_batch(batch_size)
+            if not batch:
+                break
+            for email in batch:
+                if deliver(email, connection):
+                    results['sent'] += 1
+                else:
+                    results['failed'] += 1
+    finally:
+        connection.close()
+
+    return results
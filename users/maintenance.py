@@ -0,0 +1,176 @@
+"""
+Batched database maintenance jobs.
+
+Every job deletes in bounded primary-key batches with a short sleep between
+batches, so no single statement holds long locks or bloats WAL on Neon.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Configuration defaults
+BATCH_SIZE = getattr(settings, 'MAINTENANCE_BATCH_SIZE', 1000)
+BATCH_SLEEP_SECONDS = getattr(settings, 'MAINTENANCE_BATCH_SLEEP_SECONDS', 0.1)
+TASK_RESULT_RETENTION_DAYS = getattr(settings, 'TASK_RESULT_RETENTION_DAYS', 30)
+EMAIL_OUTBOX_RETENTION_DAYS = getattr(settings, 'EMAIL_OUTBOX_RETENTION_DAYS', 30)
+
+
+def delete_in_batches(queryset, batch_size=None, sleep_seconds=None):
+    """
+    Delete every row matched by a queryset in primary-key batches.
+
+    Args:
+        queryset: Rows to delete
+        batch_size: Maximum rows removed per DELETE statement
+        sleep_seconds: Pause between batches
+
+    Returns:
+        int: Number of rows deleted
+    """
+    batch_size = batch_size or BATCH_SIZE
+    sleep_seconds = BATCH_SLEEP_SECONDS if sleep_seconds is None else sleep_seconds
+    model = queryset.model
+    deleted = 0
+
+    while True:
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            break
+        deleted += model._base_manager.filter(pk__in=pks).delete()[0]
+        if len(pks) < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+
+    return deleted
+
+
+def purge_expired_sessions(**kwargs):
+    """Delete sessions whose expiry date has passed."""
+    from django.contrib.sessions.models import Session
+
+    return delete_in_batches(Session.objects.filter(expire_date__lt=timezone.now()), **kwargs)
+
+
+def purge_expired_tokens(**kwargs):
+    """Delete auth tokens older than TOKEN_EXPIRATION_DAYS."""
+    from rest_framework.authtoken.models import Token
+    from .authentication import TOKEN_EXPIRATION_DAYS
+
+    cutoff = timezone.now() - timedelta(days=TOKEN_EXPIRATION_DAYS)
+    return delete_in_batches(Token.objects.filter(created__lt=cutoff), **kwargs)
+
+
+def purge_task_results(**kwargs):
+    """Delete django-q task results older than TASK_RESULT_RETENTION_DAYS."""
+    from django_q.models import Task
+
+    cutoff = timezone.now() - timedelta(days=TASK_RESULT_RETENTION_DAYS)
+    return delete_in_batches(Task.objects.filter(stopped__lt=cutoff), **kwargs)
+
+
+def purge_outbox_emails(**kwargs):
+    """
+    Delete sent and failed outbox emails older than EMAIL_OUTBOX_RETENTION_DAYS.
+
+    Failed rows are purged too: their bodies can hold live password-reset links.
+    """
+    from .models import OutboundEmail
+
+    cutoff = timezone.now() - timedelta(days=EMAIL_OUTBOX_RETENTION_DAYS)
+    return delete_in_batches(
+        OutboundEmail.objects.filter(
+            Q(status=OutboundEmail.STATUS_SENT, sent_at__lt=cutoff)
+            | Q(status=OutboundEmail.STATUS_FAILED, created_at__lt=cutoff)
+        ),
+        **kwargs
+    )
+
+
+def get_cache_tables():
+    """Return the table names of all configured database cache backends."""
+    return [
+        config['LOCATION']
+        for config in settings.CACHES.values()
+        if config.get('BACKEND', '').endswith('DatabaseCache')
+    ]
+
+
+def purge_expired_cache_rows(batch_size=None, sleep_seconds=None):
+    """
+    Delete expired rows from every database cache table.
+
+    DatabaseCache only culls on writes once MAX_ENTRIES is reached, so
+    expired keys otherwise linger indefinitely.
+    """
+    batch_size = batch_size or BATCH_SIZE
+    sleep_seconds = BATCH_SLEEP_SECONDS if sleep_seconds is None else sleep_seconds
+    existing_tables = set(connection.introspection.table_names())
+    deleted = 0
+
+    for table in get_cache_tables():
+        if table not in existing_tables:
+            continue
+        quoted = connection.ops.quote_name(table)
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT cache_key FROM {quoted} WHERE expires < %s ORDER BY cache_key LIMIT %s",
+                    [timezone.now(), batch_size],
+                )
+                keys = [row[0] for row in cursor.fetchall()]
+                if not keys:
+                    break
+                placeholders = ', '.join(['%s'] * len(keys))
+                cursor.execute(f"DELETE FROM {quoted} WHERE cache_key IN ({placeholders})", keys)
+                deleted += cursor.rowcount
+            if len(keys) < batch_size:
+                break
+            if sleep_seconds:
+                time.sleep(sleep_seconds)
+
+    return deleted
+
+
+MAINTENANCE_JOBS = [
+    ('sessions', purge_expired_sessions),
+    ('expired_tokens', purge_expired_tokens),
+    ('cache_rows', purge_expired_cache_rows),
+    ('task_results', purge_task_results),
+    ('outbox_emails', purge_outbox_emails),
+]
+
+
+def run_maintenance(jobs=None, **kwargs):
+    """
+    Run maintenance jobs and report rows removed and time taken.
+
+    A failing job is logged and reported without stopping the others.
+
+    Args:
+        jobs: Optional list of job names to run (defaults to all)
+
+    Returns:
+        dict: Per-job report of {'deleted', 'seconds'} or {'error', 'seconds'}
+    """
+    report = {}
+    for name, job in MAINTENANCE_JOBS:
+        if jobs and name not in jobs:
+            continue
+        started = time.monotonic()
+        try:
+            deleted = job(**kwargs)
+            report[name] = {'deleted': deleted, 'seconds': round(time.monotonic() - started, 3)}
+            logger.info("Maintenance %s: removed %d rows in %.2fs",
+                        name, deleted, report[name]['seconds'])
+        except Exception as e:
+            report[name] = {'error': str(e), 'seconds': round(time.monotonic() - started, 3)}
+            logger.error("Maintenance %s failed: %s", name, e, exc_info=True)
+    return report
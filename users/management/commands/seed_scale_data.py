@@ -0,0 +1,363 @@
+import math
+import random
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+
+from book_assembly.models import MonthlyBookModel
+from content_pipeline.domain.entities import (
+    STATUS_ENRICHED, STATUS_PENDING_REPROCESS, STATUS_PROCESSED, STATUS_RAW, STATUS_REJECTED,
+)
+from content_pipeline.domain.value_objects import AgeRange, Category
+from content_pipeline.models import NewsEventModel
+from quizzes.models import Question, Quiz, QuizSubmission
+from users.maintenance import delete_in_batches
+from users.models import Bookmark, ReadingProgress, ReadingStreak
+
+# Seeded rows are recognised by these, so --reset never touches real data
+SEED_HOST = 'https://seed.invalid'
+USERNAME_PREFIX = 'loadtest_user_'
+# The password the load test users log in with (loadtests/locustfile.py)
+PASSWORD = 'LoadTest123!'
+QUESTIONS_PER_QUIZ = 5
+
+# Category popularity falls off roughly like a Zipf distribution
+CATEGORY_WEIGHTS = [(category, 1 / rank) for rank, category in enumerate(Category, start=1)]
+AGE_WEIGHTS = [(AgeRange.AGE_7_9, 0.55), (AgeRange.AGE_10_12, 0.3), (AgeRange.AGE_4_6, 0.15)]
+# Older events have long since finished processing
+SETTLED_STATUS_WEIGHTS = [(STATUS_PROCESSED, 0.93), (STATUS_REJECTED, 0.05), (STATUS_PENDING_REPROCESS, 0.02)]
+RECENT_STATUS_WEIGHTS = [(STATUS_PROCESSED, 0.6), (STATUS_RAW, 0.2), (STATUS_ENRICHED, 0.1), (STATUS_REJECTED, 0.1)]
+RECENT_DAYS = 2
+
+PLACES = [
+    ('Kenya', 'Africa', 'Nairobi'), ('Brazil', 'South America', 'Salvador'), ('Japan', 'Asia', 'Sapporo'),
+    ('India', 'Asia', 'Bengaluru'), ('Australia', 'Oceania', 'Cairns'), ('Canada', 'North America', 'Vancouver'),
+    ('United Kingdom', 'Europe', 'Oxford'), ('Egypt', 'Africa', 'Cairo'), ('Norway', 'Europe', 'Tromsø'),
+    ('Mexico', 'North America', 'Oaxaca'), ('Peru', 'South America', 'Cusco'), ('New Zealand', 'Oceania', 'Dunedin'),
+]
+SUBJECTS = ['sea turtles', 'a robot', 'young scientists', 'a giant telescope', 'honeybees', 'a solar car',
+            'an ancient shipwreck', 'snow leopards', 'a school choir', 'a new dinosaur', 'coral reefs',
+            'a mountain climber', 'a floating garden', 'comet hunters', 'an electric plane', 'orangutans']
+VERBS = ['surprise', 'amaze', 'break a record', 'make history', 'help a village', 'return home',
+         'win a prize', 'spark a discovery', 'light up the sky', 'set sail']
+OPENERS = ['Guess what?', 'Imagine this:', 'Wow!', 'Here is something amazing.', 'Did you know?']
+FILLER = ('Scientists and local families worked together for months. Everyone was excited to see the results. '
+          'Experts say there is still a lot more to learn. Children in the area helped by sharing what they saw.')
+
+
+def weighted_choice(rng, weighted):
+    values, weights = zip(*weighted)
+    return rng.choices(values, weights)[0]
+
+
+def seeded_uuid(seed, *parts):
+    """A UUID that only depends on the seed and the row it identifies."""
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"{SEED_HOST}/{seed}/" + '/'.join(str(p) for p in parts))
+
+
+def months_back(end_year, end_month, count):
+    """The `count` (year, month) pairs ending with the given month, oldest first."""
+    months = []
+    year, month = end_year, end_month
+    for _ in range(count):
+        months.append((year, month))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return months[::-1]
+
+
+def spread(total, weights):
+    """Split total into integer shares proportional to weights (largest remainder)."""
+    scale = total / sum(weights)
+    shares = [int(w * scale) for w in weights]
+    remainders = sorted(range(len(weights)), key=lambda i: shares[i] - weights[i] * scale)
+    for i in remainders[:total - sum(shares)]:
+        shares[i] += 1
+    return shares
+
+
+class Command(BaseCommand):
+    help = ('Generates a large, deterministic synthetic dataset for capacity testing: news events across years, '
+            'monthly books with quizzes, and load test users with bookmarks, reading progress, streaks and '
+            f'quiz submissions. Users are {USERNAME_PREFIX}1..N with password {PASSWORD}. Events are stored '
+            'without near-duplicate fingerprints; run backfill_simhash afterwards if they are needed.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--events',
+            type=int,
+            default=100_000,
+            help='Number of news events to generate.',
+        )
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=1_000,
+            help=f'Number of {USERNAME_PREFIX}N users to generate.',
+        )
+        parser.add_argument(
+            '--years',
+            type=int,
+            default=3,
+            help='Years of history, ending with --end.',
+        )
+        parser.add_argument(
+            '--end',
+            help='Last month of the dataset as YYYY-MM (defaults to the current month).',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed for every random choice; the same seed builds the same dataset.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5_000,
+            help='Rows per bulk insert.',
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Delete previously seeded data first.',
+        )
+
+    def handle(self, *args, **options):
+        if options['events'] < 1 or options['users'] < 1 or options['years'] < 1:
+            raise CommandError('--events, --users and --years must be at least 1')
+        try:
+            end = datetime.strptime(options['end'], '%Y-%m').date() if options['end'] else date.today()
+        except ValueError:
+            raise CommandError('--end must look like YYYY-MM')
+
+        self.seed = options['seed']
+        self.rng = random.Random(self.seed)
+        self.batch_size = options['batch_size']
+        self.months = months_back(end.year, end.month, options['years'] * 12)
+        # Exclusive end of the dataset: the first day after its last month
+        self.end = date(end.year + end.month // 12, end.month % 12 + 1, 1)
+
+        if options['reset']:
+            self._reset()
+        elif self._seeded_events().exists() or self._seeded_users().exists():
+            raise CommandError('Seeded data already exists; pass --reset to rebuild it.')
+
+        started = time.monotonic()
+        daily_entries = self._phase('events', self._create_events, options['events'])
+        quizzes = self._phase('books and quizzes', self._create_books, daily_entries)
+        user_ids = self._phase('users', self._create_users, options['users'])
+        self._phase('user activity', self._create_activity, user_ids, options['events'], quizzes)
+        self.stdout.write(self.style.SUCCESS(f"Seeded dataset in {time.monotonic() - started:.1f}s."))
+
+    def _phase(self, name, build, *args):
+        started = time.monotonic()
+        result = build(*args)
+        self.stdout.write(f"  {name}: {time.monotonic() - started:.1f}s")
+        return result
+
+    @staticmethod
+    def _seeded_events():
+        return NewsEventModel.objects.filter(source_url__startswith=f"{SEED_HOST}/")
+
+    @staticmethod
+    def _seeded_users():
+        return get_user_model().objects.filter(username__startswith=USERNAME_PREFIX)
+
+    def _reset(self):
+        # Leaves first, so deleting events and users cascades to little
+        deleted = 0
+        for queryset in (
+            Bookmark.objects.filter(news_event__source_url__startswith=f"{SEED_HOST}/"),
+            ReadingProgress.objects.filter(news_event__source_url__startswith=f"{SEED_HOST}/"),
+            MonthlyBookModel.objects.filter(cover_image_url__startswith=f"{SEED_HOST}/"),
+            self._seeded_users(),
+            self._seeded_events(),
+        ):
+            deleted += delete_in_batches(queryset, batch_size=self.batch_size, sleep_seconds=0)
+        self.stdout.write(f"Deleted {deleted} previously seeded rows.")
+
+    def _insert(self, model, rows, force=False):
+        """Bulk-insert and clear `rows` once a batch is full (or when forced)."""
+        if rows and (force or len(rows) >= self.batch_size):
+            model.objects.bulk_create(rows, batch_size=self.batch_size)
+            rows.clear()
+
+    # Events
+
+    def _create_events(self, total):
+        """Create `total` events in publication order; returns a day's lead event per (year, month)."""
+        first_day = date(*self.months[0], 1)
+        days = (self.end - first_day).days
+        # Volume grows over the years and dips at weekends
+        weights = [(1 + i / days) * (0.7 if (first_day + timedelta(i)).weekday() >= 5 else 1.0)
+                   for i in range(days)]
+
+        daily_entries = {}
+        rows, index = [], 0
+        for offset, count in enumerate(spread(total, weights)):
+            day = first_day + timedelta(offset)
+            recent = offset >= days - RECENT_DAYS
+            for position in range(count):
+                event = self._event(index, day, recent)
+                if position == 0 and event.processing_status == STATUS_PROCESSED:
+                    daily_entries.setdefault((day.year, day.month), []).append(str(event.id))
+                rows.append(event)
+                index += 1
+                self._insert(NewsEventModel, rows)
+        self._insert(NewsEventModel, rows, force=True)
+        return daily_entries
+
+    def _event(self, index, day, recent):
+        rng = self.rng
+        subject, verb = rng.choice(SUBJECTS), rng.choice(VERBS)
+        country, continent, city = rng.choice(PLACES)
+        title = f"{subject[0].upper()}{subject[1:]} {verb} in {city}"
+        # Publication times cluster around the middle of the (UTC) day
+        seconds = min(max(int(rng.gauss(14 * 3600, 4 * 3600)), 0), 86_399)
+        event = NewsEventModel(
+            id=seeded_uuid(self.seed, 'event', index),
+            title=title,
+            raw_content=f"In {city}, {country}, {subject} {verb}. {FILLER}",
+            source_url=f"{SEED_HOST}/news/{index}",
+            published_at=datetime.combine(day, dt_time(), timezone.utc) + timedelta(seconds=seconds),
+            processing_status=weighted_choice(rng, RECENT_STATUS_WEIGHTS if recent else SETTLED_STATUS_WEIGHTS),
+        )
+        if event.processing_status != STATUS_PROCESSED:
+            return event
+
+        category = weighted_choice(rng, CATEGORY_WEIGHTS)
+        event.categories = [category.name]
+        event.age_appropriateness = weighted_choice(rng, AGE_WEIGHTS).name
+        event.geographic_locations = [{'country': country, 'continent': continent, 'city': city}]
+        event.extracted_facts = [
+            {'content': f"{subject[0].upper()}{subject[1:]} {verb} in {city}.", 'source': event.source_url,
+             'verification_status': 'verified'},
+            {'content': f"{city} is in {country}.", 'source': event.source_url, 'verification_status': 'verified'},
+        ]
+        event.discussion_questions = [
+            f"Quiz: Where did {subject} {verb}? A) {city} B) Paris C) Lima D) Oslo",
+            f"Think About It: Why do you think {subject} {verb}?",
+            f"What Would You Do? If you visited {city}, what would you explore first?",
+        ]
+        event.fun_facts = [f"{category.value} stories are read by kids all over the world!"] * rng.randint(1, 3)
+        event.content_elements = [
+            {'type': 'paragraph', 'payload': {'text': f"{rng.choice(OPENERS)} In {city}, {subject} {verb}!"}},
+            {'type': 'paragraph', 'payload': {'text': FILLER}},
+        ]
+        event.is_verified = True
+        event.image_url = f"{SEED_HOST}/images/{index}.jpg"
+        if rng.random() < 0.6:
+            event.video_url = f"https://www.youtube.com/watch?v=seed{index:07d}"
+        return event
+
+    # Books and quizzes
+
+    def _create_books(self, daily_entries):
+        """Create a book and quiz for every month that has none; returns [(quiz id, (year, month))]."""
+        existing = set(MonthlyBookModel.objects.values_list('year', 'month'))
+        books, quizzes, questions = [], [], []
+        for year, month in self.months:
+            if (year, month) in existing:
+                continue
+            book = MonthlyBookModel(
+                id=seeded_uuid(self.seed, 'book', year, month),
+                year=year,
+                month=month,
+                title=f"{date(year, month, 1):%B %Y}: A World of Wonders",
+                cover_image_url=f"{SEED_HOST}/covers/{year}-{month:02d}.jpg",
+                daily_entries=daily_entries.get((year, month), []),
+                end_of_month_quiz=[self._question_dict() for _ in range(QUESTIONS_PER_QUIZ)],
+                parents_guide='Talk with your child about the places and discoveries in this month\'s stories.',
+                status=MonthlyBookModel.STATUS_DRAFT if (year, month) == self.months[-1]
+                else MonthlyBookModel.STATUS_FINAL,
+            )
+            quiz = Quiz(id=seeded_uuid(self.seed, 'quiz', year, month), monthly_book=book,
+                        title=f"{book.title} Quiz")
+            books.append(book)
+            quizzes.append(quiz)
+            for n, item in enumerate(book.end_of_month_quiz):
+                questions.append(Question(
+                    id=seeded_uuid(self.seed, 'question', year, month, n), quiz=quiz,
+                    text=item['question'], options=item['options'], correct_answer=item['answer'],
+                ))
+        MonthlyBookModel.objects.bulk_create(books, batch_size=self.batch_size)
+        Quiz.objects.bulk_create(quizzes, batch_size=self.batch_size)
+        Question.objects.bulk_create(questions, batch_size=self.batch_size)
+        return [(quiz.id, (quiz.monthly_book.year, quiz.monthly_book.month)) for quiz in quizzes]
+
+    def _question_dict(self):
+        country, _, city = self.rng.choice(PLACES)
+        others = [place[0] for place in self.rng.sample(PLACES, 4) if place[0] != country][:3]
+        return {
+            'question': f"Which country is {city} in?",
+            'options': [country, *others],
+            'answer': country,
+            'type': 'multiple_choice',
+        }
+
+    # Users and their activity
+
+    def _create_users(self, count):
+        """Create the load test users; returns their ids in username order."""
+        User = get_user_model()
+        # Hashing once keeps user creation fast; every user shares the password anyway
+        password = make_password(PASSWORD)
+        first_day = datetime.combine(date(*self.months[0], 1), dt_time(), timezone.utc)
+        span = datetime.combine(self.end, dt_time(), timezone.utc) - first_day
+        rows = []
+        for n in range(1, count + 1):
+            # Sign-ups accelerate over time
+            joined = first_day + span * math.sqrt(self.rng.random())
+            rows.append(User(username=f"{USERNAME_PREFIX}{n}", email=f"{USERNAME_PREFIX}{n}@seed.invalid",
+                             password=password, date_joined=joined))
+            self._insert(User, rows)
+        self._insert(User, rows, force=True)
+        ids = dict(self._seeded_users().values_list('username', 'id'))
+        return [ids[f"{USERNAME_PREFIX}{n}"] for n in range(1, count + 1)]
+
+    def _create_activity(self, user_ids, event_count, quizzes):
+        rng = self.rng
+        last_day = self.end - timedelta(days=1)
+        progress, bookmarks, streaks, submissions = [], [], [], []
+        for n, user_id in enumerate(user_ids, start=1):
+            # A few heavy readers, a long tail of light ones
+            activity = rng.lognormvariate(0, 1)
+            reads = min(int(activity * 20), event_count)
+            read = set()
+            while len(read) < reads:
+                # Most reading is of recent events
+                read.add(event_count - 1 - int(event_count * rng.random() ** 3))
+            for index in sorted(read):
+                event_id = seeded_uuid(self.seed, 'event', index)
+                progress.append(ReadingProgress(user_id=user_id, news_event_id=event_id,
+                                                completed=rng.random() < 0.7))
+                if rng.random() < 0.15:
+                    bookmarks.append(Bookmark(user_id=user_id, news_event_id=event_id))
+
+            if read:
+                current = int(rng.expovariate(1 / (activity * 3)))
+                streaks.append(ReadingStreak(
+                    user_id=user_id,
+                    current_streak=current,
+                    longest_streak=current + int(rng.expovariate(1 / (activity * 4))),
+                    last_read_date=last_day - timedelta(days=0 if current else int(rng.expovariate(1 / 10))),
+                ))
+
+            for quiz_id, month in quizzes:
+                if rng.random() < min(0.1 * activity, 0.6):
+                    submissions.append(QuizSubmission(
+                        id=seeded_uuid(self.seed, 'submission', n, *month), user_id=user_id, quiz_id=quiz_id,
+                        score=sum(rng.random() < 0.7 for _ in range(QUESTIONS_PER_QUIZ)),
+                        total_questions=QUESTIONS_PER_QUIZ,
+                    ))
+
+            for model, rows in ((ReadingProgress, progress), (Bookmark, bookmarks),
+                                (ReadingStreak, streaks), (QuizSubmission, submissions)):
+                self._insert(model, rows)
+        for model, rows in ((ReadingProgress, progress), (Bookmark, bookmarks),
+                            (ReadingStreak, streaks), (QuizSubmission, submissions)):
+            self._insert(model, rows, force=True)
@@ -24,19 +24,37 @@ class Command(BaseCommand):
                 'cron': '0 18 * * *',  # 6 PM UTC daily
             },
             {
-                'name': 'cleanup-old-sessions',
-                'func': 'users.tasks.cleanup_old_sessions',
+                'name': 'run-maintenance',
+                'func': 'users.tasks.run_maintenance',
                 'schedule_type': Schedule.CRON,
-                'cron': '0 3 * * 0',  # 3 AM UTC on Sundays
+                'cron': '0 3 * * *',  # 3 AM UTC daily
+            },
+            {
+                'name': 'drain-email-outbox',
+                'func': 'users.tasks.drain_email_outbox',
+                'schedule_type': Schedule.CRON,
+                'cron': '*/5 * * * *',  # Every 5 minutes (picks up anything not drained on commit)
+            },
+            {
+                'name': 'reprocess-events',
+                'func': 'content_pipeline.tasks.reprocess_events',
+                'schedule_type': Schedule.CRON,
+                'cron': '*/30 * * * *',  # Every 30 minutes (retries interrupted or failed stages)
             },
             {
                 'name': 'generate-monthly-book',
                 'func': 'users.tasks.generate_monthly_book',
                 'schedule_type': Schedule.CRON,
-                'cron': '0 0 1 * *',  # Midnight UTC on 1st of each month
+                'cron': '0 7 1 * *',  # 7 AM UTC on the 1st, after the last day's ingestion
             },
         ]
 
+        # Schedules superseded by newer tasks
+        retired = ['cleanup-old-sessions']
+        removed, _ = Schedule.objects.filter(name__in=retired).delete()
+        if removed:
+            self.stdout.write(self.style.WARNING(f'Removed retired schedules: {", ".join(retired)}'))
+
         for sched in schedules:
             obj, created = Schedule.objects.update_or_create(
                 name=sched['name'],
@@ -61,20 +61,14 @@ class AchievementService:
             'Super Reader': 100
         }
         
-        for achievement_name, required_days in achievement_criteria.items():
-            if streak.current_streak >= required_days:
-                achievement, created = Achievement.objects.get_or_create(
-                    name=achievement_name,
-                    defaults={
-                        'description': f'Read for {required_days} consecutive days!',
-                        'image_url': f'/images/achievements/streak_{required_days}.png'
-                    }
-                )
-                
-                UserAchievement.objects.get_or_create(
-                    user=user,
-                    achievement=achievement
-                )
+        AchievementService._award_achievements(user, {
+            achievement_name: {
+                'description': f'Read for {required_days} consecutive days!',
+                'image_url': f'/images/achievements/streak_{required_days}.png'
+            }
+            for achievement_name, required_days in achievement_criteria.items()
+            if streak.current_streak >= required_days
+        })
     
     @staticmethod
     def award_content_achievement(user, content_type):
@@ -94,20 +88,37 @@ class AchievementService:
             'Legendary Reader': 1000
         }
         
-        for achievement_name, required_count in achievement_criteria.items():
-            if completed_count >= required_count:
-                achievement, created = Achievement.objects.get_or_create(
-                    name=achievement_name,
-                    defaults={
-                        'description': f'Read {required_count} articles!',
-                        'image_url': f'/images/achievements/content_{required_count}.png'
-                    }
-                )
-                
-                UserAchievement.objects.get_or_create(
-                    user=user,
-                    achievement=achievement
-                )
+        AchievementService._award_achievements(user, {
+            achievement_name: {
+                'description': f'Read {required_count} articles!',
+                'image_url': f'/images/achievements/content_{required_count}.png'
+            }
+            for achievement_name, required_count in achievement_criteria.items()
+            if completed_count >= required_count
+        })
+
+    @staticmethod
+    def _award_achievements(user, earned):
+        """Award earned achievements (name -> creation defaults) with a fixed number of queries."""
+        if not earned:
+            return
+        achievements = Achievement.objects.filter(name__in=earned)
+        missing = set(earned) - {achievement.name for achievement in achievements}
+        if missing:
+            Achievement.objects.bulk_create(
+                [Achievement(name=name, **earned[name]) for name in missing], ignore_conflicts=True
+            )
+            achievements = Achievement.objects.filter(name__in=earned)
+
+        owned = set(
+            UserAchievement.objects.filter(user=user, achievement__in=achievements)
+            .values_list('achievement_id', flat=True)
+        )
+        UserAchievement.objects.bulk_create(
+            [UserAchievement(user=user, achievement=achievement)
+             for achievement in achievements if achievement.id not in owned],
+            ignore_conflicts=True,
+        )
     
     @staticmethod
     def mark_content_complete(user, news_event):
@@ -5,10 +5,10 @@
 # or configure schedules via Q_CLUSTER settings or Django admin.
 
 import logging
-from django.core.mail import send_mail
-from django.conf import settings
 from django.contrib.auth import get_user_model
 
+from .email_outbox import queue_email, request_drain, drain_outbox
+
 logger = logging.getLogger(__name__)
 
 User = get_user_model()
@@ -35,30 +35,29 @@ Best regards,
 The Book of the Month Team
     """
 
-    send_mail(
+    queue_email(
         subject=subject,
         message=message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[user.email],
-        fail_silently=False,
     )
 
-    logger.info("Welcome email sent to %s", user.email)
-    return f"Welcome email sent to {user.email}"
+    logger.info("Welcome email queued for %s", user.email)
+    return f"Welcome email queued for {user.email}"
 
 
 def process_daily_content():
-    """Process and ingest daily news content."""
-    from django.core.management import call_command
+    """Fetch daily news and fan article processing out across the cluster."""
+    from content_pipeline.tasks import ingest_daily_news
 
-    call_command('ingest_news', query='world news for children', days_ago=1)
-    logger.info("Daily content ingestion completed")
-    return "Daily content ingestion completed"
+    result = ingest_daily_news(days_ago=1)
+    logger.info("Daily content ingestion: %s", result)
+    return result
 
 
 def generate_monthly_book(year=None, month=None):
-    """Generate monthly book and associated content."""
+    """Finalize the monthly book (defaults to the previous month)."""
     from datetime import datetime
+    from book_assembly.tasks import finalize_book
 
     if year is None or month is None:
         today = datetime.now()
@@ -69,22 +68,34 @@ def generate_monthly_book(year=None, month=None):
             year = today.year
             month = today.month - 1
 
-    logger.info("Book generation initiated for %d/%d", month, year)
-    return f"Book generation initiated for {month}/{year}"
+    return finalize_book(year, month)
 
 
 def cleanup_old_sessions():
-    """Clean up expired sessions and temporary data."""
-    from django.contrib.sessions.models import Session
-    from datetime import datetime, timedelta
+    """Clean up expired sessions in bounded batches."""
+    from .maintenance import purge_expired_sessions
 
-    cutoff_date = datetime.now() - timedelta(days=30)
-    deleted_count = Session.objects.filter(expire_date__lt=cutoff_date).delete()[0]
+    deleted_count = purge_expired_sessions()
 
     logger.info("Cleaned up %d old sessions", deleted_count)
     return f"Cleaned up {deleted_count} old sessions"
 
 
+def run_maintenance():
+    """Purge expired sessions, tokens, cache rows, task results and sent or failed outbox emails."""
+    from .maintenance import run_maintenance as run_maintenance_jobs
+
+    report = run_maintenance_jobs()
+    summary = ", ".join(
+        f"{name}: {result['deleted']} rows in {result['seconds']}s" if 'deleted' in result
+        else f"{name}: failed ({result['error']})"
+        for name, result in report.items()
+    )
+
+    logger.info("Maintenance completed - %s", summary)
+    return f"Maintenance completed - {summary}"
+
+
 def update_user_achievements_batch(user_ids):
     """Update achievements for a batch of users."""
     from .services import AchievementService
@@ -131,14 +142,24 @@ Happy reading!
 The Book of the Month Team
             """
 
-            send_mail(
+            queue_email(
                 subject=subject,
                 message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
                 recipient_list=[user.email],
-                fail_silently=True,
+                drain=False,
             )
             emails_sent += 1
 
-    logger.info("Reading reminders sent to %d users", emails_sent)
-    return f"Reading reminders sent to {emails_sent} users"
+    if emails_sent:
+        request_drain()
+
+    logger.info("Reading reminders queued for %d users", emails_sent)
+    return f"Reading reminders queued for {emails_sent} users"
+
+
+def drain_email_outbox():
+    """Deliver queued outbound emails over a pooled SMTP connection."""
+    results = drain_outbox()
+
+    logger.info("Email outbox drained: %d sent, %d failed", results['sent'], results['failed'])
+    return f"Email outbox drained: {results['sent']} sent, {results['failed']} failed"
@@ -6,12 +6,11 @@ from rest_framework.views import APIView
 from rest_framework.throttling import AnonRateThrottle
 from django.contrib.auth import authenticate
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
-from django.conf import settings
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from .models import CustomUser, Bookmark, ReadingProgress, ChildProfile, ReadingStreak, Achievement, UserAchievement
 from .services import AchievementService
+from .email_outbox import queue_email
 from .serializers import (
     UserSerializer, BookmarkSerializer, ReadingProgressSerializer,
     ChildProfileSerializer, ReadingStreakSerializer, AchievementSerializer,
@@ -184,7 +183,7 @@ class UserViewSet(viewsets.ModelViewSet):
 
 
 class BookmarkViewSet(viewsets.ModelViewSet):
-    queryset = Bookmark.objects.all()
+    queryset = Bookmark.objects.select_related('news_event')
     serializer_class = BookmarkSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -225,7 +224,7 @@ class BookmarkViewSet(viewsets.ModelViewSet):
 
 
 class ReadingProgressViewSet(viewsets.ModelViewSet):
-    queryset = ReadingProgress.objects.all()
+    queryset = ReadingProgress.objects.select_related('news_event')
     serializer_class = ReadingProgressSerializer
     permission_classes = [permissions.IsAuthenticated]
     filterset_fields = ['news_event', 'completed']
@@ -345,7 +344,7 @@ class AchievementViewSet(viewsets.ReadOnlyModelViewSet):
 
 
 class UserAchievementViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = UserAchievement.objects.all()
+    queryset = UserAchievement.objects.select_related('achievement')
     serializer_class = UserAchievementSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -370,7 +369,7 @@ class PasswordResetRequestView(APIView):
 
         reset_url = f"{request.build_absolute_uri('/').rstrip('/')}/reset-password/{uid}/{token}/"
 
-        send_mail(
+        queue_email(
             subject='Password Reset Request - Book of the Month',
             message=f'''
 Hi {user.username},
@@ -385,9 +384,7 @@ If you didn't request this, please ignore this email.
 Best regards,
 The Book of the Month Team
             ''',
-            from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[email],
-            fail_silently=False,
         )
 
         return Response({